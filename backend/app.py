@@ -1,125 +1,229 @@
-# app.py - Aplicación Flask Principal
-from flask import Flask, jsonify, request
-from flask_cors import CORS
-from flask_socketio import SocketIO, emit
-import os
-from datetime import datetime
-import logging
-
-# Imports locales
-from config import Config
-from database.connection import db, init_db
-from api.products import products_bp
-from api.orders import orders_bp
-from api.predictions import predictions_bp
-from api.clustering import clustering_bp
-from api.inventory import inventory_bp
-
-def create_app(config_class=Config):
-    app = Flask(__name__)
-    app.config.from_object(config_class)
-    
-    # Configurar CORS
-    CORS(app, origins=["http://localhost:5173"])
-    
-    # Configurar SocketIO para tiempo real
-    socketio = SocketIO(app, cors_allowed_origins="http://localhost:5173")
-    
-    # Configurar logging
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
-    
-    # Inicializar base de datos
-    init_db(app)
-    
-    # Registrar blueprints
-    app.register_blueprint(products_bp, url_prefix='/api/products')
-    app.register_blueprint(orders_bp, url_prefix='/api/orders')
-    app.register_blueprint(predictions_bp, url_prefix='/api/predictions')
-    app.register_blueprint(clustering_bp, url_prefix='/api/clustering')
-    app.register_blueprint(inventory_bp, url_prefix='/api/inventory')
-    
-    # Rutas principales
-    @app.route('/')
-    def index():
-        return jsonify({
-            "message": "CocoPet ML API",
-            "version": "1.0.0",
-            "status": "active",
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    @app.route('/api/health')
-    def health_check():
-        return jsonify({
-            "status": "healthy",
-            "database": "connected",
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    # WebSocket events para notificaciones en tiempo real
-    @socketio.on('connect')
-    def handle_connect():
-        logger.info('Cliente conectado')
-        emit('status', {'msg': 'Conectado al servidor CocoPet ML'})
-    
-    @socketio.on('disconnect')
-    def handle_disconnect():
-        logger.info('Cliente desconectado')
-    
-    # Función para enviar alertas de stock bajo
-    def send_stock_alert(product_name, current_stock, min_stock):
-        socketio.emit('stock_alert', {
-            'product': product_name,
-            'current_stock': current_stock,
-            'min_stock': min_stock,
-            'timestamp': datetime.now().isoformat()
-        })
-    
-    # Función para enviar actualizaciones de predicciones
-    def send_prediction_update(prediction_type, data):
-        socketio.emit('prediction_update', {
-            'type': prediction_type,
-            'data': data,
-            'timestamp': datetime.now().isoformat()
-        })
-    
-    # Manejo de errores
-    @app.errorhandler(404)
-    def not_found(error):
-        return jsonify({'error': 'Endpoint no encontrado'}), 404
-    
-    @app.errorhandler(500)
-    def internal_error(error):
-        return jsonify({'error': 'Error interno del servidor'}), 500
-    
-    @app.errorhandler(400)
-    def bad_request(error):
-        return jsonify({'error': 'Solicitud mal formada'}), 400
-    
-    # Middleware para logging de requests
-    @app.before_request
-    def log_request_info():
-        logger.info(f'{request.method} {request.url} - {request.remote_addr}')
-    
-    # Almacenar instancias para uso en otros módulos
-    app.socketio = socketio
-    app.send_stock_alert = send_stock_alert
-    app.send_prediction_update = send_prediction_update
-    
-    return app, socketio
-
-if __name__ == '__main__':
-    app, socketio = create_app()
-    
-    # Crear tablas si no existen
-    with app.app_context():
-        db.create_all()
-        print("✅ Base de datos inicializada")
-    
-    print("🚀 Iniciando servidor CocoPet ML...")
-    print("📱 API disponible en: http://localhost:5000")
-    print("📊 Dashboard en: http://localhost:5173")
-    
-    # Ejecutar servidor con SocketIO
+# app.py - Aplicación Flask Principal
+from flask import Flask, jsonify, request
+from flask_cors import CORS
+from flask_socketio import SocketIO, emit
+import os
+import atexit
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Imports locales
+from config import Config
+from database.connection import db, init_db
+from api.products import products_bp
+from api.orders import orders_bp
+from api.predictions import predictions_bp
+from api.clustering import clustering_bp
+from api.inventory import inventory_bp
+from utils.json_provider import AppJSONProvider
+
+# Intervalo (segundos) para agrupar alertas de stock antes de emitirlas
+STOCK_ALERT_FLUSH_INTERVAL = 0.1
+
+# Resultado cacheado del último chequeo de base de datos: (timestamp monotónico, ok)
+DB_PROBE_TTL = 1.0
+_last_db_probe = (float('-inf'), False)
+
+def _probe_database():
+    """Verificar conexión a la base de datos (resultado cacheado durante DB_PROBE_TTL)"""
+    global _last_db_probe
+    
+    checked_at, ok = _last_db_probe
+    now = time.monotonic()
+    if now - checked_at < DB_PROBE_TTL:
+        return ok
+    
+    try:
+        db.session.execute(db.text('SELECT 1')).scalar()
+        ok = True
+    except Exception as e:
+        db.session.rollback()
+        logging.getLogger(__name__).error(f"Error verificando base de datos: {e}")
+        ok = False
+    
+    _last_db_probe = (now, ok)
+    return ok
+
+# Listener que escribe los logs en un hilo aparte (uno por proceso)
+_log_listener = None
+
+def _configure_logging(app):
+    """Enviar logs a una cola; un hilo de fondo los escribe a consola y archivo"""
+    global _log_listener
+    
+    root = logging.getLogger()
+    root.setLevel(app.config.get('LOG_LEVEL', 'INFO'))
+    
+    if _log_listener is not None:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.StreamHandler()]
+    
+    log_file = app.config.get('LOG_FILE')
+    if log_file:
+        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        handlers.append(RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5))
+    
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+def create_app(config_class=Config):
+    app = Flask(__name__)
+    app.config.from_object(config_class)
+    
+    # JSON de respuestas: orjson (si está instalado) serializa los DTOs directamente
+    app.json = AppJSONProvider(app)
+    
+    # Configurar CORS
+    CORS(app, origins=["http://localhost:5173"])
+    
+    # Configurar SocketIO para tiempo real
+    socketio = SocketIO(
+        app,
+        cors_allowed_origins="http://localhost:5173",
+        async_mode=app.config.get('SOCKETIO_ASYNC_MODE'),
+        message_queue=app.config.get('SOCKETIO_MESSAGE_QUEUE'),
+        channel=app.config.get('SOCKETIO_CHANNEL', 'flask-socketio')
+    )
+    
+    # Configurar logging (escritura asíncrona vía QueueHandler)
+    _configure_logging(app)
+    logger = logging.getLogger(__name__)
+    
+    # Inicializar base de datos
+    init_db(app)
+    
+    # Registrar blueprints
+    app.register_blueprint(products_bp, url_prefix='/api/products')
+    app.register_blueprint(orders_bp, url_prefix='/api/orders')
+    app.register_blueprint(predictions_bp, url_prefix='/api/predictions')
+    app.register_blueprint(clustering_bp, url_prefix='/api/clustering')
+    app.register_blueprint(inventory_bp, url_prefix='/api/inventory')
+    
+    # Rutas principales
+    @app.route('/')
+    def index():
+        return jsonify({
+            "message": "CocoPet ML API",
+            "version": "1.0.0",
+            "status": "active",
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    @app.route('/api/health')
+    def health_check():
+        db_ok = _probe_database()
+        return jsonify({
+            "status": "healthy" if db_ok else "unhealthy",
+            "database": "connected" if db_ok else "disconnected",
+            "timestamp": datetime.now().isoformat()
+        }), 200 if db_ok else 503
+    
+    # WebSocket events para notificaciones en tiempo real
+    @socketio.on('connect')
+    def handle_connect():
+        logger.info('Cliente conectado')
+        emit('status', {'msg': 'Conectado al servidor CocoPet ML'})
+    
+    @socketio.on('disconnect')
+    def handle_disconnect():
+        logger.info('Cliente desconectado')
+    
+    # Alertas de stock pendientes; se agrupan y se emiten en un solo mensaje
+    pending_stock_alerts = deque()
+    stock_alerts_lock = threading.Lock()
+    stock_alerts_timer = None
+    
+    # Función para enviar varias alertas de stock bajo en un solo emit
+    def send_stock_alerts(items):
+        if not items:
+            return
+        socketio.emit('stock_alert_batch', {
+            'type': 'stock_alert_batch',
+            'items': items,
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    def flush_stock_alerts():
+        nonlocal stock_alerts_timer
+        with stock_alerts_lock:
+            items = list(pending_stock_alerts)
+            pending_stock_alerts.clear()
+            stock_alerts_timer = None
+        send_stock_alerts(items)
+    
+    # Función para enviar alertas de stock bajo (se encolan y se envían agrupadas)
+    def send_stock_alert(product_name, current_stock, min_stock):
+        nonlocal stock_alerts_timer
+        with stock_alerts_lock:
+            pending_stock_alerts.append({
+                'product': product_name,
+                'current_stock': current_stock,
+                'min_stock': min_stock
+            })
+            if stock_alerts_timer is None:
+                stock_alerts_timer = threading.Timer(STOCK_ALERT_FLUSH_INTERVAL, flush_stock_alerts)
+                stock_alerts_timer.daemon = True
+                stock_alerts_timer.start()
+    
+    # Función para enviar actualizaciones de predicciones
+    def send_prediction_update(prediction_type, data):
+        socketio.emit('prediction_update', {
+            'type': prediction_type,
+            'data': data,
+            'timestamp': datetime.now().isoformat()
+        })
+    
+    # Manejo de errores
+    @app.errorhandler(404)
+    def not_found(error):
+        return jsonify({'error': 'Endpoint no encontrado'}), 404
+    
+    @app.errorhandler(500)
+    def internal_error(error):
+        return jsonify({'error': 'Error interno del servidor'}), 500
+    
+    @app.errorhandler(400)
+    def bad_request(error):
+        return jsonify({'error': 'Solicitud mal formada'}), 400
+    
+    # Middleware para logging de requests
+    @app.before_request
+    def log_request_info():
+        logger.info('%s %s - %s', request.method, request.path, request.remote_addr)
+    
+    # Almacenar instancias para uso en otros módulos
+    app.socketio = socketio
+    app.send_stock_alert = send_stock_alert
+    app.send_stock_alerts = send_stock_alerts
+    app.send_prediction_update = send_prediction_update
+    
+    return app, socketio
+
+if __name__ == '__main__':
+    app, socketio = create_app()
+    
+    # Crear tablas si no existen
+    with app.app_context():
+        db.create_all()
+        print("✅ Base de datos inicializada")
+    
+    print("🚀 Iniciando servidor CocoPet ML...")
+    print("📱 API disponible en: http://localhost:5000")
+    print("📊 Dashboard en: http://localhost:5173")
+    
+    # Ejecutar servidor con SocketIO
     socketio.run(app, debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,134 @@
+# database/dtos.py - Objetos ligeros para serialización de respuestas
+from dataclasses import dataclass
+from typing import Optional
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+@dataclass(slots=True, frozen=True)
+class ProductDTO:
+    """Producto serializable (mismas claves que Product.to_dict)"""
+    id: int
+    name: str
+    brand: str
+    category: str
+    weight_size: Optional[str]
+    price: float
+    cost: Optional[float]
+    current_stock: int
+    min_stock: int
+    max_stock: int
+    reorder_point: int
+    sku: Optional[str]
+    description: Optional[str]
+    is_active: bool
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+    @classmethod
+    def from_model(cls, product) -> 'ProductDTO':
+        """Construir desde una instancia ORM o una fila (Row) con las mismas columnas"""
+        return cls(
+            id=product.id,
+            name=product.name,
+            brand=product.brand,
+            category=product.category,
+            weight_size=product.weight_size,
+            price=float(product.price),
+            cost=float(product.cost) if product.cost else None,
+            current_stock=product.current_stock,
+            min_stock=product.min_stock,
+            max_stock=product.max_stock,
+            reorder_point=product.reorder_point,
+            sku=product.sku,
+            description=product.description,
+            is_active=product.is_active,
+            created_at=_isoformat(product.created_at),
+            updated_at=_isoformat(product.updated_at)
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CustomerDTO:
+    """Cliente serializable (mismas claves que Customer.to_dict)"""
+    id: int
+    phone: Optional[str]
+    name: Optional[str]
+    email: Optional[str]
+    address: Optional[str]
+    default_latitude: Optional[float]
+    default_longitude: Optional[float]
+    total_orders: Optional[int]
+    total_spent: float
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+    @classmethod
+    def from_model(cls, customer) -> 'CustomerDTO':
+        """Construir desde una instancia ORM o una fila (Row) con las mismas columnas"""
+        return cls(
+            id=customer.id,
+            phone=customer.phone,
+            name=customer.name,
+            email=customer.email,
+            address=customer.address,
+            default_latitude=customer.default_latitude,
+            default_longitude=customer.default_longitude,
+            total_orders=customer.total_orders,
+            total_spent=float(customer.total_spent) if customer.total_spent else 0,
+            created_at=_isoformat(customer.created_at),
+            updated_at=_isoformat(customer.updated_at)
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class SaleDTO:
+    """Venta serializable (mismas claves que Sale.to_dict)"""
+    id: int
+    sale_id: str
+    product_id: int
+    customer_id: Optional[int]
+    quantity: int
+    unit_price: float
+    total_price: float
+    latitude: float
+    longitude: float
+    address: Optional[str]
+    sale_date: Optional[str]
+    sale_time: Optional[str]
+    created_at: Optional[str]
+    source: Optional[str]
+    notes: Optional[str]
+    status: Optional[str]
+    cluster_id: Optional[int]
+    product: Optional[ProductDTO]
+    customer: Optional[CustomerDTO]
+
+    @classmethod
+    def from_model(cls, sale) -> 'SaleDTO':
+        """Construir desde una instancia ORM; las filas sin relaciones dejan product/customer en None"""
+        product = getattr(sale, 'product', None)
+        customer = getattr(sale, 'customer', None)
+        return cls(
+            id=sale.id,
+            sale_id=sale.sale_id,
+            product_id=sale.product_id,
+            customer_id=sale.customer_id,
+            quantity=sale.quantity,
+            unit_price=float(sale.unit_price),
+            total_price=float(sale.total_price),
+            latitude=sale.latitude,
+            longitude=sale.longitude,
+            address=sale.address,
+            sale_date=_isoformat(sale.sale_date),
+            sale_time=_isoformat(sale.sale_time),
+            created_at=_isoformat(sale.created_at),
+            source=sale.source,
+            notes=sale.notes,
+            status=sale.status,
+            cluster_id=sale.cluster_id,
+            product=ProductDTO.from_model(product) if product else None,
+            customer=CustomerDTO.from_model(customer) if customer else None
+        )
@@ -1,453 +1,626 @@
-# models/clustering_model.py - Modelo de Clustering Geográfico
-import numpy as np
-import pandas as pd
-from sklearn.cluster import KMeans, DBSCAN
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
-import joblib
-import os
-from datetime import datetime, timedelta
-import logging
-from typing import Tuple, List, Dict, Optional
-
-from database.connection import db
-from database.models import Sale, ClusterInfo, Prediction
-
-class GeographicClustering:
-    """Modelo de clustering geográfico para análisis de zonas de entrega"""
-    
-    def __init__(self, config=None):
-        self.config = config or {}
-        self.kmeans_clusters = self.config.get('kmeans_clusters', 5)
-        self.dbscan_eps = self.config.get('dbscan_eps', 0.01)
-        self.dbscan_min_samples = self.config.get('dbscan_min_samples', 5)
-        
-        self.kmeans_model = None
-        self.dbscan_model = None
-        self.scaler = StandardScaler()
-        self.is_trained = False
-        
-        self.logger = logging.getLogger(__name__)
-    
-    def prepare_data(self, start_date: Optional[datetime] = None, 
-                    end_date: Optional[datetime] = None) -> pd.DataFrame:
-        """Preparar datos de coordenadas para clustering"""
-        try:
-            # Query para obtener datos de ventas
-            query = db.session.query(Sale.latitude, Sale.longitude, Sale.sale_date, 
-                                   Sale.total_price, Sale.product_id)
-            
-            # Filtrar por fechas si se especifican
-            if start_date:
-                query = query.filter(Sale.sale_date >= start_date)
-            if end_date:
-                query = query.filter(Sale.sale_date <= end_date)
-            
-            # Convertir a DataFrame
-            data = pd.read_sql(query.statement, db.session.bind)
-            
-            if data.empty:
-                raise ValueError("No hay datos de ventas disponibles para clustering")
-            
-            # Limpiar datos faltantes
-            data = data.dropna(subset=['latitude', 'longitude'])
-            
-            # Verificar que las coordenadas estén en rangos válidos
-            data = data[
-                (data['latitude'].between(-90, 90)) & 
-                (data['longitude'].between(-180, 180))
-            ]
-            
-            self.logger.info(f"Datos preparados: {len(data)} registros de ventas")
-            return data
-            
-        except Exception as e:
-            self.logger.error(f"Error preparando datos: {e}")
-            raise
-    
-    def train_kmeans(self, data: pd.DataFrame) -> Dict:
-        """Entrenar modelo K-Means"""
-        try:
-            # Preparar coordenadas
-            coordinates = data[['latitude', 'longitude']].values
-            
-            # Escalar coordenadas
-            coordinates_scaled = self.scaler.fit_transform(coordinates)
-            
-            # Determinar número óptimo de clusters usando método del codo
-            optimal_clusters = self._find_optimal_clusters(coordinates_scaled)
-            
-            # Entrenar K-Means
-            self.kmeans_model = KMeans(
-                n_clusters=optimal_clusters,
-                random_state=42,
-                n_init=10,
-                max_iter=300
-            )
-            
-            clusters = self.kmeans_model.fit_predict(coordinates_scaled)
-            
-            # Calcular métricas
-            silhouette_avg = silhouette_score(coordinates_scaled, clusters)
-            inertia = self.kmeans_model.inertia_
-            
-            # Agregar clusters al DataFrame
-            data_with_clusters = data.copy()
-            data_with_clusters['cluster'] = clusters
-            
-            results = {
-                'algorithm': 'kmeans',
-                'n_clusters': optimal_clusters,
-                'silhouette_score': silhouette_avg,
-                'inertia': inertia,
-                'cluster_centers': self.kmeans_model.cluster_centers_,
-                'data_with_clusters': data_with_clusters
-            }
-            
-            self.logger.info(f"K-Means entrenado: {optimal_clusters} clusters, "
-                           f"silhouette score: {silhouette_avg:.3f}")
-            
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error entrenando K-Means: {e}")
-            raise
-    
-    def train_dbscan(self, data: pd.DataFrame) -> Dict:
-        """Entrenar modelo DBSCAN"""
-        try:
-            # Preparar coordenadas
-            coordinates = data[['latitude', 'longitude']].values
-            
-            # Escalar coordenadas
-            coordinates_scaled = self.scaler.fit_transform(coordinates)
-            
-            # Entrenar DBSCAN
-            self.dbscan_model = DBSCAN(
-                eps=self.dbscan_eps,
-                min_samples=self.dbscan_min_samples,
-                metric='euclidean'
-            )
-            
-            clusters = self.dbscan_model.fit_predict(coordinates_scaled)
-            
-            # Calcular métricas
-            n_clusters = len(set(clusters)) - (1 if -1 in clusters else 0)
-            n_noise = list(clusters).count(-1)
-            
-            silhouette_avg = None
-            if n_clusters > 1:
-                # Solo calcular silhouette si hay más de 1 cluster
-                mask = clusters != -1
-                if np.sum(mask) > 1:
-                    silhouette_avg = silhouette_score(
-                        coordinates_scaled[mask], clusters[mask]
-                    )
-            
-            # Agregar clusters al DataFrame
-            data_with_clusters = data.copy()
-            data_with_clusters['cluster'] = clusters
-            
-            results = {
-                'algorithm': 'dbscan',
-                'n_clusters': n_clusters,
-                'n_noise': n_noise,
-                'silhouette_score': silhouette_avg,
-                'eps': self.dbscan_eps,
-                'min_samples': self.dbscan_min_samples,
-                'data_with_clusters': data_with_clusters
-            }
-            
-            self.logger.info(f"DBSCAN entrenado: {n_clusters} clusters, "
-                           f"{n_noise} puntos de ruido")
-            
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error entrenando DBSCAN: {e}")
-            raise
-    
-    def _find_optimal_clusters(self, data: np.ndarray, max_clusters: int = 10) -> int:
-        """Encontrar número óptimo de clusters usando método del codo"""
-        inertias = []
-        silhouette_scores = []
-        k_range = range(2, min(max_clusters + 1, len(data)))
-        
-        for k in k_range:
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            clusters = kmeans.fit_predict(data)
-            
-            inertias.append(kmeans.inertia_)
-            silhouette_scores.append(silhouette_score(data, clusters))
-        
-        # Encontrar codo usando diferencias de segunda derivada
-        if len(inertias) >= 3:
-            diffs = np.diff(inertias)
-            second_diffs = np.diff(diffs)
-            elbow_idx = np.argmax(second_diffs) + 2  # +2 porque empezamos en k=2
-            optimal_k = k_range[elbow_idx]
-        else:
-            # Si no hay suficientes datos, usar el k con mejor silhouette score
-            optimal_k = k_range[np.argmax(silhouette_scores)]
-        
-        return min(optimal_k, self.kmeans_clusters)
-    
-    def train_models(self, start_date: Optional[datetime] = None,
-                    end_date: Optional[datetime] = None) -> Dict:
-        """Entrenar ambos modelos de clustering"""
-        try:
-            # Preparar datos
-            data = self.prepare_data(start_date, end_date)
-            
-            # Entrenar ambos modelos
-            kmeans_results = self.train_kmeans(data)
-            dbscan_results = self.train_dbscan(data)
-            
-            # Seleccionar mejor modelo basado en silhouette score
-            best_model = 'kmeans'
-            if (dbscan_results['silhouette_score'] and 
-                kmeans_results['silhouette_score'] and
-                dbscan_results['silhouette_score'] > kmeans_results['silhouette_score']):
-                best_model = 'dbscan'
-            
-            # Actualizar clusters en base de datos
-            self._update_clusters_in_db(
-                kmeans_results['data_with_clusters'] if best_model == 'kmeans' 
-                else dbscan_results['data_with_clusters'],
-                best_model
-            )
-            
-            # Guardar información de clusters
-            self._save_cluster_info(
-                kmeans_results if best_model == 'kmeans' else dbscan_results
-            )
-            
-            self.is_trained = True
-            
-            results = {
-                'kmeans': kmeans_results,
-                'dbscan': dbscan_results,
-                'best_model': best_model,
-                'training_date': datetime.now().isoformat(),
-                'data_points': len(data)
-            }
-            
-            self.logger.info(f"Modelos entrenados exitosamente. Mejor modelo: {best_model}")
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error entrenando modelos: {e}")
-            raise
-    
-    def _update_clusters_in_db(self, data_with_clusters: pd.DataFrame, algorithm: str):
-        """Actualizar clusters en base de datos"""
-        try:
-            # Agrupar por sale_id para evitar duplicados
-            for _, row in data_with_clusters.iterrows():
-                # Buscar venta por coordenadas y fecha (aproximada)
-                sale = db.session.query(Sale).filter(
-                    Sale.latitude == row['latitude'],
-                    Sale.longitude == row['longitude'],
-                    Sale.sale_date == row['sale_date']
-                ).first()
-                
-                if sale:
-                    sale.cluster_id = int(row['cluster']) if row['cluster'] != -1 else None
-            
-            db.session.commit()
-            self.logger.info(f"Clusters actualizados en base de datos usando {algorithm}")
-            
-        except Exception as e:
-            db.session.rollback()
-            self.logger.error(f"Error actualizando clusters: {e}")
-            raise
-    
-    def _save_cluster_info(self, results: Dict):
-        """Guardar información de clusters en base de datos"""
-        try:
-            # Limpiar información anterior
-            db.session.query(ClusterInfo).delete()
-            
-            data_with_clusters = results['data_with_clusters']
-            algorithm = results['algorithm']
-            
-            # Calcular estadísticas por cluster
-            cluster_stats = data_with_clusters.groupby('cluster').agg({
-                'latitude': 'mean',
-                'longitude': 'mean',
-                'total_price': ['count', 'sum', 'mean']
-            }).round(6)
-            
-            cluster_stats.columns = [
-                'center_lat', 'center_lng', 'total_sales', 'total_revenue', 'avg_order_value'
-            ]
-            
-            # Guardar información de cada cluster
-            for cluster_id, stats in cluster_stats.iterrows():
-                if cluster_id == -1:  # Ignorar puntos de ruido
-                    continue
-                
-                cluster_info = ClusterInfo(
-                    cluster_id=int(cluster_id),
-                    center_latitude=stats['center_lat'],
-                    center_longitude=stats['center_lng'],
-                    total_sales=int(stats['total_sales']),
-                    total_revenue=float(stats['total_revenue']),
-                    avg_order_value=float(stats['avg_order_value']),
-                    algorithm_used=algorithm,
-                    zone_name=f"Zona {cluster_id}",
-                    zone_description=f"Cluster {cluster_id} generado por {algorithm}",
-                    last_updated=datetime.now()
-                )
-                
-                db.session.add(cluster_info)
-            
-            db.session.commit()
-            self.logger.info(f"Información de clusters guardada: {len(cluster_stats)} clusters")
-            
-        except Exception as e:
-            db.session.rollback()
-            self.logger.error(f"Error guardando información de clusters: {e}")
-            raise
-    
-    def predict_zone(self, latitude: float, longitude: float) -> Optional[int]:
-        """Predecir zona/cluster para nuevas coordenadas"""
-        try:
-            if not self.is_trained or not self.kmeans_model:
-                raise ValueError("Modelo no entrenado")
-            
-            # Escalar coordenadas
-            coords_scaled = self.scaler.transform([[latitude, longitude]])
-            
-            # Predecir cluster
-            cluster = self.kmeans_model.predict(coords_scaled)[0]
-            
-            return int(cluster)
-            
-        except Exception as e:
-            self.logger.error(f"Error prediciendo zona: {e}")
-            return None
-    
-    def get_cluster_heatmap_data(self) -> List[Dict]:
-        """Obtener datos para mapa de calor de clusters"""
-        try:
-            clusters = db.session.query(ClusterInfo).filter(
-                ClusterInfo.is_active == True
-            ).all()
-            
-            heatmap_data = []
-            for cluster in clusters:
-                heatmap_data.append({
-                    'lat': cluster.center_latitude,
-                    'lng': cluster.center_longitude,
-                    'intensity': cluster.total_sales,
-                    'revenue': float(cluster.total_revenue),
-                    'zone_name': cluster.zone_name,
-                    'cluster_id': cluster.cluster_id
-                })
-            
-            return heatmap_data
-            
-        except Exception as e:
-            self.logger.error(f"Error obteniendo datos de mapa de calor: {e}")
-            return []
-    
-    def get_zone_predictions(self, days_ahead: int = 7) -> List[Dict]:
-        """Obtener predicciones de demanda por zona"""
-        try:
-            # Obtener datos históricos por cluster
-            thirty_days_ago = datetime.now() - timedelta(days=30)
-            
-            query = db.session.query(
-                Sale.cluster_id,
-                Sale.sale_date,
-                db.func.count(Sale.id).label('sales_count'),
-                db.func.sum(Sale.total_price).label('total_revenue')
-            ).filter(
-                Sale.sale_date >= thirty_days_ago,
-                Sale.cluster_id.isnot(None)
-            ).group_by(
-                Sale.cluster_id, Sale.sale_date
-            ).all()
-            
-            # Convertir a DataFrame para análisis
-            df = pd.DataFrame([
-                {
-                    'cluster_id': row.cluster_id,
-                    'date': row.sale_date,
-                    'sales_count': row.sales_count,
-                    'total_revenue': float(row.total_revenue)
-                }
-                for row in query
-            ])
-            
-            predictions = []
-            
-            if not df.empty:
-                # Calcular predicciones simples basadas en promedio móvil
-                for cluster_id in df['cluster_id'].unique():
-                    cluster_data = df[df['cluster_id'] == cluster_id]
-                    
-                    # Promedio de ventas y revenue de últimos 7 días
-                    recent_data = cluster_data.tail(7)
-                    avg_sales = recent_data['sales_count'].mean()
-                    avg_revenue = recent_data['total_revenue'].mean()
-                    
-                    # Predicción simple: proyectar promedio
-                    predicted_sales = avg_sales * days_ahead
-                    predicted_revenue = avg_revenue * days_ahead
-                    
-                    predictions.append({
-                        'cluster_id': cluster_id,
-                        'predicted_sales': round(predicted_sales),
-                        'predicted_revenue': round(predicted_revenue, 2),
-                        'confidence': 0.7,  # Confianza básica
-                        'days_ahead': days_ahead
-                    })
-            
-            return predictions
-            
-        except Exception as e:
-            self.logger.error(f"Error obteniendo predicciones por zona: {e}")
-            return []
-    
-    def save_model(self, model_path: str):
-        """Guardar modelos entrenados"""
-        try:
-            os.makedirs(os.path.dirname(model_path), exist_ok=True)
-            
-            model_data = {
-                'kmeans_model': self.kmeans_model,
-                'dbscan_model': self.dbscan_model,
-                'scaler': self.scaler,
-                'config': self.config,
-                'is_trained': self.is_trained,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            joblib.dump(model_data, model_path)
-            self.logger.info(f"Modelos guardados en: {model_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Error guardando modelos: {e}")
-            raise
-    
-    def load_model(self, model_path: str):
-        """Cargar modelos entrenados"""
-        try:
-            if not os.path.exists(model_path):
-                raise FileNotFoundError(f"No se encontró el archivo: {model_path}")
-            
-            model_data = joblib.load(model_path)
-            
-            self.kmeans_model = model_data.get('kmeans_model')
-            self.dbscan_model = model_data.get('dbscan_model')
-            self.scaler = model_data.get('scaler')
-            self.config = model_data.get('config', {})
-            self.is_trained = model_data.get('is_trained', False)
-            
-            self.logger.info(f"Modelos cargados desde: {model_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Error cargando modelos: {e}")
+# models/clustering_model.py - Modelo de Clustering Geográfico
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans, MiniBatchKMeans, DBSCAN
+from sklearn.metrics import silhouette_score
+import joblib
+from joblib import Parallel, delayed
+from threadpoolctl import threadpool_limits
+import os
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import logging
+from typing import Tuple, List, Dict, Optional
+
+from database.connection import db, DatabaseManager
+from database.models import Sale, ClusterInfo, Prediction, _utcnow
+
+# Numba es opcional: si no está instalado se usa la asignación vectorizada con NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Radio medio de la Tierra, para convertir eps de DBSCAN de km a radianes
+EARTH_RADIUS_KM = 6371.0088
+
+# Tamaño de muestra para silhouette durante la búsqueda del codo (silhouette es O(N²))
+ELBOW_SILHOUETTE_SAMPLE = 2000
+
+# Tamaño de muestra para el silhouette reportado de cada modelo entrenado
+TRAIN_SILHOUETTE_SAMPLE = 5000
+
+def _sampled_silhouette(data: np.ndarray, labels: np.ndarray) -> float:
+    """Silhouette sobre una muestra acotada de puntos (O(S²) en lugar de O(N²))"""
+    return silhouette_score(
+        data, labels,
+        sample_size=min(len(data), TRAIN_SILHOUETTE_SAMPLE),
+        random_state=42,
+        n_jobs=-1
+    )
+
+def _fit_kmeans_for_k(data: np.ndarray, k: int,
+                      with_silhouette: bool = True) -> Tuple[float, Optional[float]]:
+    """Ajustar K-Means (mini-batch) con k clusters y devolver (inercia, silhouette)"""
+    # Un hilo BLAS por worker para no competir con los procesos de joblib
+    with threadpool_limits(limits=1, user_api='blas'):
+        # Para el codo basta la aproximación mini-batch; el k elegido se ajusta con KMeans completo
+        kmeans = MiniBatchKMeans(
+            n_clusters=k,
+            random_state=42,
+            init='k-means++',
+            batch_size=4096,
+            n_init=3,
+            max_iter=100
+        )
+        clusters = kmeans.fit_predict(data)
+        
+        score = None
+        if with_silhouette:
+            score = silhouette_score(
+                data, clusters,
+                sample_size=min(len(data), ELBOW_SILHOUETTE_SAMPLE),
+                random_state=42
+            )
+        return kmeans.inertia_, score
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _assign_2d(points, centers):
+        """Asignar cada punto 2D (lat, lng escalados) al centroide más cercano"""
+        n_points = points.shape[0]
+        n_centers = centers.shape[0]
+        labels = np.empty(n_points, dtype=np.int64)
+        
+        for i in prange(n_points):
+            best_label = 0
+            best_distance = np.inf
+            for j in range(n_centers):
+                dx = points[i, 0] - centers[j, 0]
+                dy = points[i, 1] - centers[j, 1]
+                distance = dx * dx + dy * dy
+                if distance < best_distance:
+                    best_distance = distance
+                    best_label = j
+            labels[i] = best_label
+        
+        return labels
+else:
+    _assign_2d = None
+
+# Resultados del codo por (hash de los datos, max_clusters, tope de K-Means), el más reciente al final
+ELBOW_CACHE_SIZE = 16
+_elbow_cache = OrderedDict()
+
+def _array_digest(array: np.ndarray) -> bytes:
+    """Hash blake2b del contenido de un arreglo (con su dtype y forma)"""
+    array = np.ascontiguousarray(array)
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    hasher.update(array.tobytes())
+    return hasher.digest()
+
+def _elbow_optimal_k(data: np.ndarray, max_clusters: int, kmeans_clusters_cap: int) -> int:
+    """Número óptimo de clusters por método del codo"""
+    k_range = range(2, min(max_clusters + 1, len(data)))
+    
+    # Silhouette solo se usa como respaldo cuando no hay puntos suficientes para el codo
+    with_silhouette = len(k_range) < 3
+    
+    # Cada k es independiente: ajustarlos en paralelo
+    fits = Parallel(n_jobs=-1, prefer='processes')(
+        delayed(_fit_kmeans_for_k)(data, k, with_silhouette) for k in k_range
+    )
+    inertias = [inertia for inertia, _ in fits]
+    silhouette_scores = [score for _, score in fits]
+    
+    # Encontrar codo usando diferencias de segunda derivada
+    if len(inertias) >= 3:
+        diffs = np.diff(inertias)
+        second_diffs = np.diff(diffs)
+        elbow_idx = np.argmax(second_diffs) + 2  # +2 porque empezamos en k=2
+        optimal_k = k_range[elbow_idx]
+    else:
+        # Si no hay suficientes datos, usar el k con mejor silhouette score
+        optimal_k = k_range[np.argmax(silhouette_scores)]
+    
+    return min(int(optimal_k), kmeans_clusters_cap)
+
+class CoordinateScaler:
+    """Normalización media/desviación para coordenadas (lat, lng), sin la sobrecarga de StandardScaler"""
+    
+    def __init__(self, mean: Optional[np.ndarray] = None, scale: Optional[np.ndarray] = None):
+        self.mean_ = mean
+        self.scale_ = scale
+    
+    def fit(self, coords: np.ndarray) -> 'CoordinateScaler':
+        coords = np.asarray(coords)
+        self.mean_ = coords.mean(axis=0)
+        scale = coords.std(axis=0)
+        # Igual que StandardScaler: columnas sin varianza no se escalan
+        scale[scale == 0] = 1.0
+        self.scale_ = scale
+        return self
+    
+    def transform(self, coords: np.ndarray) -> np.ndarray:
+        return (np.asarray(coords) - self.mean_) / self.scale_
+    
+    def fit_transform(self, coords: np.ndarray) -> np.ndarray:
+        return self.fit(coords).transform(coords)
+    
+    def inverse_transform(self, coords_scaled: np.ndarray) -> np.ndarray:
+        return np.asarray(coords_scaled) * self.scale_ + self.mean_
+
+class GeographicClustering:
+    """Modelo de clustering geográfico para análisis de zonas de entrega"""
+    
+    def __init__(self, config=None):
+        self.config = config or {}
+        self.kmeans_clusters = self.config.get('kmeans_clusters', 5)
+        self.dbscan_eps_km = self.config.get('dbscan_eps_km', 0.5)
+        self.dbscan_min_samples = self.config.get('dbscan_min_samples', 5)
+        
+        self.kmeans_model = None
+        self.dbscan_model = None
+        self.scaler = CoordinateScaler()
+        self.is_trained = False
+        
+        # Centroides K-Means (espacio escalado) y sus normas al cuadrado, para predict_zones_batch
+        self._centers_scaled = None
+        self._center_sqnorms = None
+        
+        self.logger = logging.getLogger(__name__)
+    
+    def prepare_data(self, start_date: Optional[datetime] = None, 
+                    end_date: Optional[datetime] = None) -> pd.DataFrame:
+        """Preparar datos de coordenadas para clustering"""
+        try:
+            # Query para obtener datos de ventas; las coordenadas nulas o fuera de rango
+            # se descartan en la base (BETWEEN también excluye NULL)
+            query = db.session.query(Sale.id, Sale.latitude, Sale.longitude, Sale.sale_date, 
+                                   Sale.total_price, Sale.product_id).filter(
+                Sale.latitude.between(-90, 90),
+                Sale.longitude.between(-180, 180)
+            )
+            
+            # Filtrar por fechas si se especifican
+            if start_date:
+                query = query.filter(Sale.sale_date >= start_date)
+            if end_date:
+                query = query.filter(Sale.sale_date <= end_date)
+            
+            # Convertir a DataFrame (una sola lectura: el filtro ya se aplicó en la base)
+            data = pd.read_sql(query.statement, db.session.connection())
+            
+            if data.empty:
+                raise ValueError("No hay datos de ventas disponibles para clustering")
+            
+            self.logger.info(f"Datos preparados: {len(data)} registros de ventas")
+            return data
+            
+        except Exception as e:
+            self.logger.error(f"Error preparando datos: {e}")
+            raise
+    
+    def _coordinates(self, data: pd.DataFrame) -> np.ndarray:
+        """Extraer coordenadas (float32 basta para lat/lng y reduce a la mitad el tráfico de memoria)"""
+        return data[['latitude', 'longitude']].to_numpy(dtype=np.float32)
+    
+    def scale_coordinates(self, data: pd.DataFrame) -> np.ndarray:
+        """Ajustar el escalador y devolver las coordenadas escaladas (float32)"""
+        return self.scaler.fit_transform(self._coordinates(data)).astype(np.float32, copy=False)
+    
+    def train_kmeans(self, data: pd.DataFrame,
+                     coordinates_scaled: Optional[np.ndarray] = None) -> Dict:
+        """Entrenar modelo K-Means (coordinates_scaled permite reutilizar el escalado)"""
+        try:
+            # Escalar coordenadas
+            if coordinates_scaled is None:
+                coordinates_scaled = self.scale_coordinates(data)
+            
+            # Determinar número óptimo de clusters usando método del codo
+            optimal_clusters = self._find_optimal_clusters(coordinates_scaled)
+            
+            # Entrenar K-Means
+            self.kmeans_model = KMeans(
+                n_clusters=optimal_clusters,
+                random_state=42,
+                n_init=10,
+                max_iter=300
+            )
+            
+            clusters = self.kmeans_model.fit_predict(coordinates_scaled)
+            self._cache_kmeans_centers()
+            
+            # Calcular métricas
+            silhouette_avg = _sampled_silhouette(coordinates_scaled, clusters)
+            inertia = self.kmeans_model.inertia_
+            
+            results = {
+                'algorithm': 'kmeans',
+                'n_clusters': optimal_clusters,
+                'silhouette_score': silhouette_avg,
+                'inertia': inertia,
+                'cluster_centers': self.kmeans_model.cluster_centers_,
+                # Etiquetas por venta, sin copiar el DataFrame de origen
+                'ids': data['id'].to_numpy(),
+                'clusters': clusters
+            }
+            
+            self.logger.info(f"K-Means entrenado: {optimal_clusters} clusters, "
+                           f"silhouette score: {silhouette_avg:.3f}")
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error entrenando K-Means: {e}")
+            raise
+    
+    def train_dbscan(self, data: pd.DataFrame,
+                     coordinates_scaled: Optional[np.ndarray] = None) -> Dict:
+        """Entrenar modelo DBSCAN (coordinates_scaled permite reutilizar el escalado)"""
+        try:
+            # Preparar coordenadas
+            coordinates = self._coordinates(data)
+            
+            # Coordenadas escaladas: solo para silhouette, comparable con el de K-Means
+            if coordinates_scaled is None:
+                coordinates_scaled = self.scale_coordinates(data)
+            
+            # Entrenar DBSCAN sobre distancia geográfica real (haversine en radianes);
+            # eps en km convertido a radianes con el radio terrestre
+            self.dbscan_model = DBSCAN(
+                eps=self.dbscan_eps_km / EARTH_RADIUS_KM,
+                min_samples=self.dbscan_min_samples,
+                metric='haversine',
+                algorithm='ball_tree',
+                leaf_size=40,
+                n_jobs=-1
+            )
+            
+            # Los procesos de n_jobs paralelizan la búsqueda de vecinos; limitar BLAS
+            # a un hilo evita sobresuscribir los núcleos
+            with threadpool_limits(limits=1):
+                clusters = self.dbscan_model.fit_predict(np.radians(coordinates.astype(np.float64)))
+            
+            # Calcular métricas
+            labels = np.unique(clusters)
+            n_noise = int(np.count_nonzero(clusters == -1))
+            n_clusters = int(labels.size - (1 if n_noise else 0))
+            
+            silhouette_avg = None
+            if n_clusters > 1:
+                # Solo calcular silhouette si hay más de 1 cluster
+                mask = clusters != -1
+                if np.sum(mask) > 1:
+                    silhouette_avg = _sampled_silhouette(
+                        coordinates_scaled[mask], clusters[mask]
+                    )
+            
+            results = {
+                'algorithm': 'dbscan',
+                'n_clusters': n_clusters,
+                'n_noise': n_noise,
+                'silhouette_score': silhouette_avg,
+                'eps_km': self.dbscan_eps_km,
+                'min_samples': self.dbscan_min_samples,
+                # Etiquetas por venta, sin copiar el DataFrame de origen
+                'ids': data['id'].to_numpy(),
+                'clusters': clusters
+            }
+            
+            self.logger.info(f"DBSCAN entrenado: {n_clusters} clusters, "
+                           f"{n_noise} puntos de ruido")
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error entrenando DBSCAN: {e}")
+            raise
+    
+    def _find_optimal_clusters(self, data: np.ndarray, max_clusters: int = 10) -> int:
+        """Encontrar número óptimo de clusters usando método del codo"""
+        # Reentrenar sobre la misma ventana de datos reutiliza el resultado anterior
+        key = (_array_digest(data), max_clusters, self.kmeans_clusters)
+        if key in _elbow_cache:
+            _elbow_cache.move_to_end(key)
+            return _elbow_cache[key]
+        
+        optimal_k = _elbow_optimal_k(data, max_clusters, self.kmeans_clusters)
+        _elbow_cache[key] = optimal_k
+        if len(_elbow_cache) > ELBOW_CACHE_SIZE:
+            _elbow_cache.popitem(last=False)
+        return optimal_k
+    
+    def train_models(self, start_date: Optional[datetime] = None,
+                    end_date: Optional[datetime] = None) -> Dict:
+        """Entrenar ambos modelos de clustering"""
+        try:
+            # Preparar datos
+            data = self.prepare_data(start_date, end_date)
+            
+            # Escalar una sola vez y compartir el resultado entre ambos modelos
+            coordinates_scaled = self.scale_coordinates(data)
+            
+            # Entrenar ambos modelos
+            kmeans_results = self.train_kmeans(data, coordinates_scaled)
+            dbscan_results = self.train_dbscan(data, coordinates_scaled)
+            
+            # Seleccionar mejor modelo basado en silhouette score
+            best_model = 'kmeans'
+            if (dbscan_results['silhouette_score'] and 
+                kmeans_results['silhouette_score'] and
+                dbscan_results['silhouette_score'] > kmeans_results['silhouette_score']):
+                best_model = 'dbscan'
+            
+            best_results = kmeans_results if best_model == 'kmeans' else dbscan_results
+            
+            # Actualizar clusters en base de datos
+            self._update_clusters_in_db(
+                best_results['ids'], best_results['clusters'], best_model
+            )
+            
+            # Guardar información de clusters
+            self._save_cluster_info(best_results, data)
+            
+            self.is_trained = True
+            
+            results = {
+                'kmeans': kmeans_results,
+                'dbscan': dbscan_results,
+                'best_model': best_model,
+                'training_date': datetime.now().isoformat(),
+                'data_points': len(data)
+            }
+            
+            self.logger.info(f"Modelos entrenados exitosamente. Mejor modelo: {best_model}")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error entrenando modelos: {e}")
+            raise
+    
+    def _update_clusters_in_db(self, ids: np.ndarray, clusters: np.ndarray, algorithm: str):
+        """Actualizar clusters en base de datos"""
+        try:
+            # Un solo UPDATE por lotes usando la clave primaria de cada venta
+            mappings = [
+                {'id': int(sale_id), 'cluster_id': int(cluster) if cluster != -1 else None}
+                for sale_id, cluster in zip(ids, clusters)
+            ]
+            
+            db.session.bulk_update_mappings(Sale, mappings)
+            db.session.commit()
+            self.logger.info(f"Clusters actualizados en base de datos usando {algorithm}")
+            
+        except Exception as e:
+            db.session.rollback()
+            self.logger.error(f"Error actualizando clusters: {e}")
+            raise
+    
+    def _save_cluster_info(self, results: Dict, data: pd.DataFrame):
+        """Guardar información de clusters en base de datos"""
+        try:
+            algorithm = results['algorithm']
+            
+            # Estadísticas por cluster con bincount (etiquetas 0..K-1),
+            # descartando antes los puntos de ruido (-1)
+            labels = np.asarray(results['clusters'])
+            mask = labels != -1
+            labels = labels[mask]
+            k = int(labels.max()) + 1 if labels.size else 0
+            
+            counts = np.bincount(labels, minlength=k)
+            sum_lat = np.bincount(labels, weights=data['latitude'].to_numpy()[mask], minlength=k)
+            sum_lng = np.bincount(labels, weights=data['longitude'].to_numpy()[mask], minlength=k)
+            sum_price = np.bincount(
+                labels, weights=data['total_price'].to_numpy(dtype=np.float64)[mask], minlength=k
+            )
+            
+            # Registros de cada cluster con al menos una venta
+            last_updated = _utcnow()
+            records = [
+                {
+                    'cluster_id': cluster_id,
+                    'center_latitude': round(float(sum_lat[cluster_id] / counts[cluster_id]), 6),
+                    'center_longitude': round(float(sum_lng[cluster_id] / counts[cluster_id]), 6),
+                    'total_sales': int(counts[cluster_id]),
+                    'total_revenue': round(float(sum_price[cluster_id]), 6),
+                    'avg_order_value': round(float(sum_price[cluster_id] / counts[cluster_id]), 6),
+                    'algorithm_used': algorithm,
+                    'zone_name': f"Zona {cluster_id}",
+                    'zone_description': f"Cluster {cluster_id} generado por {algorithm}",
+                    'last_updated': last_updated,
+                    'is_active': True
+                }
+                for cluster_id in np.flatnonzero(counts).tolist()
+            ]
+            
+            upsert = (
+                DatabaseManager.upsert_statement(ClusterInfo, records, ['cluster_id'])
+                if records else None
+            )
+            if upsert is not None:
+                # UPSERT por cluster_id en un solo INSERT, en lugar de borrar toda la tabla
+                db.session.execute(upsert)
+                
+                # Eliminar solo los clusters que ya no existen
+                db.session.query(ClusterInfo).filter(
+                    ClusterInfo.cluster_id.notin_([r['cluster_id'] for r in records])
+                ).delete(synchronize_session=False)
+            else:
+                # Sin registros o motor sin UPSERT: reemplazar la tabla completa
+                db.session.query(ClusterInfo).delete(synchronize_session=False)
+                if records:
+                    db.session.bulk_insert_mappings(ClusterInfo, records)
+            
+            db.session.commit()
+            self.logger.info(f"Información de clusters guardada: {len(records)} clusters")
+            
+        except Exception as e:
+            db.session.rollback()
+            self.logger.error(f"Error guardando información de clusters: {e}")
+            raise
+    
+    def _cache_kmeans_centers(self):
+        """Precalcular centroides y sus normas al cuadrado para asignaciones rápidas"""
+        if self.kmeans_model is None:
+            self._centers_scaled = None
+            self._center_sqnorms = None
+            return
+        
+        # cluster_centers_ ya está en el espacio escalado en que se entrenó el modelo
+        self._centers_scaled = np.asarray(self.kmeans_model.cluster_centers_, dtype=float)
+        self._center_sqnorms = np.einsum('ij,ij->i', self._centers_scaled, self._centers_scaled)
+    
+    def predict_zones_batch(self, coords: np.ndarray) -> np.ndarray:
+        """Predecir zonas/clusters para un arreglo (N, 2) de coordenadas [lat, lng]"""
+        if not self.is_trained or not self.kmeans_model:
+            raise ValueError("Modelo no entrenado")
+        
+        if self._center_sqnorms is None:
+            self._cache_kmeans_centers()
+        
+        coords_scaled = self.scaler.transform(np.asarray(coords, dtype=float).reshape(-1, 2))
+        
+        # Kernel compilado especializado para dim=2, si Numba está disponible
+        if _assign_2d is not None:
+            return _assign_2d(np.ascontiguousarray(coords_scaled, dtype=np.float64),
+                              np.ascontiguousarray(self._centers_scaled, dtype=np.float64))
+        
+        # ||x - c||² = ||x||² + ||c||² - 2·x·c; ||x||² no cambia el argmin por fila
+        distances = self._center_sqnorms[None, :] - 2.0 * (coords_scaled @ self._centers_scaled.T)
+        return distances.argmin(axis=1)
+    
+    def predict_zone(self, latitude: float, longitude: float) -> Optional[int]:
+        """Predecir zona/cluster para nuevas coordenadas"""
+        try:
+            cluster = self.predict_zones_batch([[latitude, longitude]])[0]
+            
+            return int(cluster)
+            
+        except Exception as e:
+            self.logger.error(f"Error prediciendo zona: {e}")
+            return None
+    
+    def get_cluster_heatmap_data(self) -> List[Dict]:
+        """Obtener datos para mapa de calor de clusters"""
+        try:
+            clusters = db.session.query(ClusterInfo).filter(
+                ClusterInfo.is_active == True
+            ).all()
+            
+            heatmap_data = []
+            for cluster in clusters:
+                heatmap_data.append({
+                    'lat': cluster.center_latitude,
+                    'lng': cluster.center_longitude,
+                    'intensity': cluster.total_sales,
+                    'revenue': float(cluster.total_revenue),
+                    'zone_name': cluster.zone_name,
+                    'cluster_id': cluster.cluster_id
+                })
+            
+            return heatmap_data
+            
+        except Exception as e:
+            self.logger.error(f"Error obteniendo datos de mapa de calor: {e}")
+            return []
+    
+    def get_zone_predictions(self, days_ahead: int = 7) -> List[Dict]:
+        """Obtener predicciones de demanda por zona"""
+        try:
+            # Obtener datos históricos por cluster
+            thirty_days_ago = datetime.now() - timedelta(days=30)
+            
+            # Ventas diarias por cluster, numeradas de la más reciente a la más antigua
+            daily = db.session.query(
+                Sale.cluster_id,
+                db.func.count(Sale.id).label('sales_count'),
+                db.func.sum(Sale.total_price).label('total_revenue'),
+                db.func.row_number().over(
+                    partition_by=Sale.cluster_id,
+                    order_by=Sale.sale_date.desc()
+                ).label('day_rank')
+            ).filter(
+                Sale.sale_date >= thirty_days_ago,
+                Sale.cluster_id.isnot(None)
+            ).group_by(
+                Sale.cluster_id, Sale.sale_date
+            ).subquery()
+            
+            # Promedio de los últimos 7 días con ventas de cada cluster, calculado en la base
+            averages = db.session.query(
+                daily.c.cluster_id,
+                db.func.avg(daily.c.sales_count).label('avg_sales'),
+                db.func.avg(daily.c.total_revenue).label('avg_revenue')
+            ).filter(
+                daily.c.day_rank <= 7
+            ).group_by(daily.c.cluster_id).all()
+            
+            # Predicción simple: proyectar promedio
+            predictions = [
+                {
+                    'cluster_id': int(row.cluster_id),
+                    'predicted_sales': round(float(row.avg_sales) * days_ahead),
+                    'predicted_revenue': round(float(row.avg_revenue or 0) * days_ahead, 2),
+                    'confidence': 0.7,  # Confianza básica
+                    'days_ahead': days_ahead
+                }
+                for row in averages
+            ]
+            
+            return predictions
+            
+        except Exception as e:
+            self.logger.error(f"Error obteniendo predicciones por zona: {e}")
+            return []
+    
+    def save_model(self, model_path: str, compress=('lz4', 3)):
+        """Guardar modelos entrenados"""
+        try:
+            os.makedirs(os.path.dirname(model_path), exist_ok=True)
+            
+            model_data = {
+                'kmeans_model': self.kmeans_model,
+                'dbscan_model': self.dbscan_model,
+                'scaler_params': {'mean': self.scaler.mean_, 'scale': self.scaler.scale_},
+                'config': self.config,
+                'is_trained': self.is_trained,
+                'timestamp': datetime.now().isoformat()
+            }
+            
+            # lz4 comprime rápido; protocol=5 serializa los arreglos NumPy sin copias extra
+            joblib.dump(model_data, model_path, compress=compress, protocol=5)
+            self.logger.info(f"Modelos guardados en: {model_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error guardando modelos: {e}")
+            raise
+    
+    def load_model(self, model_path: str):
+        """Cargar modelos entrenados"""
+        try:
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"No se encontró el archivo: {model_path}")
+            
+            model_data = joblib.load(model_path)
+            
+            self.kmeans_model = model_data.get('kmeans_model')
+            self.dbscan_model = model_data.get('dbscan_model')
+            scaler_params = model_data.get('scaler_params')
+            if scaler_params is not None:
+                self.scaler = CoordinateScaler(scaler_params['mean'], scaler_params['scale'])
+            else:
+                # Modelos guardados antes de CoordinateScaler traen un StandardScaler completo
+                self.scaler = model_data.get('scaler')
+            self.config = model_data.get('config', {})
+            self.is_trained = model_data.get('is_trained', False)
+            self._cache_kmeans_centers()
+            
+            self.logger.info(f"Modelos cargados desde: {model_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error cargando modelos: {e}")
             raise
\ No newline at end of file
@@ -1,557 +1,764 @@
-# backend/models/model_trainer.py - Entrenador de Modelos
-import os
-import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-import pandas as pd
-import numpy as np
-from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
-import joblib
-
-from database.connection import db
-from database.models import Sale, Product, Prediction
-from .clustering_model import GeographicClustering
-from .sales_prediction import SalesPredictor
-from .nlp_processor import NLPProcessor
-
-logger = logging.getLogger(__name__)
-
-class ModelTrainer:
-    """Clase para entrenar y evaluar todos los modelos ML"""
-    
-    def __init__(self, config=None):
-        self.config = config or {}
-        self.models = {}
-        self.training_results = {}
-        self.models_dir = self.config.get('MODELS_FOLDER', 'data/trained_models')
-        
-        # Crear directorio de modelos si no existe
-        os.makedirs(self.models_dir, exist_ok=True)
-        
-        self.logger = logging.getLogger(__name__)
-    
-    def train_all_models(self, force_retrain=False) -> Dict:
-        """Entrenar todos los modelos del sistema"""
-        results = {
-            'timestamp': datetime.now().isoformat(),
-            'success': True,
-            'models_trained': [],
-            'errors': [],
-            'performance': {}
-        }
-        
-        try:
-            self.logger.info("=== INICIANDO ENTRENAMIENTO COMPLETO ===")
-            
-            # 1. Validar datos antes del entrenamiento
-            if not self._validate_training_data():
-                raise ValueError("Datos insuficientes para entrenamiento")
-            
-            # 2. Entrenar clustering geográfico
-            try:
-                clustering_results = self._train_clustering_model(force_retrain)
-                results['models_trained'].append('clustering')
-                results['performance']['clustering'] = clustering_results
-                self.logger.info("✅ Clustering entrenado exitosamente")
-            except Exception as e:
-                error_msg = f"Error entrenando clustering: {e}"
-                self.logger.error(error_msg)
-                results['errors'].append(error_msg)
-            
-            # 3. Entrenar modelo de predicción de ventas
-            try:
-                prediction_results = self._train_prediction_model(force_retrain)
-                results['models_trained'].append('sales_prediction')
-                results['performance']['sales_prediction'] = prediction_results
-                self.logger.info("✅ Predicción de ventas entrenada exitosamente")
-            except Exception as e:
-                error_msg = f"Error entrenando predicción: {e}"
-                self.logger.error(error_msg)
-                results['errors'].append(error_msg)
-            
-            # 4. Entrenar modelos específicos por producto
-            try:
-                product_results = self._train_product_models()
-                results['models_trained'].append('product_models')
-                results['performance']['product_models'] = product_results
-                self.logger.info("✅ Modelos por producto entrenados")
-            except Exception as e:
-                error_msg = f"Error entrenando modelos por producto: {e}"
-                self.logger.error(error_msg)
-                results['errors'].append(error_msg)
-            
-            # 5. Actualizar procesador NLP
-            try:
-                nlp_results = self._update_nlp_model()
-                results['models_trained'].append('nlp_processor')
-                results['performance']['nlp_processor'] = nlp_results
-                self.logger.info("✅ NLP actualizado exitosamente")
-            except Exception as e:
-                error_msg = f"Error actualizando NLP: {e}"
-                self.logger.error(error_msg)
-                results['errors'].append(error_msg)
-            
-            # 6. Evaluar rendimiento conjunto
-            try:
-                ensemble_results = self._evaluate_ensemble_performance()
-                results['performance']['ensemble'] = ensemble_results
-                self.logger.info("✅ Evaluación de conjunto completada")
-            except Exception as e:
-                error_msg = f"Error en evaluación de conjunto: {e}"
-                self.logger.error(error_msg)
-                results['errors'].append(error_msg)
-            
-            # 7. Guardar metadatos del entrenamiento
-            self._save_training_metadata(results)
-            
-            if results['errors']:
-                results['success'] = False
-                self.logger.warning(f"Entrenamiento completado con {len(results['errors'])} errores")
-            else:
-                self.logger.info("🎉 Entrenamiento completado exitosamente")
-                
-        except Exception as e:
-            results['success'] = False
-            results['errors'].append(f"Error crítico en entrenamiento: {e}")
-            self.logger.error(f"Error crítico: {e}")
-        
-        return results
-    
-    def _validate_training_data(self) -> bool:
-        """Validar que hay suficientes datos para entrenar"""
-        try:
-            # Verificar cantidad de ventas
-            total_sales = db.session.query(Sale).count()
-            if total_sales < 100:
-                self.logger.warning(f"Pocas ventas para entrenamiento: {total_sales}")
-                return False
-            
-            # Verificar productos activos
-            active_products = db.session.query(Product).filter(Product.is_active == True).count()
-            if active_products < 5:
-                self.logger.warning(f"Pocos productos activos: {active_products}")
-                return False
-            
-            # Verificar distribución temporal (últimos 30 días)
-            recent_sales = db.session.query(Sale).filter(
-                Sale.sale_date >= datetime.now().date() - timedelta(days=30)
-            ).count()
-            
-            if recent_sales < 20:
-                self.logger.warning(f"Pocas ventas recientes: {recent_sales}")
-                return False
-            
-            # Verificar calidad de coordenadas
-            valid_coords = db.session.query(Sale).filter(
-                Sale.latitude.between(20.5, 21.5),
-                Sale.longitude.between(-87.5, -86.5)
-            ).count()
-            
-            coord_quality = (valid_coords / total_sales) * 100
-            if coord_quality < 70:
-                self.logger.warning(f"Baja calidad de coordenadas: {coord_quality:.1f}%")
-            
-            self.logger.info(f"Validación exitosa: {total_sales} ventas, {active_products} productos")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Error validando datos: {e}")
-            return False
-    
-    def _train_clustering_model(self, force_retrain=False) -> Dict:
-        """Entrenar modelo de clustering geográfico"""
-        model_path = os.path.join(self.models_dir, 'clustering_model.joblib')
-        
-        # Verificar si necesita reentrenamiento
-        if not force_retrain and os.path.exists(model_path):
-            model_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(model_path))
-            if model_age.days < 7:  # Reentrenar cada 7 días
-                self.logger.info("Modelo de clustering es reciente, saltando entrenamiento")
-                return {'status': 'skipped', 'reason': 'model_recent'}
-        
-        clustering = GeographicClustering(self.config.get('CLUSTERING_CONFIG', {}))
-        results = clustering.train_models()
-        
-        # Guardar modelo
-        clustering.save_model(model_path)
-        self.models['clustering'] = clustering
-        
-        return {
-            'status': 'trained',
-            'best_model': results['best_model'],
-            'n_clusters': results['kmeans']['n_clusters'],
-            'silhouette_score': results[results['best_model']]['silhouette_score'],
-            'data_points': results['data_points'],
-            'model_path': model_path
-        }
-    
-    def _train_prediction_model(self, force_retrain=False) -> Dict:
-        """Entrenar modelo de predicción de ventas"""
-        model_path = os.path.join(self.models_dir, 'sales_prediction.joblib')
-        
-        # Verificar si necesita reentrenamiento
-        if not force_retrain and os.path.exists(model_path):
-            model_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(model_path))
-            if model_age.days < 3:  # Reentrenar cada 3 días
-                self.logger.info("Modelo de predicción es reciente, saltando entrenamiento")
-                return {'status': 'skipped', 'reason': 'model_recent'}
-        
-        predictor = SalesPredictor(self.config.get('PREDICTION_CONFIG', {}))
-        results = predictor.train_all_models()
-        
-        # Guardar modelo
-        predictor.save_model(model_path)
-        self.models['predictor'] = predictor
-        
-        return {
-            'status': 'trained',
-            'arima_mae': results['arima_results']['mae'],
-            'arima_rmse': results['arima_results']['rmse'],
-            'rf_test_r2': results['random_forest_results']['test_r2'],
-            'rf_test_mae': results['random_forest_results']['test_mae'],
-            'predictions_generated': results['predictions_generated'],
-            'model_path': model_path
-        }
-    
-    def _train_product_models(self) -> Dict:
-        """Entrenar modelos específicos por producto top"""
-        try:
-            # Obtener productos con más ventas (top 10)
-            top_products = db.session.query(
-                Product.id,
-                Product.name,
-                db.func.count(Sale.id).label('sales_count')
-            ).join(Sale).filter(
-                Product.is_active == True,
-                Sale.sale_date >= datetime.now().date() - timedelta(days=90)
-            ).group_by(Product.id, Product.name)\
-             .order_by(db.desc('sales_count')).limit(10).all()
-            
-            product_results = {}
-            predictor = self.models.get('predictor') or SalesPredictor()
-            
-            for product_id, product_name, sales_count in top_products:
-                try:
-                    # Entrenar modelo específico para este producto
-                    predictions = predictor.generate_product_predictions(product_id, 7)
-                    
-                    if predictions:
-                        # Evaluar precisión si hay datos históricos
-                        accuracy = self._evaluate_product_model_accuracy(product_id, predictions)
-                        
-                        product_results[product_id] = {
-                            'name': product_name,
-                            'sales_count': sales_count,
-                            'predictions_generated': len(predictions),
-                            'accuracy_score': accuracy,
-                            'status': 'trained'
-                        }
-                        
-                        # Guardar predicciones en BD
-                        predictor.save_predictions_to_db(predictions, 'product')
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error entrenando producto {product_name}: {e}")
-                    product_results[product_id] = {
-                        'name': product_name,
-                        'status': 'failed',
-                        'error': str(e)
-                    }
-            
-            return {
-                'status': 'completed',
-                'products_trained': len([p for p in product_results.values() if p.get('status') == 'trained']),
-                'products_failed': len([p for p in product_results.values() if p.get('status') == 'failed']),
-                'average_accuracy': np.mean([p.get('accuracy_score', 0) for p in product_results.values() if p.get('accuracy_score')]),
-                'details': product_results
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error en entrenamiento por productos: {e}")
-            return {'status': 'failed', 'error': str(e)}
-    
-    def _evaluate_product_model_accuracy(self, product_id: int, predictions: List[Dict]) -> float:
-        """Evaluar precisión del modelo de producto comparando con datos históricos"""
-        try:
-            # Obtener ventas reales de los últimos días
-            recent_sales = db.session.query(
-                Sale.sale_date,
-                db.func.sum(Sale.quantity).label('actual_quantity')
-            ).filter(
-                Sale.product_id == product_id,
-                Sale.sale_date >= datetime.now().date() - timedelta(days=7)
-            ).group_by(Sale.sale_date).all()
-            
-            if not recent_sales:
-                return 0.0
-            
-            # Comparar predicciones con realidad
-            accuracy_scores = []
-            
-            for prediction in predictions:
-                pred_date = datetime.fromisoformat(prediction['date']).date()
-                
-                # Buscar venta real para esa fecha
-                actual_sale = next((s for s in recent_sales if s.sale_date == pred_date), None)
-                
-                if actual_sale:
-                    predicted = prediction.get('predicted_quantity', 0)
-                    actual = actual_sale.actual_quantity
-                    
-                    if actual > 0:
-                        # Calcular precisión como 1 - error_relativo
-                        error = abs(predicted - actual) / actual
-                        accuracy = max(0, 1 - error)
-                        accuracy_scores.append(accuracy)
-            
-            return np.mean(accuracy_scores) * 100 if accuracy_scores else 0.0
-            
-        except Exception as e:
-            self.logger.warning(f"Error evaluando precisión producto {product_id}: {e}")
-            return 0.0
-    
-    def _update_nlp_model(self) -> Dict:
-        """Actualizar cache y configuración del procesador NLP"""
-        try:
-            nlp_processor = NLPProcessor(self.config.get('NLP_CONFIG', {}))
-            
-            # Refrescar cache de productos
-            nlp_processor.refresh_products_cache()
-            
-            # Evaluar calidad del procesamiento con mensajes de ejemplo
-            test_messages = [
-                "Ubicación: https://maps.google.com/?q=21.1619,-86.8515 Cliente: 123 nupec adulto 20kg cantidad: 2 precio: $3600",
-                "nexgard spectra 15-30kg 1 pieza $360 ref: casa azul",
-                "pro plan adult 15kg x3 total $6300 coordenadas: 21.1692, -86.8980"
-            ]
-            
-            parsing_results = []
-            for msg in test_messages:
-                try:
-                    result = nlp_processor.parse_whatsapp_message(msg)
-                    validation = nlp_processor.validate_parsed_data(result)
-                    parsing_results.append({
-                        'confidence': result.get('confidence', 0),
-                        'valid': validation.get('is_valid', False)
-                    })
-                except Exception as e:
-                    self.logger.warning(f"Error parseando mensaje de prueba: {e}")
-            
-            avg_confidence = np.mean([r['confidence'] for r in parsing_results]) if parsing_results else 0
-            success_rate = len([r for r in parsing_results if r['valid']]) / len(parsing_results) if parsing_results else 0
-            
-            return {
-                'status': 'updated',
-                'products_cached': len(nlp_processor.products_cache),
-                'avg_parsing_confidence': avg_confidence,
-                'parsing_success_rate': success_rate * 100,
-                'test_messages_processed': len(parsing_results)
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error actualizando NLP: {e}")
-            return {'status': 'failed', 'error': str(e)}
-    
-    def _evaluate_ensemble_performance(self) -> Dict:
-        """Evaluar rendimiento conjunto de todos los modelos"""
-        try:
-            results = {
-                'evaluation_date': datetime.now().isoformat(),
-                'models_evaluated': 0,
-                'overall_score': 0,
-                'recommendations': []
-            }
-            
-            # Evaluar clustering
-            if 'clustering' in self.models:
-                clustering_score = self._evaluate_clustering_quality()
-                results['clustering_quality'] = clustering_score
-                results['models_evaluated'] += 1
-            
-            # Evaluar predicciones recientes
-            prediction_accuracy = self._evaluate_recent_predictions()
-            results['prediction_accuracy'] = prediction_accuracy
-            if prediction_accuracy > 0:
-                results['models_evaluated'] += 1
-            
-            # Calcular score general
-            scores = [s for s in [
-                results.get('clustering_quality', 0),
-                results.get('prediction_accuracy', 0)
-            ] if s > 0]
-            
-            results['overall_score'] = np.mean(scores) if scores else 0
-            
-            # Generar recomendaciones
-            if results['overall_score'] < 70:
-                results['recommendations'].append("Considerar reentrenamiento con más datos")
-            
-            if results.get('clustering_quality', 0) < 60:
-                results['recommendations'].append("Ajustar parámetros de clustering")
-            
-            if results.get('prediction_accuracy', 0) < 75:
-                results['recommendations'].append("Revisar modelos de predicción")
-            
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error evaluando conjunto: {e}")
-            return {'status': 'failed', 'error': str(e)}
-    
-    def _evaluate_clustering_quality(self) -> float:
-        """Evaluar calidad del clustering actual"""
-        try:
-            # Obtener ventas con cluster asignado
-            clustered_sales = db.session.query(Sale).filter(
-                Sale.cluster_id.isnot(None)
-            ).count()
-            
-            total_sales = db.session.query(Sale).count()
-            
-            if total_sales == 0:
-                return 0.0
-            
-            # Porcentaje de ventas asignadas a clusters
-            assignment_rate = (clustered_sales / total_sales) * 100
-            
-            # Evaluar distribución entre clusters
-            cluster_distribution = db.session.query(
-                Sale.cluster_id,
-                db.func.count(Sale.id).label('count')
-            ).filter(
-                Sale.cluster_id.isnot(None)
-            ).group_by(Sale.cluster_id).all()
-            
-            if not cluster_distribution:
-                return assignment_rate * 0.5  # Penalizar si no hay distribución
-            
-            # Calcular balance entre clusters (evitar clusters muy desbalanceados)
-            cluster_counts = [c.count for c in cluster_distribution]
-            balance_score = 1 - (np.std(cluster_counts) / np.mean(cluster_counts)) if cluster_counts else 0
-            balance_score = max(0, min(1, balance_score)) * 100
-            
-            # Score final combinado
-            quality_score = (assignment_rate * 0.7) + (balance_score * 0.3)
-            
-            return min(100, quality_score)
-            
-        except Exception as e:
-            self.logger.warning(f"Error evaluando clustering: {e}")
-            return 0.0
-    
-    def _evaluate_recent_predictions(self) -> float:
-        """Evaluar precisión de predicciones recientes"""
-        try:
-            # Obtener predicciones de los últimos 7 días
-            week_ago = datetime.now().date() - timedelta(days=7)
-            
-            recent_predictions = db.session.query(Prediction).filter(
-                Prediction.target_date >= week_ago,
-                Prediction.target_date < datetime.now().date(),
-                Prediction.prediction_type == 'daily',
-                Prediction.is_active == True
-            ).all()
-            
-            if not recent_predictions:
-                return 0.0
-            
-            accuracy_scores = []
-            
-            for pred in recent_predictions:
-                # Obtener ventas reales para esa fecha
-                actual_sales = db.session.query(Sale).filter(
-                    Sale.sale_date == pred.target_date
-                ).count()
-                
-                if actual_sales > 0:
-                    predicted = pred.predicted_value
-                    error = abs(predicted - actual_sales) / actual_sales
-                    accuracy = max(0, 1 - error)
-                    accuracy_scores.append(accuracy)
-            
-            return np.mean(accuracy_scores) * 100 if accuracy_scores else 0.0
-            
-        except Exception as e:
-            self.logger.warning(f"Error evaluando predicciones: {e}")
-            return 0.0
-    
-    def _save_training_metadata(self, results: Dict):
-        """Guardar metadatos del entrenamiento"""
-        try:
-            metadata_path = os.path.join(self.models_dir, 'training_metadata.json')
-            
-            import json
-            with open(metadata_path, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
-                
-            self.logger.info(f"Metadatos guardados en: {metadata_path}")
-            
-        except Exception as e:
-            self.logger.warning(f"Error guardando metadatos: {e}")
-    
-    def get_model_status(self) -> Dict:
-        """Obtener estado de todos los modelos"""
-        try:
-            status = {
-                'timestamp': datetime.now().isoformat(),
-                'models': {}
-            }
-            
-            # Verificar archivos de modelos
-            model_files = {
-                'clustering': 'clustering_model.joblib',
-                'sales_prediction': 'sales_prediction.joblib',
-                'training_metadata': 'training_metadata.json'
-            }
-            
-            for model_name, filename in model_files.items():
-                file_path = os.path.join(self.models_dir, filename)
-                
-                if os.path.exists(file_path):
-                    stat = os.stat(file_path)
-                    status['models'][model_name] = {
-                        'exists': True,
-                        'size_mb': round(stat.st_size / (1024 * 1024), 2),
-                        'last_modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'age_days': (datetime.now() - datetime.fromtimestamp(stat.st_mtime)).days
-                    }
-                else:
-                    status['models'][model_name] = {
-                        'exists': False,
-                        'size_mb': 0,
-                        'last_modified': None,
-                        'age_days': None
-                    }
-            
-            return status
-            
-        except Exception as e:
-            self.logger.error(f"Error obteniendo estado de modelos: {e}")
-            return {'error': str(e)}
-    
-    def cleanup_old_models(self, days_old=30):
-        """Limpiar modelos antiguos"""
-        try:
-            cleaned_files = []
-            
-            for filename in os.listdir(self.models_dir):
-                if filename.endswith('.joblib') or filename.endswith('.pkl'):
-                    file_path = os.path.join(self.models_dir, filename)
-                    
-                    # Verificar edad del archivo
-                    file_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(file_path))
-                    
-                    if file_age.days > days_old:
-                        os.remove(file_path)
-                        cleaned_files.append(filename)
-                        self.logger.info(f"Archivo limpiado: {filename}")
-            
-            return {
-                'cleaned_files': cleaned_files,
-                'count': len(cleaned_files)
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error limpiando modelos: {e}")
+# backend/models/model_trainer.py - Entrenador de Modelos
+import os
+import json
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+import pandas as pd
+import numpy as np
+from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
+from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+import joblib
+from joblib import Parallel, delayed
+from flask import current_app
+
+from database.connection import db
+from database.models import Sale, Product, Prediction
+from .clustering_model import GeographicClustering
+from .sales_prediction import SalesPredictor
+from .nlp_processor import NLPProcessor
+
+# orjson es opcional: si no está instalado se usa json de la biblioteca estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Vigencia (segundos) de los conteos calculados durante la validación
+STATS_TTL_SECONDS = 300
+
+# Vigencia por defecto (segundos) del resultado de validación guardado en disco
+VALIDATION_TTL_SECONDS = 300
+
+# Compresión de los modelos guardados: lz4 nivel 1 prioriza la velocidad de escritura
+MODEL_COMPRESSION = ('lz4', 1)
+
+# Mensajes de éxito y prefijo de error de cada fase de entrenamiento
+TRAINING_PHASE_MESSAGES = {
+    'clustering': ("✅ Clustering entrenado exitosamente", "Error entrenando clustering"),
+    'sales_prediction': ("✅ Predicción de ventas entrenada exitosamente", "Error entrenando predicción"),
+    'product_models': ("✅ Modelos por producto entrenados", "Error entrenando modelos por producto"),
+    'nlp_processor': ("✅ NLP actualizado exitosamente", "Error actualizando NLP")
+}
+
+# Escritor en segundo plano de metadatos (un solo hilo mantiene el orden de escritura)
+_metadata_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='training-metadata')
+
+
+def _metadata_default(value):
+    """Valores no JSON de los metadatos: NumPy como tipos nativos, el resto (fechas incluidas) con str"""
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    return str(value)
+
+
+def _serialize_metadata(results: Dict) -> bytes:
+    """Serializar metadatos a JSON indentado; orjson y json producen el mismo texto"""
+    if orjson is not None:
+        # Fechas por default (str) como en json, en lugar del RFC 3339 nativo de orjson
+        return orjson.dumps(
+            results,
+            default=_metadata_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    
+    return json.dumps(results, indent=2, default=_metadata_default, ensure_ascii=False).encode('utf-8')
+
+
+def _deserialize_json(payload: bytes):
+    """Leer JSON con orjson si está disponible"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    
+    return json.loads(payload)
+
+class ModelTrainer:
+    """Clase para entrenar y evaluar todos los modelos ML"""
+    
+    def __init__(self, config=None):
+        self.config = config or {}
+        self.models = {}
+        self.training_results = {}
+        self._stats = None
+        # Fecha de referencia común a todas las consultas de una ejecución
+        self._run_ts = datetime.now()
+        self._run_date = self._run_ts.date()
+        self.models_dir = self.config.get('MODELS_FOLDER', 'data/trained_models')
+        
+        # Crear directorio de modelos si no existe
+        os.makedirs(self.models_dir, exist_ok=True)
+        
+        self.logger = logging.getLogger(__name__)
+    
+    def train_all_models(self, force_retrain=False) -> Dict:
+        """Entrenar todos los modelos del sistema"""
+        self._run_ts = datetime.now()
+        self._run_date = self._run_ts.date()
+        
+        results = {
+            'timestamp': self._run_ts.isoformat(),
+            'success': True,
+            'models_trained': [],
+            'errors': [],
+            'performance': {}
+        }
+        
+        try:
+            self.logger.info("=== INICIANDO ENTRENAMIENTO COMPLETO ===")
+            
+            # 1. Validar datos antes del entrenamiento
+            if not self._validate_training_data():
+                raise ValueError("Datos insuficientes para entrenamiento")
+            
+            # 2-5. Clustering, predicción de ventas y NLP son independientes: se
+            # entrenan en paralelo. Los modelos por producto esperan a la predicción
+            # porque reutilizan su predictor.
+            app = current_app._get_current_object()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                pending = {
+                    executor.submit(self._run_in_app_context, app,
+                                    self._train_clustering_model, force_retrain): 'clustering',
+                    executor.submit(self._run_in_app_context, app,
+                                    self._train_prediction_model, force_retrain): 'sales_prediction',
+                    executor.submit(self._run_in_app_context, app,
+                                    self._update_nlp_model): 'nlp_processor'
+                }
+                
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        phase = pending.pop(future)
+                        success_msg, error_prefix = TRAINING_PHASE_MESSAGES[phase]
+                        try:
+                            results['performance'][phase] = future.result()
+                            results['models_trained'].append(phase)
+                            self.logger.info(success_msg)
+                        except Exception as e:
+                            error_msg = f"{error_prefix}: {e}"
+                            self.logger.error(error_msg)
+                            results['errors'].append(error_msg)
+                        
+                        if phase == 'sales_prediction':
+                            pending[executor.submit(
+                                self._run_in_app_context, app, self._train_product_models
+                            )] = 'product_models'
+            
+            # 6. Evaluar rendimiento conjunto
+            try:
+                ensemble_results = self._evaluate_ensemble_performance()
+                results['performance']['ensemble'] = ensemble_results
+                self.logger.info("✅ Evaluación de conjunto completada")
+            except Exception as e:
+                error_msg = f"Error en evaluación de conjunto: {e}"
+                self.logger.error(error_msg)
+                results['errors'].append(error_msg)
+            
+            # 7. Guardar metadatos del entrenamiento
+            self._save_training_metadata(results)
+            
+            if results['errors']:
+                results['success'] = False
+                self.logger.warning(f"Entrenamiento completado con {len(results['errors'])} errores")
+            else:
+                self.logger.info("🎉 Entrenamiento completado exitosamente")
+                
+        except Exception as e:
+            results['success'] = False
+            results['errors'].append(f"Error crítico en entrenamiento: {e}")
+            self.logger.error(f"Error crítico: {e}")
+        
+        return results
+    
+    @staticmethod
+    def _run_in_app_context(app, func, *args):
+        """Ejecutar una fase de entrenamiento dentro del contexto de la app"""
+        with app.app_context():
+            return func(*args)
+    
+    def _validate_training_data(self) -> bool:
+        """Validar que hay suficientes datos para entrenar"""
+        try:
+            cache_path = os.path.join(self.models_dir, 'validation_cache.json')
+            
+            # Reutilizar una validación reciente sin consultar la base
+            cached = self._read_validation_cache(cache_path)
+            if cached is not None:
+                self._stats = {
+                    **cached['stats'],
+                    'computed_at': datetime.fromtimestamp(cached['timestamp'])
+                }
+                self.logger.info("Validación reciente en caché, omitiendo consultas")
+                return cached['is_valid']
+            
+            # Todos los conteos en una sola consulta con agregados condicionales
+            active_products_count = db.select(
+                db.func.count(Product.id)
+            ).where(Product.is_active == True).scalar_subquery()
+            
+            total_sales, recent_sales, valid_coords, active_products = db.session.execute(db.select(
+                db.func.count(Sale.id),
+                # Distribución temporal (últimos 30 días)
+                db.func.count(db.case(
+                    (Sale.sale_date >= self._run_date - timedelta(days=30), 1)
+                )),
+                # Calidad de coordenadas
+                db.func.count(db.case(
+                    (db.and_(Sale.latitude.between(20.5, 21.5),
+                             Sale.longitude.between(-87.5, -86.5)), 1)
+                )),
+                active_products_count
+            )).one()
+            
+            # Conservar conteos para reutilizarlos en la evaluación
+            self._stats = {
+                'total_sales': total_sales,
+                'active_products': active_products,
+                'recent_sales': recent_sales,
+                'valid_coords': valid_coords,
+                'computed_at': datetime.now()
+            }
+            
+            is_valid = self._check_training_data(
+                total_sales, active_products, recent_sales, valid_coords
+            )
+            self._write_validation_cache(cache_path, is_valid)
+            return is_valid
+            
+        except Exception as e:
+            self.logger.error(f"Error validando datos: {e}")
+            return False
+    
+    def _check_training_data(self, total_sales: int, active_products: int,
+                             recent_sales: int, valid_coords: int) -> bool:
+        """Aplicar los umbrales mínimos de entrenamiento a los conteos"""
+        # Verificar cantidad de ventas
+        if total_sales < 100:
+            self.logger.warning(f"Pocas ventas para entrenamiento: {total_sales}")
+            return False
+        
+        # Verificar productos activos
+        if active_products < 5:
+            self.logger.warning(f"Pocos productos activos: {active_products}")
+            return False
+        
+        # Verificar distribución temporal
+        if recent_sales < 20:
+            self.logger.warning(f"Pocas ventas recientes: {recent_sales}")
+            return False
+        
+        # Verificar calidad de coordenadas
+        coord_quality = (valid_coords / total_sales) * 100
+        if coord_quality < 70:
+            self.logger.warning(f"Baja calidad de coordenadas: {coord_quality:.1f}%")
+        
+        self.logger.info(f"Validación exitosa: {total_sales} ventas, {active_products} productos")
+        return True
+    
+    def _read_validation_cache(self, cache_path: str) -> Optional[Dict]:
+        """Leer la validación guardada si existe y sigue vigente"""
+        try:
+            cached = _deserialize_json(Path(cache_path).read_bytes())
+        except (OSError, ValueError):
+            return None
+        
+        ttl = self.config.get('VALIDATION_TTL_SECONDS', VALIDATION_TTL_SECONDS)
+        if time.time() - cached.get('timestamp', 0) >= ttl:
+            return None
+        
+        return cached
+    
+    def _write_validation_cache(self, cache_path: str, is_valid: bool):
+        """Guardar resultado y conteos de la validación"""
+        try:
+            stats = {key: value for key, value in self._stats.items() if key != 'computed_at'}
+            Path(cache_path).write_bytes(_serialize_metadata({
+                'timestamp': time.time(),
+                'is_valid': is_valid,
+                'stats': stats
+            }))
+        except Exception as e:
+            self.logger.warning(f"Error guardando caché de validación: {e}")
+    
+    def _cached_stat(self, name: str) -> Optional[int]:
+        """Obtener un conteo de la última validación si sigue vigente"""
+        if self._stats and (datetime.now() - self._stats['computed_at']).total_seconds() < STATS_TTL_SECONDS:
+            return self._stats[name]
+        return None
+    
+    def _train_clustering_model(self, force_retrain=False) -> Dict:
+        """Entrenar modelo de clustering geográfico"""
+        model_path = os.path.join(self.models_dir, 'clustering_model.joblib')
+        
+        # Verificar si necesita reentrenamiento
+        if not force_retrain and os.path.exists(model_path):
+            model_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(model_path))
+            if model_age.days < 7:  # Reentrenar cada 7 días
+                self.logger.info("Modelo de clustering es reciente, saltando entrenamiento")
+                # Reutilizar el modelo guardado
+                clustering = GeographicClustering(self.config.get('CLUSTERING_CONFIG', {}))
+                clustering.load_model(model_path)
+                self.models['clustering'] = clustering
+                return {'status': 'skipped', 'reason': 'model_recent'}
+        
+        clustering = GeographicClustering(self.config.get('CLUSTERING_CONFIG', {}))
+        results = clustering.train_models()
+        
+        # Guardar modelo
+        clustering.save_model(model_path, compress=MODEL_COMPRESSION)
+        self.models['clustering'] = clustering
+        
+        return {
+            'status': 'trained',
+            'best_model': results['best_model'],
+            'n_clusters': results['kmeans']['n_clusters'],
+            'silhouette_score': results[results['best_model']]['silhouette_score'],
+            'data_points': results['data_points'],
+            'model_path': model_path
+        }
+    
+    def _train_prediction_model(self, force_retrain=False) -> Dict:
+        """Entrenar modelo de predicción de ventas"""
+        model_path = os.path.join(self.models_dir, 'sales_prediction.joblib')
+        
+        # Verificar si necesita reentrenamiento
+        if not force_retrain and os.path.exists(model_path):
+            model_age = datetime.now() - datetime.fromtimestamp(os.path.getmtime(model_path))
+            if model_age.days < 3:  # Reentrenar cada 3 días
+                self.logger.info("Modelo de predicción es reciente, saltando entrenamiento")
+                # Reutilizar el modelo guardado
+                predictor = SalesPredictor(self.config.get('PREDICTION_CONFIG', {}))
+                predictor.load_model(model_path)
+                self.models['predictor'] = predictor
+                return {'status': 'skipped', 'reason': 'model_recent'}
+        
+        predictor = SalesPredictor(self.config.get('PREDICTION_CONFIG', {}))
+        results = predictor.train_all_models()
+        
+        # Guardar modelo
+        predictor.save_model(model_path, compress=MODEL_COMPRESSION)
+        self.models['predictor'] = predictor
+        
+        return {
+            'status': 'trained',
+            'arima_mae': results['arima_results']['mae'],
+            'arima_rmse': results['arima_results']['rmse'],
+            'rf_test_r2': results['random_forest_results']['test_r2'],
+            'rf_test_mae': results['random_forest_results']['test_mae'],
+            'predictions_generated': results['predictions_generated'],
+            'model_path': model_path
+        }
+    
+    def _train_product_models(self) -> Dict:
+        """Entrenar modelos específicos por producto top"""
+        try:
+            # Obtener productos con más ventas (top 10)
+            top_products = db.session.query(
+                Product.id,
+                Product.name,
+                db.func.count(Sale.id).label('sales_count')
+            ).join(Sale).filter(
+                Product.is_active == True,
+                Sale.sale_date >= self._run_date - timedelta(days=90)
+            ).group_by(Product.id, Product.name)\
+             .order_by(db.desc('sales_count')).limit(10).all()
+            
+            product_results = {}
+            all_predictions = []
+            predictor = self.models.get('predictor') or SalesPredictor()
+            app = current_app._get_current_object()
+            
+            # Ventas de todos los productos top en una sola lectura
+            top_ids = [product_id for product_id, _, _ in top_products]
+            sales_query = db.select(
+                Sale.product_id,
+                Sale.sale_date.label('date'),
+                Sale.quantity,
+                Sale.total_price.label('price')
+            ).where(
+                Sale.product_id.in_(top_ids),
+                Sale.sale_date >= self._run_date - timedelta(days=90)
+            )
+            sales_df = pd.read_sql(sales_query, db.session.connection())
+            sales_by_product = dict(tuple(sales_df.groupby('product_id')))
+            
+            # Ventas reales de los últimos 7 días por producto y fecha (para evaluar la precisión)
+            recent_cutoff = self._run_date - timedelta(days=7)
+            sale_dates = pd.to_datetime(sales_df['date']).dt.date
+            recent_totals = sales_df.loc[sale_dates >= recent_cutoff, ['product_id', 'quantity']]\
+                .assign(date=sale_dates).groupby(['product_id', 'date'])['quantity'].sum()
+            actuals_by_product = {}
+            for (product_id, sale_date), quantity in recent_totals.items():
+                actuals_by_product.setdefault(product_id, {})[sale_date] = float(quantity)
+            
+            # Sin ventas en los últimos 7 días no hay con qué evaluar: omitir antes de predecir
+            with_recent_sales = set(actuals_by_product)
+            
+            for product_id, product_name, sales_count in top_products:
+                if product_id not in with_recent_sales:
+                    product_results[product_id] = {
+                        'name': product_name,
+                        'sales_count': sales_count,
+                        'status': 'skipped',
+                        'reason': 'no_recent_sales'
+                    }
+            
+            # Entrenar productos en paralelo; cada hilo abre su propio contexto de app
+            outcomes = Parallel(n_jobs=self.config.get('N_JOBS', -1), prefer='threads')(
+                delayed(self._train_one_product)(
+                    app, predictor, product_id, product_name, sales_count,
+                    sales_by_product[product_id], actuals_by_product[product_id]
+                )
+                for product_id, product_name, sales_count in top_products
+                if product_id in with_recent_sales
+            )
+            
+            for product_id, product_result, predictions in outcomes:
+                if product_result is not None:
+                    product_results[product_id] = product_result
+                all_predictions.extend(predictions)
+            
+            # Guardar todas las predicciones en BD de una sola vez
+            if all_predictions:
+                predictor.save_predictions_to_db(all_predictions, 'product', bulk=True)
+            
+            accuracies = np.fromiter(
+                (p['accuracy_score'] for p in product_results.values() if p.get('accuracy_score')),
+                dtype=np.float64
+            )
+            
+            return {
+                'status': 'completed',
+                'products_trained': len([p for p in product_results.values() if p.get('status') == 'trained']),
+                'products_failed': len([p for p in product_results.values() if p.get('status') == 'failed']),
+                'average_accuracy': float(accuracies.mean()) if accuracies.size else 0.0,
+                'details': product_results
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error en entrenamiento por productos: {e}")
+            return {'status': 'failed', 'error': str(e)}
+    
+    def _train_one_product(self, app, predictor: SalesPredictor, product_id: int,
+                           product_name: str, sales_count: int, product_sales: pd.DataFrame,
+                           actual_by_date: Dict[date, float]):
+        """Generar y evaluar predicciones de un producto (ejecutado en un hilo)"""
+        with app.app_context():
+            try:
+                # Entrenar modelo específico para este producto
+                predictions = predictor.generate_product_predictions_from_df(
+                    product_id, product_sales, 7, now=self._run_ts
+                )
+                
+                if not predictions:
+                    return product_id, None, []
+                
+                # Evaluar precisión si hay datos históricos
+                accuracy = self._evaluate_product_model_accuracy(product_id, predictions, actual_by_date)
+                
+                return product_id, {
+                    'name': product_name,
+                    'sales_count': sales_count,
+                    'predictions_generated': len(predictions),
+                    'accuracy_score': accuracy,
+                    'status': 'trained'
+                }, predictions
+                
+            except Exception as e:
+                self.logger.warning(f"Error entrenando producto {product_name}: {e}")
+                return product_id, {
+                    'name': product_name,
+                    'status': 'failed',
+                    'error': str(e)
+                }, []
+    
+    def _evaluate_product_model_accuracy(self, product_id: int, predictions: List[Dict],
+                                         actual_by_date: Dict[date, float]) -> float:
+        """Evaluar precisión del modelo de producto contra sus ventas reales por fecha (últimos 7 días)"""
+        try:
+            if not actual_by_date:
+                return 0.0
+            
+            # Alinear ventas reales con las fechas de las predicciones (búsqueda O(1) por fecha)
+            aligned = np.fromiter(
+                (actual_by_date.get(date.fromisoformat(p['date'][:10]), np.nan) for p in predictions),
+                dtype=np.float64, count=len(predictions)
+            )
+            predicted = np.fromiter(
+                (p.get('predicted_quantity', 0) for p in predictions),
+                dtype=np.float64, count=len(predictions)
+            )
+            
+            # Precisión como 1 - error_relativo, solo en fechas con ventas reales
+            mask = aligned > 0
+            accuracy_scores = np.clip(
+                1 - np.abs(predicted[mask] - aligned[mask]) / aligned[mask], 0, None
+            )
+            
+            return float(accuracy_scores.mean()) * 100 if accuracy_scores.size else 0.0
+            
+        except Exception as e:
+            self.logger.warning(f"Error evaluando precisión producto {product_id}: {e}")
+            return 0.0
+    
+    def _update_nlp_model(self) -> Dict:
+        """Actualizar cache y configuración del procesador NLP"""
+        try:
+            nlp_processor = NLPProcessor(self.config.get('NLP_CONFIG', {}))
+            
+            # Refrescar cache de productos
+            nlp_processor.refresh_products_cache()
+            
+            # Evaluar calidad del procesamiento con mensajes de ejemplo
+            test_messages = [
+                "Ubicación: https://maps.google.com/?q=21.1619,-86.8515 Cliente: 123 nupec adulto 20kg cantidad: 2 precio: $3600",
+                "nexgard spectra 15-30kg 1 pieza $360 ref: casa azul",
+                "pro plan adult 15kg x3 total $6300 coordenadas: 21.1692, -86.8980"
+            ]
+            
+            # Parsear y validar todo el lote de una vez
+            parsing_results = nlp_processor.parse_many(test_messages)
+            
+            avg_confidence = float(parsing_results['confidence'].mean()) if len(parsing_results) else 0
+            success_rate = float(parsing_results['valid'].mean()) if len(parsing_results) else 0
+            
+            return {
+                'status': 'updated',
+                'products_cached': len(nlp_processor.products_cache),
+                'avg_parsing_confidence': avg_confidence,
+                'parsing_success_rate': success_rate * 100,
+                'test_messages_processed': len(parsing_results)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error actualizando NLP: {e}")
+            return {'status': 'failed', 'error': str(e)}
+    
+    def _evaluate_ensemble_performance(self) -> Dict:
+        """Evaluar rendimiento conjunto de todos los modelos"""
+        try:
+            results = {
+                'evaluation_date': datetime.now().isoformat(),
+                'models_evaluated': 0,
+                'overall_score': 0,
+                'recommendations': []
+            }
+            
+            # Evaluar clustering
+            if 'clustering' in self.models:
+                clustering_score = self._evaluate_clustering_quality()
+                results['clustering_quality'] = clustering_score
+                results['models_evaluated'] += 1
+            
+            # Evaluar predicciones recientes
+            prediction_accuracy = self._evaluate_recent_predictions()
+            results['prediction_accuracy'] = prediction_accuracy
+            if prediction_accuracy > 0:
+                results['models_evaluated'] += 1
+            
+            # Calcular score general
+            scores = np.fromiter((s for s in (
+                results.get('clustering_quality', 0),
+                results.get('prediction_accuracy', 0)
+            ) if s > 0), dtype=np.float64)
+            
+            results['overall_score'] = float(scores.mean()) if scores.size else 0.0
+            
+            # Generar recomendaciones
+            if results['overall_score'] < 70:
+                results['recommendations'].append("Considerar reentrenamiento con más datos")
+            
+            if results.get('clustering_quality', 0) < 60:
+                results['recommendations'].append("Ajustar parámetros de clustering")
+            
+            if results.get('prediction_accuracy', 0) < 75:
+                results['recommendations'].append("Revisar modelos de predicción")
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error evaluando conjunto: {e}")
+            return {'status': 'failed', 'error': str(e)}
+    
+    def _evaluate_clustering_quality(self) -> float:
+        """Evaluar calidad del clustering actual"""
+        try:
+            # Distribución entre clusters (incluye el grupo sin asignar) en una sola consulta
+            cluster_distribution = db.session.execute(db.select(
+                Sale.cluster_id,
+                db.func.count(Sale.id)
+            ).group_by(Sale.cluster_id)).all()
+            
+            cluster_counts = np.fromiter(
+                (count for cluster_id, count in cluster_distribution if cluster_id is not None),
+                dtype=np.int64
+            )
+            clustered_sales = int(cluster_counts.sum())
+            
+            total_sales = self._cached_stat('total_sales')
+            if total_sales is None:
+                total_sales = sum(count for _, count in cluster_distribution)
+            
+            if total_sales == 0:
+                return 0.0
+            
+            # Porcentaje de ventas asignadas a clusters
+            assignment_rate = (clustered_sales / total_sales) * 100
+            
+            if not cluster_counts.size:
+                return assignment_rate * 0.5  # Penalizar si no hay distribución
+            
+            # Calcular balance entre clusters (evitar clusters muy desbalanceados)
+            balance_score = 1 - (cluster_counts.std() / cluster_counts.mean())
+            balance_score = max(0, min(1, balance_score)) * 100
+            
+            # Score final combinado
+            quality_score = (assignment_rate * 0.7) + (balance_score * 0.3)
+            
+            return min(100, quality_score)
+            
+        except Exception as e:
+            self.logger.warning(f"Error evaluando clustering: {e}")
+            return 0.0
+    
+    def _evaluate_recent_predictions(self) -> float:
+        """Evaluar precisión de predicciones recientes"""
+        try:
+            # Obtener predicciones de los últimos 7 días
+            week_ago = self._run_date - timedelta(days=7)
+            
+            recent_predictions = db.session.execute(db.select(
+                Prediction.target_date,
+                Prediction.predicted_value
+            ).where(
+                Prediction.target_date >= week_ago,
+                Prediction.target_date < self._run_date,
+                Prediction.prediction_type == 'daily',
+                Prediction.is_active == True
+            )).all()
+            
+            if not recent_predictions:
+                return 0.0
+            
+            # Ventas reales de todas las fechas en una sola consulta agrupada
+            dates = {pred.target_date for pred in recent_predictions}
+            actual_by_date = dict(db.session.execute(db.select(
+                Sale.sale_date,
+                db.func.count(Sale.id)
+            ).where(
+                Sale.sale_date.in_(dates)
+            ).group_by(Sale.sale_date)).all())
+            
+            predicted = np.fromiter(
+                (pred.predicted_value for pred in recent_predictions),
+                dtype=np.float64, count=len(recent_predictions)
+            )
+            actual = np.fromiter(
+                (actual_by_date.get(pred.target_date, 0) for pred in recent_predictions),
+                dtype=np.float64, count=len(recent_predictions)
+            )
+            
+            mask = actual > 0
+            accuracy_scores = np.clip(
+                1 - np.abs(predicted[mask] - actual[mask]) / actual[mask], 0, None
+            )
+            
+            return float(accuracy_scores.mean()) * 100 if accuracy_scores.size else 0.0
+            
+        except Exception as e:
+            self.logger.warning(f"Error evaluando predicciones: {e}")
+            return 0.0
+    
+    def _save_training_metadata(self, results: Dict):
+        """Guardar metadatos del entrenamiento"""
+        try:
+            metadata_path = os.path.join(self.models_dir, 'training_metadata.json')
+            
+            # Serializar ahora (results puede cambiar después) y escribir en segundo plano
+            payload = _serialize_metadata(results)
+            _metadata_writer.submit(self._write_metadata_file, metadata_path, payload)
+            
+        except Exception as e:
+            self.logger.warning(f"Error guardando metadatos: {e}")
+    
+    def _write_metadata_file(self, metadata_path: str, payload: bytes):
+        """Escribir metadatos serializados en disco"""
+        try:
+            Path(metadata_path).write_bytes(payload)
+            self.logger.info(f"Metadatos guardados en: {metadata_path}")
+            
+        except Exception as e:
+            self.logger.warning(f"Error guardando metadatos: {e}")
+    
+    def get_model_status(self) -> Dict:
+        """Obtener estado de todos los modelos"""
+        try:
+            status = {
+                'timestamp': datetime.now().isoformat(),
+                'models': {}
+            }
+            
+            # Verificar archivos de modelos
+            model_files = {
+                'clustering': 'clustering_model.joblib',
+                'sales_prediction': 'sales_prediction.joblib',
+                'training_metadata': 'training_metadata.json'
+            }
+            
+            # Un solo recorrido del directorio con los stat de cada archivo
+            with os.scandir(self.models_dir) as entries:
+                file_stats = {entry.name: entry.stat() for entry in entries if entry.is_file()}
+            
+            for model_name, filename in model_files.items():
+                stat = file_stats.get(filename)
+                
+                if stat is not None:
+                    status['models'][model_name] = {
+                        'exists': True,
+                        'size_mb': round(stat.st_size / (1024 * 1024), 2),
+                        'last_modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                        'age_days': (datetime.now() - datetime.fromtimestamp(stat.st_mtime)).days
+                    }
+                else:
+                    status['models'][model_name] = {
+                        'exists': False,
+                        'size_mb': 0,
+                        'last_modified': None,
+                        'age_days': None
+                    }
+            
+            return status
+            
+        except Exception as e:
+            self.logger.error(f"Error obteniendo estado de modelos: {e}")
+            return {'error': str(e)}
+    
+    def cleanup_old_models(self, days_old=30):
+        """Limpiar modelos antiguos"""
+        try:
+            cleaned_files = []
+            
+            with os.scandir(self.models_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.joblib', '.pkl')):
+                        # Verificar edad del archivo
+                        file_age = datetime.now() - datetime.fromtimestamp(entry.stat().st_mtime)
+                        
+                        if file_age.days > days_old:
+                            os.remove(entry.path)
+                            cleaned_files.append(entry.name)
+                            self.logger.info(f"Archivo limpiado: {entry.name}")
+            
+            return {
+                'cleaned_files': cleaned_files,
+                'count': len(cleaned_files)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error limpiando modelos: {e}")
             return {'error': str(e)}
\ No newline at end of file
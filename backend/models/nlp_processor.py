@@ -1,451 +1,776 @@
-# models/nlp_processor.py - Procesador de Lenguaje Natural
-import re
-import spacy
-import pandas as pd
-import thef # Nueva forma recomendada
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
-from typing import Dict, List, Tuple, Optional
-import logging
-from datetime import datetime
-
-from database.connection import db
-from database.models import Product
-
-class NLPProcessor:
-    """Procesador de lenguaje natural para parsing de mensajes de WhatsApp"""
-    
-    def __init__(self, config=None):
-        self.config = config or {}
-        self.similarity_threshold = self.config.get('similarity_threshold', 0.7)
-        self.max_product_distance = self.config.get('max_product_distance', 3)
-        
-        # Inicializar spaCy (si está disponible)
-        try:
-            self.nlp = spacy.load('es_core_news_sm')
-        except OSError:
-            self.nlp = None
-            logging.warning("Modelo de spaCy no encontrado. Usando métodos alternativos.")
-        
-        # Vectorizador TF-IDF para similitud de productos
-        self.tfidf = TfidfVectorizer(
-            lowercase=True,
-            stop_words=None,  # Mantenemos stop words para productos
-            ngram_range=(1, 3),
-            max_features=1000
-        )
-        
-        # Cache de productos y embeddings
-        self.products_cache = {}
-        self.product_embeddings = None
-        self.product_names = []
-        
-        self.logger = logging.getLogger(__name__)
-        self._load_products()
-    
-    def _load_products(self):
-        """Cargar productos desde base de datos"""
-        try:
-            products = db.session.query(Product).filter(Product.is_active == True).all()
-            
-            self.products_cache = {}
-            product_texts = []
-            
-            for product in products:
-                # Crear texto searchable del producto
-                search_text = f"{product.name} {product.brand} {product.category}"
-                if product.weight_size:
-                    search_text += f" {product.weight_size}"
-                
-                self.products_cache[product.id] = {
-                    'name': product.name,
-                    'brand': product.brand,
-                    'category': product.category,
-                    'weight_size': product.weight_size,
-                    'price': float(product.price),
-                    'search_text': search_text.lower()
-                }
-                
-                product_texts.append(search_text.lower())
-                self.product_names.append(product.name.lower())
-            
-            # Generar embeddings TF-IDF
-            if product_texts:
-                self.product_embeddings = self.tfidf.fit_transform(product_texts)
-            
-            self.logger.info(f"Productos cargados: {len(self.products_cache)}")
-            
-        except Exception as e:
-            self.logger.error(f"Error cargando productos: {e}")
-            self.products_cache = {}
-    
-    def parse_whatsapp_message(self, message: str) -> Dict:
-        """Parsear mensaje de WhatsApp para extraer información de pedido"""
-        try:
-            parsed_data = {
-                'coordinates': None,
-                'products': [],
-                'client_number': None,
-                'references': None,
-                'total_price': None,
-                'raw_message': message,
-                'confidence': 0.0
-            }
-            
-            # Limpiar mensaje
-            clean_message = self._clean_message(message)
-            
-            # Extraer coordenadas
-            coordinates = self._extract_coordinates(clean_message)
-            if coordinates:
-                parsed_data['coordinates'] = coordinates
-                parsed_data['confidence'] += 0.3
-            
-            # Extraer productos
-            products = self._extract_products(clean_message)
-            if products:
-                parsed_data['products'] = products
-                parsed_data['confidence'] += 0.4
-            
-            # Extraer número de cliente
-            client_number = self._extract_client_number(clean_message)
-            if client_number:
-                parsed_data['client_number'] = client_number
-                parsed_data['confidence'] += 0.1
-            
-            # Extraer referencias
-            references = self._extract_references(clean_message)
-            if references:
-                parsed_data['references'] = references
-                parsed_data['confidence'] += 0.1
-            
-            # Extraer precio total
-            total_price = self._extract_total_price(clean_message)
-            if total_price:
-                parsed_data['total_price'] = total_price
-                parsed_data['confidence'] += 0.1
-            
-            self.logger.info(f"Mensaje parseado con confianza: {parsed_data['confidence']:.2f}")
-            return parsed_data
-            
-        except Exception as e:
-            self.logger.error(f"Error parseando mensaje: {e}")
-            return {'error': str(e), 'confidence': 0.0}
-    
-    def _clean_message(self, message: str) -> str:
-        """Limpiar y normalizar mensaje"""
-        # Remover caracteres especiales innecesarios
-        clean = re.sub(r'[^\w\s.,:\-()/$]', ' ', message)
-        
-        # Normalizar espacios
-        clean = re.sub(r'\s+', ' ', clean)
-        
-        # Convertir a minúsculas
-        clean = clean.lower().strip()
-        
-        return clean
-    
-    def _extract_coordinates(self, message: str) -> Optional[Tuple[float, float]]:
-        """Extraer coordenadas de Google Maps"""
-        patterns = self.config.get('google_maps_patterns', [
-            r'https://maps\.google\.com/\?q=([0-9.-]+),([0-9.-]+)',
-            r'https://goo\.gl/maps/[a-zA-Z0-9]+',
-            r'ubicación[:\s]*([0-9.-]+)[,\s]+([0-9.-]+)',
-            r'coordenadas[:\s]*([0-9.-]+)[,\s]+([0-9.-]+)',
-            r'([0-9]{2}\.[0-9]+)[,\s]+(-[0-9]{2}\.[0-9]+)'
-        ])
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                try:
-                    if 'goo.gl' in pattern:
-                        # Para links acortados, necesitaríamos expandir la URL
-                        # Por ahora retornamos None y pedimos coordenadas directas
-                        continue
-                    
-                    lat = float(match.group(1))
-                    lng = float(match.group(2))
-                    
-                    # Validar que las coordenadas estén en Cancún/Riviera Maya
-                    if (20.5 <= lat <= 21.5) and (-87.5 <= lng <= -86.5):
-                        return (lat, lng)
-                        
-                except (ValueError, IndexError):
-                    continue
-        
-        return None
-    
-    def _extract_products(self, message: str) -> List[Dict]:
-        """Extraer productos del mensaje"""
-        products = []
-        
-        # Buscar productos por similitud
-        similar_products = self._find_similar_products(message)
-        
-        for product_match in similar_products:
-            product_info = product_match['product']
-            
-            # Buscar cantidad cerca del producto
-            quantity = self._extract_quantity_near_product(
-                message, product_match['matched_text']
-            )
-            
-            products.append({
-                'product_id': product_match['product_id'],
-                'name': product_info['name'],
-                'brand': product_info['brand'],
-                'category': product_info['category'],
-                'weight_size': product_info['weight_size'],
-                'price': product_info['price'],
-                'quantity': quantity,
-                'confidence': product_match['confidence'],
-                'matched_text': product_match['matched_text']
-            })
-        
-        return products
-    
-    def _find_similar_products(self, message: str) -> List[Dict]:
-        """Encontrar productos similares en el mensaje"""
-        if not self.products_cache or self.product_embeddings is None:
-            return []
-        
-        similar_products = []
-        
-        # Método 1: Búsqueda por similitud TF-IDF
-        message_vector = self.tfidf.transform([message])
-        similarities = cosine_similarity(message_vector, self.product_embeddings).flatten()
-        
-        for idx, similarity in enumerate(similarities):
-            if similarity > self.similarity_threshold:
-                product_id = list(self.products_cache.keys())[idx]
-                similar_products.append({
-                    'product_id': product_id,
-                    'product': self.products_cache[product_id],
-                    'confidence': similarity,
-                    'matched_text': self.products_cache[product_id]['search_text'],
-                    'method': 'tfidf'
-                })
-        
-        # Método 2: Búsqueda fuzzy por nombre de producto
-        for product_id, product_info in self.products_cache.items():
-            # Buscar por nombre completo
-            ratio = fuzz.partial_ratio(message, product_info['name'].lower())
-            if ratio > 80:  # 80% de similitud
-                similar_products.append({
-                    'product_id': product_id,
-                    'product': product_info,
-                    'confidence': ratio / 100.0,
-                    'matched_text': product_info['name'],
-                    'method': 'fuzzy_name'
-                })
-            
-            # Buscar por marca + características
-            brand_pattern = product_info['brand'].lower()
-            if brand_pattern in message:
-                # Buscar peso/tamaño cerca de la marca
-                weight_match = re.search(
-                    f"{brand_pattern}.*?([0-9]+)\\s*(kg|g|ml)",
-                    message, re.IGNORECASE
-                )
-                if weight_match and product_info['weight_size']:
-                    weight_in_product = re.search(r'([0-9]+)', product_info['weight_size'])
-                    if weight_in_product:
-                        if weight_match.group(1) == weight_in_product.group(1):
-                            similar_products.append({
-                                'product_id': product_id,
-                                'product': product_info,
-                                'confidence': 0.9,
-                                'matched_text': f"{brand_pattern} {weight_match.group(1)}{weight_match.group(2)}",
-                                'method': 'brand_weight'
-                            })
-        
-        # Remover duplicados y ordenar por confianza
-        unique_products = {}
-        for product in similar_products:
-            product_id = product['product_id']
-            if product_id not in unique_products or product['confidence'] > unique_products[product_id]['confidence']:
-                unique_products[product_id] = product
-        
-        return sorted(unique_products.values(), key=lambda x: x['confidence'], reverse=True)
-    
-    def _extract_quantity_near_product(self, message: str, product_text: str) -> int:
-        """Extraer cantidad cerca del texto del producto"""
-        # Buscar números cerca del producto mencionado
-        product_pos = message.find(product_text.lower())
-        if product_pos == -1:
-            # Buscar patrones generales de cantidad
-            quantity_patterns = [
-                r'cantidad[:\s]*([0-9]+)',
-                r'([0-9]+)\s*piezas?',
-                r'([0-9]+)\s*unidades?',
-                r'([0-9]+)\s*pzas?'
-            ]
-            
-            for pattern in quantity_patterns:
-                match = re.search(pattern, message, re.IGNORECASE)
-                if match:
-                    return int(match.group(1))
-            
-            return 1  # Cantidad por defecto
-        
-        # Buscar en un rango de 50 caracteres antes y después del producto
-        start = max(0, product_pos - 50)
-        end = min(len(message), product_pos + len(product_text) + 50)
-        context = message[start:end]
-        
-        # Buscar números en el contexto
-        numbers = re.findall(r'([0-9]+)', context)
-        if numbers:
-            # Tomar el primer número encontrado
-            try:
-                quantity = int(numbers[0])
-                return min(quantity, 1000)  # Límite máximo de 1000
-            except ValueError:
-                pass
-        
-        return 1
-    
-    def _extract_client_number(self, message: str) -> Optional[str]:
-        """Extraer número de cliente"""
-        patterns = self.config.get('client_patterns', [
-            r'cliente[:\s]*([0-9]+)',
-            r'#([0-9]+)',
-            r'client[e]?[:\s]*([0-9]+)'
-        ])
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return None
-    
-    def _extract_references(self, message: str) -> Optional[str]:
-        """Extraer referencias del mensaje"""
-        patterns = self.config.get('reference_patterns', [
-            r'referencia[s]?[:\s]*(.+?)(?:\n|precio|total|$)',
-            r'ref[:\s]*(.+?)(?:\n|precio|total|$)',
-            r'referencias?[:\s]*(.+?)(?:\n|precio|total|$)'
-        ])
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        
-        return None
-    
-    def _extract_total_price(self, message: str) -> Optional[float]:
-        """Extraer precio total del mensaje"""
-        patterns = [
-            r'total[:\s]*\$?([0-9]+(?:\.[0-9]{2})?)',
-            r'precio[:\s]*\$?([0-9]+(?:\.[0-9]{2})?)',
-            r'\$([0-9]+(?:\.[0-9]{2})?)',
-            r'([0-9]+(?:\.[0-9]{2})?)\s*pesos'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                try:
-                    return float(match.group(1))
-                except ValueError:
-                    continue
-        
-        return None
-    
-    def suggest_product_corrections(self, message: str, max_suggestions: int = 3) -> List[Dict]:
-        """Sugerir correcciones para productos no encontrados"""
-        suggestions = []
-        
-        if not self.products_cache:
-            return suggestions
-        
-        # Extraer posibles nombres de productos del mensaje
-        words = message.split()
-        potential_products = []
-        
-        # Buscar secuencias de palabras que podrían ser productos
-        for i in range(len(words)):
-            for j in range(i + 1, min(i + 4, len(words) + 1)):  # Hasta 3 palabras
-                phrase = ' '.join(words[i:j])
-                if len(phrase) > 3:  # Mínimo 3 caracteres
-                    potential_products.append(phrase)
-        
-        # Para cada frase potencial, buscar productos similares
-        for phrase in potential_products:
-            matches = process.extract(
-                phrase,
-                self.product_names,
-                scorer=fuzz.partial_ratio,
-                limit=max_suggestions
-            )
-            
-            for match, score in matches:
-                if score > 60:  # Umbral mínimo de similitud
-                    # Encontrar el producto correspondiente
-                    for product_id, product_info in self.products_cache.items():
-                        if product_info['name'].lower() == match:
-                            suggestions.append({
-                                'original_text': phrase,
-                                'suggested_product': product_info['name'],
-                                'product_id': product_id,
-                                'similarity_score': score,
-                                'brand': product_info['brand'],
-                                'category': product_info['category']
-                            })
-                            break
-        
-        # Remover duplicados y ordenar por score
-        unique_suggestions = {}
-        for suggestion in suggestions:
-            key = suggestion['suggested_product']
-            if key not in unique_suggestions or suggestion['similarity_score'] > unique_suggestions[key]['similarity_score']:
-                unique_suggestions[key] = suggestion
-        
-        return sorted(unique_suggestions.values(), 
-                     key=lambda x: x['similarity_score'], reverse=True)[:max_suggestions]
-    
-    def validate_parsed_data(self, parsed_data: Dict) -> Dict:
-        """Validar y completar datos parseados"""
-        validation_result = {
-            'is_valid': True,
-            'warnings': [],
-            'errors': [],
-            'suggested_corrections': []
-        }
-        
-        # Validar coordenadas
-        if not parsed_data.get('coordinates'):
-            validation_result['errors'].append('No se encontraron coordenadas válidas')
-            validation_result['is_valid'] = False
-        
-        # Validar productos
-        if not parsed_data.get('products'):
-            validation_result['errors'].append('No se encontraron productos válidos')
-            validation_result['is_valid'] = False
-            
-            # Sugerir correcciones
-            suggestions = self.suggest_product_corrections(parsed_data.get('raw_message', ''))
-            if suggestions:
-                validation_result['suggested_corrections'] = suggestions
-        else:
-            # Validar que los productos tengan cantidad
-            for product in parsed_data['products']:
-                if product['quantity'] <= 0:
-                    validation_result['warnings'].append(
-                        f"Cantidad no válida para {product['name']}: {product['quantity']}"
-                    )
-        
-        # Validar confianza general
-        if parsed_data.get('confidence', 0) < 0.5:
-            validation_result['warnings'].append('Confianza baja en el parsing del mensaje')
-        
-        return validation_result
-    
-    def refresh_products_cache(self):
-        """Refrescar cache de productos"""
-        self._load_products()
+# models/nlp_processor.py - Procesador de Lenguaje Natural
+import re
+import copy
+import functools
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import normalize
+from rapidfuzz import fuzz, process
+import numpy as np
+from typing import Dict, List, Tuple, Optional
+import logging
+import threading
+from bisect import bisect_left
+from datetime import datetime
+
+from database.connection import db
+from database.models import Product
+
+# Hyperscan es opcional: si no está instalado se ejecutan todos los extractores
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# pyahocorasick es opcional: sin él la posición de cada producto se busca con find
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Expresiones compiladas una sola vez (re.IGNORECASE salvo en la limpieza)
+_CLEAN_SPECIAL_RE = re.compile(r'[^\w\s.,:\-()/$]')
+# Misma regla de limpieza como tabla de traducción para los primeros 256 caracteres
+_CLEAN_TABLE = str.maketrans({
+    chr(code): ' ' for code in range(256) if _CLEAN_SPECIAL_RE.match(chr(code))
+})
+_NUMBER_RE = re.compile(r'([0-9]+)')
+_WEIGHT_RE = re.compile(r'([0-9]+)\s*(kg|g|ml)', re.IGNORECASE)
+
+_COORD_PATTERNS = (
+    r'https://maps\.google\.com/\?q=([0-9.-]+),([0-9.-]+)',
+    r'https://goo\.gl/maps/[a-zA-Z0-9]+',
+    r'ubicación[:\s]*([0-9.-]+)[,\s]+([0-9.-]+)',
+    r'coordenadas[:\s]*([0-9.-]+)[,\s]+([0-9.-]+)',
+    r'([0-9]{2}\.[0-9]+)[,\s]+(-[0-9]{2}\.[0-9]+)'
+)
+
+_CLIENT_PATTERNS = (
+    r'cliente[:\s]*([0-9]+)',
+    r'#([0-9]+)',
+    r'client[e]?[:\s]*([0-9]+)'
+)
+
+_REFERENCE_PATTERNS = (
+    r'referencia[s]?[:\s]*(.+?)(?:\n|precio|total|$)',
+    r'ref[:\s]*(.+?)(?:\n|precio|total|$)',
+    r'referencias?[:\s]*(.+?)(?:\n|precio|total|$)'
+)
+
+_QUANTITY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'cantidad[:\s]*([0-9]+)',
+    r'([0-9]+)\s*piezas?',
+    r'([0-9]+)\s*unidades?',
+    r'([0-9]+)\s*pzas?'
+))
+
+_PRICE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'total[:\s]*\$?([0-9]+(?:\.[0-9]{2})?)',
+    r'precio[:\s]*\$?([0-9]+(?:\.[0-9]{2})?)',
+    r'\$([0-9]+(?:\.[0-9]{2})?)',
+    r'([0-9]+(?:\.[0-9]{2})?)\s*pesos'
+))
+
+
+def _compile_patterns(patterns) -> Tuple[re.Pattern, ...]:
+    """Compilar una lista de patrones sin distinguir mayúsculas"""
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+def _combine_coordinate_patterns(patterns) -> Tuple[Optional[re.Pattern], Tuple[Tuple[int, int], ...]]:
+    """Unir los patrones con lat/lng en una sola alternancia y ubicar sus grupos"""
+    parts, groups, offset = [], [], 0
+    for pattern in patterns:
+        if pattern.groups < 2:
+            continue
+        parts.append(f'(?:{pattern.pattern})')
+        groups.append((offset + 1, offset + 2))
+        offset += pattern.groups
+    
+    if not parts:
+        return None, ()
+    
+    try:
+        return re.compile('|'.join(parts), re.IGNORECASE), tuple(groups)
+    except re.error:
+        # Patrones que no se pueden unir (p.ej. grupos con nombre repetidos)
+        return None, ()
+
+
+def _index_numbers(message: str) -> Tuple[List[int], List[int]]:
+    """Posiciones y valores de los números del mensaje (un solo recorrido)"""
+    starts, values = [], []
+    for match in _NUMBER_RE.finditer(message):
+        starts.append(match.start())
+        values.append(int(match.group(1)))
+    return starts, values
+
+
+def _rank_unique(keys: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """Índices del mejor puntaje por clave, ordenados por puntaje descendente"""
+    # Orden estable: en empates gana (y va primero) el de menor índice
+    order = np.argsort(-scores, kind='stable')
+    _, first = np.unique(keys[order], return_index=True)
+    return order[np.sort(first)]
+
+
+class NLPProcessor:
+    """Procesador de lenguaje natural para parsing de mensajes de WhatsApp"""
+    
+    def __init__(self, config=None):
+        self.config = config or {}
+        self.similarity_threshold = self.config.get('similarity_threshold', 0.7)
+        self.max_product_distance = self.config.get('max_product_distance', 3)
+        
+        # Patrones configurables compilados una sola vez
+        self._coord_patterns = _compile_patterns(
+            self.config.get('google_maps_patterns', _COORD_PATTERNS)
+        )
+        self._coord_regex, self._coord_groups = _combine_coordinate_patterns(self._coord_patterns)
+        self._client_patterns = _compile_patterns(
+            self.config.get('client_patterns', _CLIENT_PATTERNS)
+        )
+        self._reference_patterns = _compile_patterns(
+            self.config.get('reference_patterns', _REFERENCE_PATTERNS)
+        )
+        
+        # Prefiltro de un solo recorrido sobre el mensaje (None sin Hyperscan)
+        self._prefilter_fields = ('coordinates', 'client_number', 'references', 'total_price')
+        self._prefilter_db = self._build_prefilter()
+        self._prefilter_lock = threading.Lock()
+        
+        # spaCy se carga al primer uso (ver propiedad nlp)
+        self._nlp = None
+        self._nlp_loaded = False
+        
+        # Vectorizador TF-IDF para similitud de productos: el hashing no requiere
+        # vocabulario, al recargar productos solo se reajustan los pesos IDF
+        self.tfidf = make_pipeline(
+            HashingVectorizer(
+                lowercase=True,
+                stop_words=None,  # Mantenemos stop words para productos
+                ngram_range=(1, 3),
+                n_features=2 ** 14,
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32  # Mitad de bytes por valor en el producto disperso
+            ),
+            TfidfTransformer()
+        )
+        
+        # Cache de productos y embeddings
+        self.products_cache = {}
+        self.product_embeddings = None
+        # Embeddings normalizados y transpuestos (F x P) para similitud coseno por SpMV
+        self._product_embeddings_norm = None
+        # Columnas hash usadas por algún producto: las demás se anulan en los mensajes
+        # (sin documentos tendrían el IDF máximo e inflarían la norma, como hacía el vocabulario)
+        self._catalog_mask = np.zeros(2 ** 14, dtype=np.float32)
+        # Autómata con nombres y textos de búsqueda para ubicarlos en un solo recorrido
+        self._product_locator = None
+        self.product_names = []
+        # Ids de producto en el mismo orden que embeddings y product_names
+        self._product_id_index = []
+        # Marca y número de peso por producto (arreglos paralelos al índice)
+        self._brand_arr = np.array([], dtype=str)
+        self._weight_num = np.array([], dtype=np.int32)
+        self._unique_brands = []
+        
+        # Resultados recientes por texto del mensaje (duplicados y reintentos)
+        self._parse_cached = functools.lru_cache(
+            maxsize=self.config.get('parse_cache_size', 2048)
+        )(self._parse_message)
+        
+        self.logger = logging.getLogger(__name__)
+        self._load_products()
+    
+    @property
+    def nlp(self):
+        """Modelo de spaCy cargado al primer acceso (None si no está disponible)"""
+        if not self._nlp_loaded:
+            self._nlp_loaded = True
+            try:
+                import spacy
+                self._nlp = spacy.load(self.config.get('spacy_model', 'es_core_news_sm'))
+            except (ImportError, OSError):
+                self._nlp = None
+                logging.warning("Modelo de spaCy no encontrado. Usando métodos alternativos.")
+        return self._nlp
+    
+    def _load_products(self):
+        """Cargar productos desde base de datos"""
+        try:
+            query = db.select(
+                Product.id, Product.name, Product.brand, Product.category,
+                Product.weight_size, Product.price
+            ).where(Product.is_active == True)
+            df = pd.read_sql(query, db.session.connection())
+            
+            # Crear texto searchable de todos los productos por columnas
+            df['price'] = df['price'].astype(float)
+            search_text = df['name'] + ' ' + df['brand'] + ' ' + df['category']
+            weight_size = df['weight_size'].fillna('')
+            df['search_text'] = search_text.where(
+                weight_size == '', search_text + ' ' + weight_size
+            ).str.lower()
+            df['name_lower'] = df['name'].str.lower()
+            df['brand_lower'] = df['brand'].str.lower()
+            
+            self.products_cache = df.set_index('id')[[
+                'name', 'brand', 'category', 'weight_size', 'price',
+                'search_text', 'name_lower', 'brand_lower'
+            ]].to_dict('index')
+            self.product_names = df['name_lower'].tolist()
+            product_texts = df['search_text'].tolist()
+            
+            self._product_id_index = df['id'].tolist()
+            self._brand_arr = df['brand_lower'].to_numpy(dtype=str)
+            # Primer número del peso/tamaño (-1 si no tiene)
+            self._weight_num = (
+                pd.to_numeric(weight_size.str.extract(_NUMBER_RE, expand=False), errors='coerce')
+                .fillna(-1).astype(np.int32).to_numpy()
+            )
+            self._unique_brands = list(dict.fromkeys(self._brand_arr.tolist()))
+            self._product_locator = self._build_product_locator()
+            
+            # Generar embeddings TF-IDF
+            if product_texts:
+                self.product_embeddings = self.tfidf.fit_transform(product_texts).astype(
+                    np.float32, copy=False
+                )
+                self._product_embeddings_norm = normalize(
+                    self.product_embeddings, norm='l2', copy=True
+                ).T.tocsr()
+                # 1.0 en las columnas hash usadas por algún producto
+                self._catalog_mask = np.zeros(self.product_embeddings.shape[1], dtype=np.float32)
+                self._catalog_mask[self.product_embeddings.indices] = 1.0
+            
+            self.logger.info(f"Productos cargados: {len(self.products_cache)}")
+            
+        except Exception as e:
+            self.logger.error(f"Error cargando productos: {e}")
+            self.products_cache = {}
+    
+    def _build_product_locator(self):
+        """Compilar nombres y textos de búsqueda en un autómata Aho-Corasick"""
+        if ahocorasick is None or not self.products_cache:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for info in self.products_cache.values():
+            for text in (info['name_lower'], info['search_text']):
+                automaton.add_word(text, text)
+        automaton.make_automaton()
+        return automaton
+    
+    def _locate_products(self, message: str) -> Dict[str, int]:
+        """Primera posición de cada texto de producto presente en el mensaje"""
+        positions = {}
+        for end_idx, text in self._product_locator.iter(message):
+            positions.setdefault(text, end_idx - len(text) + 1)
+        return positions
+    
+    def parse_whatsapp_message(self, message: str) -> Dict:
+        """Parsear mensaje de WhatsApp para extraer información de pedido"""
+        try:
+            # Copia para que el llamador no altere el resultado en caché
+            parsed_data = copy.deepcopy(self._parse_cached(message))
+            
+            self.logger.info(f"Mensaje parseado con confianza: {parsed_data['confidence']:.2f}")
+            return parsed_data
+            
+        except Exception as e:
+            self.logger.error(f"Error parseando mensaje: {e}")
+            return {'error': str(e), 'confidence': 0.0}
+    
+    def _parse_message(self, message: str) -> Dict:
+        """Limpiar y parsear un mensaje (sin caché)"""
+        clean_message = self._clean_message(message)
+        return self._parse_clean_message(message, clean_message)
+    
+    def parse_whatsapp_messages_batch(self, messages: List[str]) -> List[Dict]:
+        """Parsear una cola de mensajes calculando la similitud de todo el lote de una vez"""
+        clean_messages = [self._clean_message(message) for message in messages]
+        return self._parse_clean_batch(messages, clean_messages)
+    
+    def _parse_clean_batch(self, messages: List[str], clean_messages: List[str]) -> List[Dict]:
+        """Parsear mensajes ya limpios con una sola matriz de similitudes (N x P)"""
+        if not messages:
+            return []
+        
+        try:
+            similarities, name_scores = self._score_products(clean_messages)
+        except Exception as e:
+            self.logger.error(f"Error calculando similitudes del lote: {e}")
+            similarities = name_scores = None
+        
+        results = []
+        for i, (message, clean_message) in enumerate(zip(messages, clean_messages)):
+            try:
+                scores = (similarities[i], name_scores[i]) if similarities is not None else None
+                results.append(self._parse_clean_message(message, clean_message, scores))
+            except Exception as e:
+                self.logger.error(f"Error parseando mensaje del lote: {e}")
+                results.append({'raw_message': message, 'error': str(e), 'confidence': 0.0})
+        
+        self.logger.info(f"Lote de {len(results)} mensajes parseado")
+        return results
+    
+    def parse_many(self, messages: List[str]) -> pd.DataFrame:
+        """Parsear y validar un lote de mensajes (una fila por mensaje)"""
+        messages = list(messages)
+        clean_messages = [self._clean_message(message) for message in messages]
+        
+        rows = self._parse_clean_batch(messages, clean_messages)
+        for parsed_data in rows:
+            if 'error' in parsed_data:
+                parsed_data['valid'] = False
+                continue
+            try:
+                parsed_data['valid'] = self.validate_parsed_data(parsed_data)['is_valid']
+            except Exception as e:
+                self.logger.warning(f"Error validando mensaje del lote: {e}")
+                parsed_data['valid'] = False
+        
+        return pd.DataFrame(rows, columns=[
+            'coordinates', 'products', 'client_number', 'references',
+            'total_price', 'raw_message', 'confidence', 'valid', 'error'
+        ])
+    
+    def _build_prefilter(self):
+        """Compilar los patrones de campos en una sola base de Hyperscan"""
+        if hyperscan is None:
+            return None
+        
+        pattern_groups = (
+            self._coord_patterns, self._client_patterns,
+            self._reference_patterns, _PRICE_PATTERNS
+        )
+        expressions, ids = [], []
+        for field_id, patterns in enumerate(pattern_groups):
+            for pattern in patterns:
+                expressions.append(pattern.pattern.encode('utf-8'))
+                ids.append(field_id)
+        
+        try:
+            # PREFILTER acepta construcciones no soportadas aproximándolas por exceso
+            flags = (hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 |
+                     hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_PREFILTER)
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=expressions, ids=ids,
+                elements=len(expressions), flags=[flags] * len(expressions)
+            )
+            return database
+        except Exception as e:
+            logging.warning(f"No se pudo compilar el prefiltro de Hyperscan: {e}")
+            return None
+    
+    def _prefilter_message(self, clean_message: str) -> Optional[set]:
+        """Campos con algún patrón presente en el mensaje (None si no hay prefiltro)"""
+        if self._prefilter_db is None:
+            return None
+        
+        matched = set()
+        
+        def on_match(field_id, start, end, flags, context):
+            matched.add(self._prefilter_fields[field_id])
+        
+        # La base comparte su scratch: un escaneo a la vez
+        with self._prefilter_lock:
+            self._prefilter_db.scan(clean_message.encode('utf-8'), match_event_handler=on_match)
+        
+        return matched
+    
+    def _parse_clean_message(self, message: str, clean_message: str,
+                             scores: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> Dict:
+        """Extraer la información de pedido de un mensaje ya limpio"""
+        parsed_data = {
+            'coordinates': None,
+            'products': [],
+            'client_number': None,
+            'references': None,
+            'total_price': None,
+            'raw_message': message,
+            'confidence': 0.0
+        }
+        
+        # Un solo recorrido indica qué extractores pueden encontrar algo
+        present = self._prefilter_message(clean_message)
+        
+        def may_match(field: str) -> bool:
+            return present is None or field in present
+        
+        # Extraer coordenadas
+        coordinates = self._extract_coordinates(clean_message) if may_match('coordinates') else None
+        if coordinates:
+            parsed_data['coordinates'] = coordinates
+            parsed_data['confidence'] += 0.3
+        
+        # Extraer productos (números del mensaje indexados una sola vez)
+        products = self._extract_products(clean_message, scores, _index_numbers(clean_message))
+        if products:
+            parsed_data['products'] = products
+            parsed_data['confidence'] += 0.4
+        
+        # Extraer número de cliente
+        client_number = self._extract_client_number(clean_message) if may_match('client_number') else None
+        if client_number:
+            parsed_data['client_number'] = client_number
+            parsed_data['confidence'] += 0.1
+        
+        # Extraer referencias
+        references = self._extract_references(clean_message) if may_match('references') else None
+        if references:
+            parsed_data['references'] = references
+            parsed_data['confidence'] += 0.1
+        
+        # Extraer precio total
+        total_price = self._extract_total_price(clean_message) if may_match('total_price') else None
+        if total_price:
+            parsed_data['total_price'] = total_price
+            parsed_data['confidence'] += 0.1
+        
+        return parsed_data
+    
+    def _clean_message(self, message: str) -> str:
+        """Limpiar y normalizar mensaje"""
+        # Remover caracteres especiales innecesarios (tabla para Latin-1, regex para el resto)
+        clean = message.translate(_CLEAN_TABLE)
+        if clean and max(clean) > '\xff':
+            clean = _CLEAN_SPECIAL_RE.sub(' ', clean)
+        
+        # Convertir a minúsculas y normalizar espacios
+        return ' '.join(clean.lower().split())
+    
+    def _extract_coordinates(self, message: str) -> Optional[Tuple[float, float]]:
+        """Extraer coordenadas de Google Maps"""
+        # Links acortados (goo.gl) no traen coordenadas: habría que expandir
+        # la URL, por ahora se piden coordenadas directas
+        if self._coord_regex is not None:
+            # Un solo recorrido del mensaje con la alternancia combinada
+            candidates = (
+                (match.group(lat_group), match.group(lng_group))
+                for match in self._coord_regex.finditer(message)
+                for lat_group, lng_group in self._coord_groups
+                if match.group(lat_group) is not None
+            )
+        else:
+            candidates = (
+                (match.group(1), match.group(2))
+                for pattern in self._coord_patterns if pattern.groups >= 2
+                for match in (pattern.search(message),) if match
+            )
+        
+        for lat_text, lng_text in candidates:
+            try:
+                lat = float(lat_text)
+                lng = float(lng_text)
+                
+                # Validar que las coordenadas estén en Cancún/Riviera Maya
+                if (20.5 <= lat <= 21.5) and (-87.5 <= lng <= -86.5):
+                    return (lat, lng)
+                    
+            except (TypeError, ValueError):
+                continue
+        
+        return None
+    
+    def _extract_products(self, message: str,
+                          scores: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                          numbers: Optional[Tuple[List[int], List[int]]] = None) -> List[Dict]:
+        """Extraer productos del mensaje"""
+        products = []
+        
+        # Buscar productos por similitud (scores precalculados si viene de un lote)
+        similar_products = self._find_similar_products(message, *(scores or ()))
+        if numbers is None:
+            numbers = _index_numbers(message)
+        
+        # Posiciones de todos los productos en un solo recorrido del mensaje
+        locator = self._product_locator
+        positions = self._locate_products(message) if locator is not None and similar_products else {}
+        
+        for product_match in similar_products:
+            product_info = product_match['product']
+            
+            # Buscar cantidad cerca del producto (clave ya en minúsculas)
+            product_text = product_match['search_key']
+            product_pos = None
+            if locator is not None and locator.exists(product_text):
+                product_pos = positions.get(product_text, -1)
+            
+            quantity = self._extract_quantity_near_product(
+                message, product_text, numbers, product_pos
+            )
+            
+            products.append({
+                'product_id': product_match['product_id'],
+                'name': product_info['name'],
+                'brand': product_info['brand'],
+                'category': product_info['category'],
+                'weight_size': product_info['weight_size'],
+                'price': product_info['price'],
+                'quantity': quantity,
+                'confidence': product_match['confidence'],
+                'matched_text': product_match['matched_text']
+            })
+        
+        return products
+    
+    def _score_products(self, clean_messages: List[str]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Similitud TF-IDF (coseno) y fuzzy de N mensajes contra los P productos"""
+        if not self.products_cache or self.product_embeddings is None:
+            return None, None
+        
+        # Solo n-gramas presentes en el catálogo antes de normalizar
+        message_vectors = self.tfidf.transform(clean_messages).astype(np.float32, copy=False).tocsr()
+        message_vectors.data *= self._catalog_mask[message_vectors.indices]
+        message_vectors.eliminate_zeros()
+        message_vectors = normalize(message_vectors, norm='l2', copy=False)
+        similarities = (message_vectors @ self._product_embeddings_norm).toarray()
+        
+        # Todos los mensajes contra todos los nombres en una llamada (multihilo en lotes)
+        name_scores = process.cdist(
+            clean_messages, self.product_names,
+            scorer=fuzz.partial_ratio, score_cutoff=80,
+            workers=-1 if len(clean_messages) > 1 else 1
+        )
+        return similarities, name_scores
+    
+    def _find_similar_products(self, message: str,
+                               similarities: Optional[np.ndarray] = None,
+                               name_scores: Optional[np.ndarray] = None) -> List[Dict]:
+        """Encontrar productos similares en el mensaje"""
+        if not self.products_cache or self.product_embeddings is None:
+            return []
+        
+        if similarities is None or name_scores is None:
+            batch_similarities, batch_name_scores = self._score_products([message])
+            similarities, name_scores = batch_similarities[0], batch_name_scores[0]
+        
+        similar_products = []
+        
+        # Método 1: Búsqueda por similitud TF-IDF
+        for idx in np.flatnonzero(similarities > self.similarity_threshold):
+            product_id = self._product_id_index[idx]
+            similar_products.append({
+                'product_id': product_id,
+                'product': self.products_cache[product_id],
+                'confidence': float(similarities[idx]),
+                'matched_text': self.products_cache[product_id]['search_text'],
+                'search_key': self.products_cache[product_id]['search_text'],
+                'method': 'tfidf'
+            })
+        
+        # Método 2: Búsqueda fuzzy por nombre de producto
+        for idx in np.flatnonzero(name_scores > 80):  # 80% de similitud
+            product_id = self._product_id_index[idx]
+            product_info = self.products_cache[product_id]
+            similar_products.append({
+                'product_id': product_id,
+                'product': product_info,
+                'confidence': float(name_scores[idx]) / 100.0,
+                'matched_text': product_info['name'],
+                'search_key': product_info['name_lower'],
+                'method': 'fuzzy_name'
+            })
+        
+        # Método 3: marca + peso/tamaño. Pesos del mensaje en un solo recorrido
+        weights = [(m.start(), m.group(1), m.group(2)) for m in _WEIGHT_RE.finditer(message)]
+        
+        for brand in self._unique_brands:
+            brand_pos = message.find(brand)
+            if brand_pos == -1:
+                continue
+            
+            # Primer peso después de la marca
+            brand_end = brand_pos + len(brand)
+            weight = next((w for w in weights if w[0] >= brand_end), None)
+            if weight is None:
+                continue
+            
+            _, number, unit = weight
+            matches = np.flatnonzero((self._brand_arr == brand) & (self._weight_num == int(number)))
+            for idx in matches:
+                product_id = self._product_id_index[idx]
+                matched_text = f"{brand} {number}{unit}"
+                similar_products.append({
+                    'product_id': product_id,
+                    'product': self.products_cache[product_id],
+                    'confidence': 0.9,
+                    'matched_text': matched_text,
+                    'search_key': matched_text,
+                    'method': 'brand_weight'
+                })
+        
+        if not similar_products:
+            return []
+        
+        # Remover duplicados (el mejor por producto) y ordenar por confianza
+        winners = _rank_unique(
+            np.fromiter((p['product_id'] for p in similar_products),
+                        dtype=np.int64, count=len(similar_products)),
+            np.fromiter((p['confidence'] for p in similar_products),
+                        dtype=np.float64, count=len(similar_products))
+        )
+        
+        return [similar_products[i] for i in winners]
+    
+    def _extract_quantity_near_product(self, message: str, product_text: str,
+                                       numbers: Optional[Tuple[List[int], List[int]]] = None,
+                                       product_pos: Optional[int] = None) -> int:
+        """Extraer cantidad cerca del texto del producto (en minúsculas, como el mensaje limpio)"""
+        # Buscar números cerca del producto mencionado (posición ya ubicada si viene dada)
+        if product_pos is None:
+            product_pos = message.find(product_text)
+        if product_pos == -1:
+            # Buscar patrones generales de cantidad
+            for pattern in _QUANTITY_PATTERNS:
+                match = pattern.search(message)
+                if match:
+                    return int(match.group(1))
+            
+            return 1  # Cantidad por defecto
+        
+        # Buscar en un rango de 50 caracteres antes y después del producto
+        start = max(0, product_pos - 50)
+        end = min(len(message), product_pos + len(product_text) + 50)
+        
+        # Primer número dentro del rango, por búsqueda binaria en el índice de posiciones
+        starts, values = numbers if numbers is not None else _index_numbers(message)
+        idx = bisect_left(starts, start)
+        if idx < len(starts) and starts[idx] < end:
+            return min(values[idx], 1000)  # Límite máximo de 1000
+        
+        return 1
+    
+    def _extract_client_number(self, message: str) -> Optional[str]:
+        """Extraer número de cliente"""
+        for pattern in self._client_patterns:
+            match = pattern.search(message)
+            if match:
+                return match.group(1)
+        
+        return None
+    
+    def _extract_references(self, message: str) -> Optional[str]:
+        """Extraer referencias del mensaje"""
+        for pattern in self._reference_patterns:
+            match = pattern.search(message)
+            if match:
+                return match.group(1).strip()
+        
+        return None
+    
+    def _extract_total_price(self, message: str) -> Optional[float]:
+        """Extraer precio total del mensaje"""
+        for pattern in _PRICE_PATTERNS:
+            match = pattern.search(message)
+            if match:
+                try:
+                    return float(match.group(1))
+                except ValueError:
+                    continue
+        
+        return None
+    
+    def suggest_product_corrections(self, message: str, max_suggestions: int = 3) -> List[Dict]:
+        """Sugerir correcciones para productos no encontrados"""
+        suggestions = []
+        
+        if not self.products_cache:
+            return suggestions
+        
+        # Extraer posibles nombres de productos del mensaje
+        words = message.split()
+        
+        # Secuencias de hasta 3 palabras que podrían ser productos (mínimo 3 caracteres)
+        phrases = (
+            ' '.join(words[i:j])
+            for i in range(len(words))
+            for j in range(i + 1, min(i + 4, len(words) + 1))
+        )
+        potential_products = [phrase for phrase in phrases if len(phrase) > 3]
+        
+        if not potential_products:
+            return suggestions
+        
+        # Comparar todas las frases contra todos los productos en una sola llamada
+        scores = process.cdist(
+            potential_products, self.product_names,
+            scorer=fuzz.partial_ratio, score_cutoff=60, workers=-1
+        )
+        
+        # Mejor frase por producto; solo los que superan el umbral mínimo de similitud
+        best_phrases = scores.argmax(axis=0)
+        best_scores = scores[best_phrases, np.arange(scores.shape[1])]
+        
+        hits = np.flatnonzero(best_scores > 60)
+        if hits.size == 0:
+            return suggestions
+        
+        # Remover duplicados por nombre y ordenar por score
+        hit_names = np.array([
+            self.products_cache[self._product_id_index[name_idx]]['name'] for name_idx in hits
+        ])
+        ranked = hits[_rank_unique(hit_names, best_scores[hits])][:max_suggestions]
+        
+        for name_idx in ranked:
+            phrase_idx = best_phrases[name_idx]
+            product_id = self._product_id_index[name_idx]
+            product_info = self.products_cache[product_id]
+            suggestions.append({
+                'original_text': potential_products[phrase_idx],
+                'suggested_product': product_info['name'],
+                'product_id': product_id,
+                'similarity_score': float(scores[phrase_idx, name_idx]),
+                'brand': product_info['brand'],
+                'category': product_info['category']
+            })
+        
+        return suggestions
+    
+    def validate_parsed_data(self, parsed_data: Dict) -> Dict:
+        """Validar y completar datos parseados"""
+        validation_result = {
+            'is_valid': True,
+            'warnings': [],
+            'errors': [],
+            'suggested_corrections': []
+        }
+        
+        # Validar coordenadas
+        if not parsed_data.get('coordinates'):
+            validation_result['errors'].append('No se encontraron coordenadas válidas')
+            validation_result['is_valid'] = False
+        
+        # Validar productos
+        if not parsed_data.get('products'):
+            validation_result['errors'].append('No se encontraron productos válidos')
+            validation_result['is_valid'] = False
+            
+            # Sugerir correcciones
+            suggestions = self.suggest_product_corrections(parsed_data.get('raw_message', ''))
+            if suggestions:
+                validation_result['suggested_corrections'] = suggestions
+        else:
+            # Validar que los productos tengan cantidad
+            for product in parsed_data['products']:
+                if product['quantity'] <= 0:
+                    validation_result['warnings'].append(
+                        f"Cantidad no válida para {product['name']}: {product['quantity']}"
+                    )
+        
+        # Validar confianza general
+        if parsed_data.get('confidence', 0) < 0.5:
+            validation_result['warnings'].append('Confianza baja en el parsing del mensaje')
+        
+        return validation_result
+    
+    def refresh_products_cache(self):
+        """Refrescar cache de productos"""
+        self._load_products()
+        self._parse_cached.cache_clear()
         self.logger.info("Cache de productos actualizado")
\ No newline at end of file
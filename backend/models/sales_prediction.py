@@ -1,562 +1,944 @@
-# models/sales_prediction.py - Modelo de Predicción de Ventas
-import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.preprocessing import StandardScaler
-from statsmodels.tsa.arima.model import ARIMA
-from statsmodels.tsa.seasonal import seasonal_decompose
-import joblib
-import warnings
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
-import logging
-
-from database.connection import db
-from database.models import Sale, Product, Prediction
-
-warnings.filterwarnings('ignore')
-
-class SalesPredictor:
-    """Modelo de predicción de ventas usando ARIMA y Random Forest"""
-    
-    def __init__(self, config=None):
-        self.config = config or {}
-        self.arima_order = self.config.get('arima_order', (1, 1, 1))
-        self.seasonal_periods = self.config.get('seasonal_periods', 7)
-        self.forecast_days = self.config.get('forecast_days', 30)
-        self.confidence_interval = self.config.get('confidence_interval', 0.95)
-        
-        self.arima_model = None
-        self.rf_model = RandomForestRegressor(
-            n_estimators=100,
-            random_state=42,
-            max_depth=10
-        )
-        self.scaler = StandardScaler()
-        
-        self.is_trained = False
-        self.logger = logging.getLogger(__name__)
-    
-    def prepare_time_series_data(self, start_date: Optional[datetime] = None,
-                               end_date: Optional[datetime] = None) -> pd.DataFrame:
-        """Preparar datos de series temporales para ARIMA"""
-        try:
-            # Query para obtener ventas diarias
-            query = db.session.query(
-                Sale.sale_date,
-                db.func.count(Sale.id).label('daily_sales'),
-                db.func.sum(Sale.total_price).label('daily_revenue'),
-                db.func.sum(Sale.quantity).label('daily_quantity')
-            )
-            
-            if start_date:
-                query = query.filter(Sale.sale_date >= start_date)
-            if end_date:
-                query = query.filter(Sale.sale_date <= end_date)
-            
-            query = query.group_by(Sale.sale_date).order_by(Sale.sale_date)
-            
-            # Convertir a DataFrame
-            data = pd.read_sql(query.statement, db.session.bind)
-            
-            if data.empty:
-                raise ValueError("No hay datos de ventas disponibles")
-            
-            # Convertir fecha a datetime y establecer como índice
-            data['sale_date'] = pd.to_datetime(data['sale_date'])
-            data = data.set_index('sale_date')
-            
-            # Completar fechas faltantes con 0
-            date_range = pd.date_range(
-                start=data.index.min(),
-                end=data.index.max(),
-                freq='D'
-            )
-            data = data.reindex(date_range, fill_value=0)
-            
-            self.logger.info(f"Datos de series temporales preparados: {len(data)} días")
-            return data
-            
-        except Exception as e:
-            self.logger.error(f"Error preparando datos de series temporales: {e}")
-            raise
-    
-    def prepare_feature_data(self) -> pd.DataFrame:
-        """Preparar datos con características para Random Forest"""
-        try:
-            # Query con joins para obtener características
-            query = db.session.query(
-                Sale.sale_date,
-                Sale.quantity,
-                Sale.total_price,
-                Sale.cluster_id,
-                Product.category,
-                Product.brand,
-                Product.price
-            ).join(Product).filter(
-                Sale.sale_date >= datetime.now() - timedelta(days=365)
-            )
-            
-            data = pd.read_sql(query.statement, db.session.bind)
-            
-            if data.empty:
-                raise ValueError("No hay datos disponibles para características")
-            
-            # Convertir fecha a datetime
-            data['sale_date'] = pd.to_datetime(data['sale_date'])
-            
-            # Crear características temporales
-            data['day_of_week'] = data['sale_date'].dt.dayofweek
-            data['day_of_month'] = data['sale_date'].dt.day
-            data['month'] = data['sale_date'].dt.month
-            data['quarter'] = data['sale_date'].dt.quarter
-            data['is_weekend'] = data['day_of_week'].isin([5, 6]).astype(int)
-            
-            # Encoding categórico
-            data = pd.get_dummies(data, columns=['category', 'brand'], prefix=['cat', 'brand'])
-            
-            # Características de lag (ventas de días anteriores)
-            daily_sales = data.groupby('sale_date')['quantity'].sum().reset_index()
-            daily_sales['sales_lag_1'] = daily_sales['quantity'].shift(1)
-            daily_sales['sales_lag_7'] = daily_sales['quantity'].shift(7)
-            daily_sales['sales_rolling_7'] = daily_sales['quantity'].rolling(7).mean()
-            
-            # Merge con datos principales
-            data = data.merge(daily_sales[['sale_date', 'sales_lag_1', 'sales_lag_7', 'sales_rolling_7']], 
-                            on='sale_date', how='left')
-            
-            self.logger.info(f"Datos de características preparados: {len(data)} registros")
-            return data
-            
-        except Exception as e:
-            self.logger.error(f"Error preparando datos de características: {e}")
-            raise
-    
-    def train_arima_model(self, data: pd.DataFrame, target_column: str = 'daily_sales') -> Dict:
-        """Entrenar modelo ARIMA para predicción de series temporales"""
-        try:
-            series = data[target_column]
-            
-            # Verificar estacionariedad básica
-            if series.std() == 0:
-                raise ValueError("Serie temporal constante, no se puede entrenar ARIMA")
-            
-            # Entrenar modelo ARIMA
-            self.arima_model = ARIMA(series, order=self.arima_order)
-            fitted_model = self.arima_model.fit()
-            
-            # Hacer predicciones en datos de entrenamiento
-            fitted_values = fitted_model.fittedvalues
-            
-            # Calcular métricas
-            mae = mean_absolute_error(series[1:], fitted_values[1:])  # Excluir primer valor
-            mse = mean_squared_error(series[1:], fitted_values[1:])
-            rmse = np.sqrt(mse)
-            
-            # Generar predicciones futuras
-            forecast_result = fitted_model.forecast(steps=self.forecast_days)
-            forecast_conf_int = fitted_model.get_forecast(steps=self.forecast_days).conf_int()
-            
-            results = {
-                'model': fitted_model,
-                'mae': mae,
-                'mse': mse,
-                'rmse': rmse,
-                'aic': fitted_model.aic,
-                'bic': fitted_model.bic,
-                'forecast': forecast_result,
-                'confidence_intervals': forecast_conf_int,
-                'fitted_values': fitted_values
-            }
-            
-            self.logger.info(f"ARIMA entrenado - MAE: {mae:.2f}, RMSE: {rmse:.2f}, AIC: {fitted_model.aic:.2f}")
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error entrenando ARIMA: {e}")
-            raise
-    
-    def train_random_forest(self, data: pd.DataFrame) -> Dict:
-        """Entrenar modelo Random Forest para predicción basada en características"""
-        try:
-            # Preparar características y target
-            feature_columns = [col for col in data.columns if col not in 
-                             ['sale_date', 'quantity', 'total_price']]
-            
-            X = data[feature_columns].fillna(0)
-            y = data['quantity']
-            
-            # Dividir datos temporalmente (80% entrenamiento, 20% prueba)
-            split_idx = int(len(data) * 0.8)
-            X_train, X_test = X[:split_idx], X[split_idx:]
-            y_train, y_test = y[:split_idx], y[split_idx:]
-            
-            # Escalar características
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
-            
-            # Entrenar modelo
-            self.rf_model.fit(X_train_scaled, y_train)
-            
-            # Predicciones
-            y_pred_train = self.rf_model.predict(X_train_scaled)
-            y_pred_test = self.rf_model.predict(X_test_scaled)
-            
-            # Métricas
-            train_mae = mean_absolute_error(y_train, y_pred_train)
-            test_mae = mean_absolute_error(y_test, y_pred_test)
-            train_r2 = r2_score(y_train, y_pred_train)
-            test_r2 = r2_score(y_test, y_pred_test)
-            
-            # Importancia de características
-            feature_importance = dict(zip(feature_columns, self.rf_model.feature_importances_))
-            
-            results = {
-                'train_mae': train_mae,
-                'test_mae': test_mae,
-                'train_r2': train_r2,
-                'test_r2': test_r2,
-                'feature_importance': feature_importance,
-                'feature_columns': feature_columns
-            }
-            
-            self.logger.info(f"Random Forest entrenado - Test MAE: {test_mae:.2f}, Test R²: {test_r2:.3f}")
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error entrenando Random Forest: {e}")
-            raise
-    
-    def generate_daily_predictions(self, days_ahead: int = 7) -> List[Dict]:
-        """Generar predicciones diarias"""
-        try:
-            if not self.arima_model:
-                raise ValueError("Modelo ARIMA no entrenado")
-            
-            # Obtener datos recientes para ARIMA
-            time_series_data = self.prepare_time_series_data(
-                start_date=datetime.now() - timedelta(days=90)
-            )
-            
-            # Entrenar ARIMA con datos recientes
-            arima_results = self.train_arima_model(time_series_data)
-            
-            predictions = []
-            base_date = datetime.now().date()
-            
-            for i in range(days_ahead):
-                target_date = base_date + timedelta(days=i+1)
-                predicted_value = float(arima_results['forecast'][i])
-                
-                # Intervalos de confianza
-                conf_int = arima_results['confidence_intervals'].iloc[i]
-                conf_lower = float(conf_int.iloc[0])
-                conf_upper = float(conf_int.iloc[1])
-                
-                predictions.append({
-                    'date': target_date.isoformat(),
-                    'predicted_sales': max(0, round(predicted_value)),
-                    'confidence_lower': max(0, round(conf_lower)),
-                    'confidence_upper': round(conf_upper),
-                    'model': 'arima',
-                    'type': 'daily'
-                })
-            
-            return predictions
-            
-        except Exception as e:
-            self.logger.error(f"Error generando predicciones diarias: {e}")
-            return []
-    
-    def generate_weekly_predictions(self, weeks_ahead: int = 4) -> List[Dict]:
-        """Generar predicciones semanales"""
-        try:
-            daily_preds = self.generate_daily_predictions(days_ahead=weeks_ahead * 7)
-            
-            weekly_predictions = []
-            
-            for week in range(weeks_ahead):
-                start_idx = week * 7
-                end_idx = start_idx + 7
-                week_preds = daily_preds[start_idx:end_idx]
-                
-                if week_preds:
-                    weekly_sales = sum(pred['predicted_sales'] for pred in week_preds)
-                    weekly_conf_lower = sum(pred['confidence_lower'] for pred in week_preds)
-                    weekly_conf_upper = sum(pred['confidence_upper'] for pred in week_preds)
-                    
-                    week_start = datetime.now().date() + timedelta(days=start_idx + 1)
-                    
-                    weekly_predictions.append({
-                        'week_start': week_start.isoformat(),
-                        'predicted_sales': weekly_sales,
-                        'confidence_lower': weekly_conf_lower,
-                        'confidence_upper': weekly_conf_upper,
-                        'model': 'arima_aggregated',
-                        'type': 'weekly'
-                    })
-            
-            return weekly_predictions
-            
-        except Exception as e:
-            self.logger.error(f"Error generando predicciones semanales: {e}")
-            return []
-    
-    def generate_monthly_predictions(self, months_ahead: int = 3) -> List[Dict]:
-        """Generar predicciones mensuales"""
-        try:
-            monthly_predictions = []
-            
-            for month in range(months_ahead):
-                # Calcular días del mes
-                target_date = datetime.now().replace(day=1) + timedelta(days=32 * (month + 1))
-                target_date = target_date.replace(day=1)
-                
-                # Obtener días del mes
-                if target_date.month == 12:
-                    next_month = target_date.replace(year=target_date.year + 1, month=1)
-                else:
-                    next_month = target_date.replace(month=target_date.month + 1)
-                
-                days_in_month = (next_month - target_date).days
-                
-                # Predicción simple basada en promedio de días recientes
-                recent_data = self.prepare_time_series_data(
-                    start_date=datetime.now() - timedelta(days=30)
-                )
-                
-                avg_daily_sales = recent_data['daily_sales'].mean()
-                monthly_sales = avg_daily_sales * days_in_month
-                
-                # Agregar variabilidad estacional simple
-                seasonal_factor = 1.0
-                if target_date.month in [11, 12]:  # Nov-Dic mayor demanda
-                    seasonal_factor = 1.15
-                elif target_date.month in [1, 2]:  # Ene-Feb menor demanda
-                    seasonal_factor = 0.9
-                
-                monthly_sales *= seasonal_factor
-                
-                monthly_predictions.append({
-                    'month': target_date.strftime('%Y-%m'),
-                    'predicted_sales': round(monthly_sales),
-                    'confidence_lower': round(monthly_sales * 0.8),
-                    'confidence_upper': round(monthly_sales * 1.2),
-                    'model': 'seasonal_average',
-                    'type': 'monthly',
-                    'seasonal_factor': seasonal_factor
-                })
-            
-            return monthly_predictions
-            
-        except Exception as e:
-            self.logger.error(f"Error generando predicciones mensuales: {e}")
-            return []
-    
-    def generate_product_predictions(self, product_id: int, days_ahead: int = 7) -> List[Dict]:
-        """Generar predicciones específicas por producto"""
-        try:
-            # Obtener datos del producto
-            product_data = db.session.query(Sale).filter(
-                Sale.product_id == product_id,
-                Sale.sale_date >= datetime.now() - timedelta(days=90)
-            ).all()
-            
-            if not product_data:
-                return []
-            
-            # Convertir a DataFrame
-            df = pd.DataFrame([{
-                'date': sale.sale_date,
-                'quantity': sale.quantity,
-                'price': float(sale.total_price)
-            } for sale in product_data])
-            
-            # Agrupar por día
-            daily_product_sales = df.groupby('date').agg({
-                'quantity': 'sum',
-                'price': 'sum'
-            }).reset_index()
-            
-            if len(daily_product_sales) < 7:
-                # Datos insuficientes, usar promedio simple
-                avg_daily_quantity = df['quantity'].mean()
-                avg_daily_price = df['price'].mean()
-                
-                predictions = []
-                for i in range(days_ahead):
-                    target_date = datetime.now().date() + timedelta(days=i+1)
-                    predictions.append({
-                        'date': target_date.isoformat(),
-                        'product_id': product_id,
-                        'predicted_quantity': round(avg_daily_quantity),
-                        'predicted_revenue': round(avg_daily_price, 2),
-                        'model': 'simple_average',
-                        'confidence': 0.6
-                    })
-                
-                return predictions
-            
-            # Usar promedio móvil para productos con datos suficientes
-            window = min(7, len(daily_product_sales))
-            recent_avg_quantity = daily_product_sales['quantity'].tail(window).mean()
-            recent_avg_price = daily_product_sales['price'].tail(window).mean()
-            
-            predictions = []
-            for i in range(days_ahead):
-                target_date = datetime.now().date() + timedelta(days=i+1)
-                
-                # Aplicar factor de tendencia simple
-                trend_factor = 1.0
-                if len(daily_product_sales) >= 14:
-                    recent_avg = daily_product_sales['quantity'].tail(7).mean()
-                    older_avg = daily_product_sales['quantity'].tail(14).head(7).mean()
-                    if older_avg > 0:
-                        trend_factor = recent_avg / older_avg
-                
-                predicted_quantity = recent_avg_quantity * trend_factor
-                predicted_revenue = recent_avg_price * trend_factor
-                
-                predictions.append({
-                    'date': target_date.isoformat(),
-                    'product_id': product_id,
-                    'predicted_quantity': max(0, round(predicted_quantity)),
-                    'predicted_revenue': max(0, round(predicted_revenue, 2)),
-                    'model': 'moving_average_with_trend',
-                    'confidence': 0.75,
-                    'trend_factor': trend_factor
-                })
-            
-            return predictions
-            
-        except Exception as e:
-            self.logger.error(f"Error generando predicciones de producto {product_id}: {e}")
-            return []
-    
-    def save_predictions_to_db(self, predictions: List[Dict], prediction_type: str):
-        """Guardar predicciones en base de datos"""
-        try:
-            # Limpiar predicciones anteriores del mismo tipo
-            db.session.query(Prediction).filter(
-                Prediction.prediction_type == prediction_type,
-                Prediction.is_active == True
-            ).update({'is_active': False})
-            
-            # Guardar nuevas predicciones
-            for pred in predictions:
-                prediction = Prediction(
-                    prediction_type=prediction_type,
-                    target_date=datetime.fromisoformat(pred['date']) if 'date' in pred else None,
-                    product_id=pred.get('product_id'),
-                    predicted_value=pred.get('predicted_sales', pred.get('predicted_quantity', 0)),
-                    confidence_lower=pred.get('confidence_lower'),
-                    confidence_upper=pred.get('confidence_upper'),
-                    confidence_level=pred.get('confidence', 0.95),
-                    model_name=pred.get('model', 'unknown'),
-                    accuracy_score=pred.get('confidence', 0.7)
-                )
-                
-                db.session.add(prediction)
-            
-            db.session.commit()
-            self.logger.info(f"Predicciones guardadas: {len(predictions)} de tipo {prediction_type}")
-            
-        except Exception as e:
-            db.session.rollback()
-            self.logger.error(f"Error guardando predicciones: {e}")
-            raise
-    
-    def train_all_models(self) -> Dict:
-        """Entrenar todos los modelos de predicción"""
-        try:
-            self.logger.info("Iniciando entrenamiento de modelos de predicción")
-            
-            # Preparar datos
-            time_series_data = self.prepare_time_series_data()
-            feature_data = self.prepare_feature_data()
-            
-            # Entrenar modelos
-            arima_results = self.train_arima_model(time_series_data)
-            rf_results = self.train_random_forest(feature_data)
-            
-            self.is_trained = True
-            
-            # Generar y guardar predicciones
-            daily_preds = self.generate_daily_predictions()
-            weekly_preds = self.generate_weekly_predictions()
-            monthly_preds = self.generate_monthly_predictions()
-            
-            self.save_predictions_to_db(daily_preds, 'daily')
-            self.save_predictions_to_db(weekly_preds, 'weekly')
-            self.save_predictions_to_db(monthly_preds, 'monthly')
-            
-            results = {
-                'arima_results': {
-                    'mae': arima_results['mae'],
-                    'rmse': arima_results['rmse'],
-                    'aic': arima_results['aic']
-                },
-                'random_forest_results': {
-                    'test_mae': rf_results['test_mae'],
-                    'test_r2': rf_results['test_r2'],
-                    'top_features': sorted(rf_results['feature_importance'].items(), 
-                                         key=lambda x: x[1], reverse=True)[:5]
-                },
-                'predictions_generated': {
-                    'daily': len(daily_preds),
-                    'weekly': len(weekly_preds),
-                    'monthly': len(monthly_preds)
-                },
-                'training_date': datetime.now().isoformat(),
-                'data_points': len(time_series_data)
-            }
-            
-            self.logger.info("Entrenamiento completado exitosamente")
-            return results
-            
-        except Exception as e:
-            self.logger.error(f"Error en entrenamiento de modelos: {e}")
-            raise
-    
-    def save_model(self, model_path: str):
-        """Guardar modelos entrenados"""
-        try:
-            import os
-            os.makedirs(os.path.dirname(model_path), exist_ok=True)
-            
-            model_data = {
-                'arima_model': self.arima_model,
-                'rf_model': self.rf_model,
-                'scaler': self.scaler,
-                'config': self.config,
-                'is_trained': self.is_trained,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-            joblib.dump(model_data, model_path)
-            self.logger.info(f"Modelos de predicción guardados en: {model_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Error guardando modelos: {e}")
-            raise
-    
-    def load_model(self, model_path: str):
-        """Cargar modelos entrenados"""
-        try:
-            if not os.path.exists(model_path):
-                raise FileNotFoundError(f"No se encontró el archivo: {model_path}")
-            
-            model_data = joblib.load(model_path)
-            
-            self.arima_model = model_data.get('arima_model')
-            self.rf_model = model_data.get('rf_model')
-            self.scaler = model_data.get('scaler')
-            self.config = model_data.get('config', {})
-            self.is_trained = model_data.get('is_trained', False)
-            
-            self.logger.info(f"Modelos de predicción cargados desde: {model_path}")
-            
-        except Exception as e:
-            self.logger.error(f"Error cargando modelos: {e}")
+# models/sales_prediction.py - Modelo de Predicción de Ventas
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.preprocessing import OneHotEncoder
+from scipy import sparse
+from scipy.optimize import minimize
+from scipy.stats import norm
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.seasonal import seasonal_decompose
+import joblib
+import os
+import warnings
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from database.connection import db
+from database.models import Sale, Product, Prediction
+
+# Numba es opcional: sin él las recursiones CSS de ARIMA corren como Python normal
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# connectorx es opcional: sin él el historial de ventas se lee con pandas.read_sql
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+warnings.filterwarnings('ignore')
+
+# Órdenes p+q mayores a este límite se ajustan con statsmodels
+CSS_MAX_ORDER = 5
+
+# Motores de base de datos que se leen con connectorx (Arrow) cuando está instalado
+CONNECTORX_DIALECTS = ('postgresql', 'mysql')
+
+
+@lru_cache(maxsize=None)
+def _connectorx_uri(url) -> str:
+    """URI para connectorx: sin el sufijo '+driver' y con la contraseña real (str(url) la oculta)"""
+    return url.set(drivername=url.get_backend_name()).render_as_string(hide_password=False)
+
+
+# Características más importantes que se reportan tras entrenar el bosque
+TOP_FEATURES = 20
+
+# Factor estacional por mes (índice 1-12): Nov-Dic mayor demanda, Ene-Feb menor demanda
+MONTHLY_SEASONAL_FACTORS = np.ones(13)
+MONTHLY_SEASONAL_FACTORS[[11, 12]] = 1.15
+MONTHLY_SEASONAL_FACTORS[[1, 2]] = 0.9
+
+
+def _arima_css_residuals(w: np.ndarray, phi: np.ndarray, theta: np.ndarray) -> np.ndarray:
+    """Residuos de suma condicional de cuadrados (CSS) de un ARMA sobre la serie diferenciada"""
+    n = w.shape[0]
+    p = phi.shape[0]
+    q = theta.shape[0]
+    resid = np.zeros(n)
+    
+    for t in range(p, n):
+        value = w[t]
+        for i in range(p):
+            value -= phi[i] * w[t - i - 1]
+        for j in range(q):
+            if t - j - 1 >= 0:
+                value -= theta[j] * resid[t - j - 1]
+        resid[t] = value
+    
+    return resid
+
+
+def _arima_css_forecast(w: np.ndarray, resid: np.ndarray, phi: np.ndarray,
+                        theta: np.ndarray, steps: int) -> np.ndarray:
+    """Pronóstico de la serie diferenciada (innovaciones futuras = 0)"""
+    n = w.shape[0]
+    p = phi.shape[0]
+    q = theta.shape[0]
+    history = np.concatenate((w, np.zeros(steps)))
+    errors = np.concatenate((resid, np.zeros(steps)))
+    
+    for t in range(n, n + steps):
+        value = 0.0
+        for i in range(p):
+            if t - i - 1 >= 0:
+                value += phi[i] * history[t - i - 1]
+        for j in range(q):
+            if t - j - 1 >= 0:
+                value += theta[j] * errors[t - j - 1]
+        history[t] = value
+    
+    return history[n:]
+
+
+if njit is not None:
+    _arima_css_residuals = njit(cache=True, fastmath=True)(_arima_css_residuals)
+    _arima_css_forecast = njit(cache=True, fastmath=True)(_arima_css_forecast)
+
+
+def _arima_psi_weights(phi: np.ndarray, theta: np.ndarray, d: int, steps: int) -> np.ndarray:
+    """Pesos psi (MA infinito) del modelo integrado para la varianza del pronóstico"""
+    ar_poly = np.r_[1.0, -phi]
+    for _ in range(d):
+        ar_poly = np.convolve(ar_poly, [1.0, -1.0])
+    ar = -ar_poly[1:]
+    
+    psi = np.zeros(steps)
+    psi[0] = 1.0
+    for k in range(1, steps):
+        value = theta[k - 1] if k <= len(theta) else 0.0
+        for i in range(1, min(k, len(ar)) + 1):
+            value += ar[i - 1] * psi[k - i]
+        psi[k] = value
+    
+    return psi
+
+class SalesPredictor:
+    """Modelo de predicción de ventas usando ARIMA y Random Forest"""
+    
+    def __init__(self, config=None):
+        self.config = config or {}
+        self.arima_order = self.config.get('arima_order', (1, 1, 1))
+        self.seasonal_periods = self.config.get('seasonal_periods', 7)
+        self.forecast_days = self.config.get('forecast_days', 30)
+        self.confidence_interval = self.config.get('confidence_interval', 0.95)
+        
+        self.arima_model = None
+        self.rf_model = RandomForestRegressor(
+            n_estimators=100,
+            random_state=42,
+            max_depth=10,
+            n_jobs=self.config.get('n_jobs', -1)  # Árboles en paralelo (fit y predict)
+        )
+        # One-hot disperso de categoría y marca
+        self.ohe = OneHotEncoder(handle_unknown='ignore', sparse_output=True, dtype=np.float32)
+        
+        self.is_trained = False
+        self.logger = logging.getLogger(__name__)
+    
+    def load_sales_history(self) -> pd.DataFrame:
+        """Leer en una sola consulta todas las ventas con los datos de su producto"""
+        query = db.select(
+            Sale.sale_date,
+            Sale.quantity,
+            Sale.total_price,
+            Sale.cluster_id,
+            Product.category,
+            Product.brand,
+            Product.price
+        ).join(Product, Sale.product_id == Product.id)
+        
+        # Lectura grande de entrenamiento: con connectorx las filas llegan por Arrow
+        data = self._read_sql_arrow(query)
+        if data is None:
+            return pd.read_sql(query, db.session.connection(), parse_dates=['sale_date'])
+        
+        data['sale_date'] = pd.to_datetime(data['sale_date'])
+        return data
+    
+    def _read_sql_arrow(self, query) -> Optional[pd.DataFrame]:
+        """Leer una consulta sin parámetros con connectorx (sin filas Python intermedias); None si no aplica"""
+        engine = db.engine
+        if cx is None or engine.dialect.name not in CONNECTORX_DIALECTS:
+            return None
+        
+        # connectorx no acepta parámetros ligados ni ve la transacción de la sesión:
+        # solo para lecturas offline sin filtros sobre datos ya confirmados
+        compiled = query.compile(engine)
+        if compiled.params:
+            return None
+        
+        try:
+            return cx.read_sql(_connectorx_uri(engine.url), str(compiled), return_type='pandas')
+        except Exception as e:
+            self.logger.warning(f"Lectura con connectorx fallida, usando pandas: {e}")
+            return None
+    
+    def prepare_time_series_data(self, start_date: Optional[datetime] = None,
+                               end_date: Optional[datetime] = None,
+                               sales_data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Preparar datos de series temporales para ARIMA (sales_data: ventas ya leídas)"""
+        try:
+            if sales_data is None:
+                # Query para obtener ventas diarias (agregadas en la base de datos)
+                query = db.select(
+                    Sale.sale_date,
+                    db.func.count(Sale.id).label('daily_sales'),
+                    db.func.sum(Sale.total_price).label('daily_revenue'),
+                    db.func.sum(Sale.quantity).label('daily_quantity')
+                )
+                
+                if start_date:
+                    query = query.where(Sale.sale_date >= start_date)
+                if end_date:
+                    query = query.where(Sale.sale_date <= end_date)
+                
+                query = query.group_by(Sale.sale_date).order_by(Sale.sale_date)
+                
+                # Convertir a DataFrame con la fecha ya como índice datetime
+                data = pd.read_sql(
+                    query, db.session.connection(),
+                    parse_dates=['sale_date'], index_col='sale_date'
+                )
+            else:
+                # Misma agregación diaria sobre las ventas ya cargadas
+                rows = sales_data
+                if start_date:
+                    rows = rows[rows['sale_date'] >= start_date]
+                if end_date:
+                    rows = rows[rows['sale_date'] <= end_date]
+                
+                data = rows.groupby('sale_date', sort=True).agg(
+                    daily_sales=('quantity', 'size'),
+                    daily_revenue=('total_price', 'sum'),
+                    daily_quantity=('quantity', 'sum')
+                )
+            
+            if data.empty:
+                raise ValueError("No hay datos de ventas disponibles")
+            
+            # Completar fechas faltantes con 0
+            data = data.asfreq('D', fill_value=0)
+            
+            self.logger.info(f"Datos de series temporales preparados: {len(data)} días")
+            return data
+            
+        except Exception as e:
+            self.logger.error(f"Error preparando datos de series temporales: {e}")
+            raise
+    
+    def prepare_feature_data(self, sales_data: Optional[pd.DataFrame] = None,
+                             now: Optional[datetime] = None) -> pd.DataFrame:
+        """Preparar datos con características para Random Forest (sales_data: ventas ya leídas)"""
+        try:
+            now = now or datetime.now()
+            start_date = now - timedelta(days=365)
+            
+            if sales_data is None:
+                # Query con joins para obtener características
+                query = db.session.query(
+                    Sale.sale_date,
+                    Sale.quantity,
+                    Sale.total_price,
+                    Sale.cluster_id,
+                    Product.category,
+                    Product.brand,
+                    Product.price
+                ).join(Product).filter(
+                    Sale.sale_date >= start_date
+                )
+                
+                data = pd.read_sql(query.statement, db.session.connection())
+            else:
+                data = sales_data[sales_data['sale_date'] >= start_date].reset_index(drop=True)
+            
+            if data.empty:
+                raise ValueError("No hay datos disponibles para características")
+            
+            # Convertir fecha a datetime (un solo índice para todas las componentes)
+            dates = pd.DatetimeIndex(pd.to_datetime(data['sale_date']))
+            day_of_week = dates.dayofweek.to_numpy()
+            
+            # Crear características temporales en una sola asignación
+            data = data.assign(
+                sale_date=dates,
+                day_of_week=day_of_week,
+                day_of_month=dates.day.to_numpy(),
+                month=dates.month.to_numpy(),
+                quarter=dates.quarter.to_numpy(),
+                is_weekend=(day_of_week >= 5).astype(np.int8)
+            )
+            
+            # Características de lag (ventas de días anteriores)
+            daily_sales = data.groupby('sale_date', sort=True)['quantity'].sum()
+            quantities = daily_sales.to_numpy(dtype=np.float64)
+            
+            sales_lag_1 = np.full_like(quantities, np.nan)
+            sales_lag_1[1:] = quantities[:-1]
+            sales_lag_7 = np.full_like(quantities, np.nan)
+            sales_lag_7[7:] = quantities[:-7]
+            
+            # Media móvil de 7 días como diferencia de sumas acumuladas
+            cumulative = np.concatenate(([0.0], np.cumsum(quantities)))
+            sales_rolling_7 = np.full_like(quantities, np.nan)
+            sales_rolling_7[6:] = (cumulative[7:] - cumulative[:-7]) / 7.0
+            
+            lag_features = pd.DataFrame({
+                'sales_lag_1': sales_lag_1,
+                'sales_lag_7': sales_lag_7,
+                'sales_rolling_7': sales_rolling_7
+            }, index=daily_sales.index)
+            
+            # Unir con datos principales por fecha
+            data = data.join(lag_features, on='sale_date')
+            
+            # Reducir tipos numéricos: el bosque trabaja en float32
+            for column in data.select_dtypes('float64').columns:
+                data[column] = data[column].astype(np.float32)
+            for column in data.select_dtypes('int64').columns:
+                data[column] = pd.to_numeric(data[column], downcast='integer')
+            
+            self.logger.info(f"Datos de características preparados: {len(data)} registros")
+            return data
+            
+        except Exception as e:
+            self.logger.error(f"Error preparando datos de características: {e}")
+            raise
+    
+    def train_arima_model(self, data: pd.DataFrame, target_column: str = 'daily_sales') -> Dict:
+        """Entrenar modelo ARIMA para predicción de series temporales"""
+        try:
+            series = data[target_column]
+            if len(series) < 2:
+                raise ValueError("Serie temporal demasiado corta, no se puede entrenar ARIMA")
+            
+            # Serie corta o casi constante: pronóstico por la media sin ajustar ARIMA
+            coefficient_of_variation = series.std() / max(abs(series.mean()), 1e-9)
+            too_short = len(series) < max(2 * self.seasonal_periods, 14)
+            
+            p, d, q = self.arima_order
+            if too_short or coefficient_of_variation < 1e-3:
+                (fitted_model, fitted_values, forecast_result,
+                 forecast_conf_int, aic, bic) = self._fit_mean_forecast(series)
+                self.arima_model = fitted_model
+            elif p + q > CSS_MAX_ORDER:
+                # Entrenar modelo ARIMA (órdenes altos: máxima verosimilitud de statsmodels)
+                self.arima_model = ARIMA(series, order=self.arima_order)
+                # Sin matriz de covarianza de los parámetros (no se usan errores estándar)
+                fitted_model = self.arima_model.fit(cov_type='none')
+                
+                # Hacer predicciones en datos de entrenamiento
+                fitted_values = fitted_model.fittedvalues
+                
+                # Generar predicciones futuras (un solo pronóstico para media e intervalo)
+                forecast = fitted_model.get_forecast(steps=self.forecast_days)
+                forecast_result = forecast.predicted_mean
+                forecast_conf_int = forecast.conf_int(alpha=1 - self.confidence_interval)
+                aic, bic = fitted_model.aic, fitted_model.bic
+            else:
+                (fitted_model, fitted_values, forecast_result,
+                 forecast_conf_int, aic, bic) = self._fit_arima_css(series, p, d, q)
+                self.arima_model = fitted_model
+            
+            # Calcular métricas
+            mae = mean_absolute_error(series[1:], fitted_values[1:])  # Excluir primer valor
+            mse = mean_squared_error(series[1:], fitted_values[1:])
+            rmse = np.sqrt(mse)
+            
+            results = {
+                'model': fitted_model,
+                'mae': mae,
+                'mse': mse,
+                'rmse': rmse,
+                'aic': aic,
+                'bic': bic,
+                'forecast': forecast_result,
+                'confidence_intervals': forecast_conf_int,
+                'fitted_values': fitted_values
+            }
+            
+            self.logger.info(f"ARIMA entrenado - MAE: {mae:.2f}, RMSE: {rmse:.2f}, AIC: {aic:.2f}")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error entrenando ARIMA: {e}")
+            raise
+    
+    def _fit_mean_forecast(self, series: pd.Series) -> Tuple:
+        """Pronóstico constante por la media (mismo formato de salida que _fit_arima_css)"""
+        y = series.to_numpy(dtype=np.float64)
+        mean = float(y.mean())
+        std = float(y.std(ddof=1))
+        
+        steps = self.forecast_days
+        if isinstance(series.index, pd.DatetimeIndex):
+            index = pd.date_range(series.index[-1] + pd.Timedelta(days=1), periods=steps, freq='D')
+        else:
+            index = pd.RangeIndex(len(y), len(y) + steps)
+        
+        z = norm.ppf(0.5 + self.confidence_interval / 2)
+        forecast_result = pd.Series(np.full(steps, mean), index=index, name='predicted_mean')
+        forecast_conf_int = pd.DataFrame({
+            f'lower {series.name}': np.full(steps, mean - z * std),
+            f'upper {series.name}': np.full(steps, mean + z * std)
+        }, index=index)
+        
+        fitted_values = pd.Series(np.full(len(y), mean), index=series.index)
+        fitted_model = {
+            'order': (0, 0, 0),
+            'mean': mean,
+            'sigma2': std ** 2,
+            'method': 'mean'
+        }
+        
+        return fitted_model, fitted_values, forecast_result, forecast_conf_int, np.nan, np.nan
+    
+    def _fit_arima_css(self, series: pd.Series, p: int, d: int, q: int) -> Tuple:
+        """Ajustar ARIMA por suma condicional de cuadrados (Nelder-Mead sobre el kernel CSS)"""
+        y = series.to_numpy(dtype=np.float64)
+        w = np.diff(y, n=d)
+        mean = float(w.mean()) if d == 0 else 0.0
+        w = w - mean
+        
+        n_eff = len(w) - p
+        if n_eff <= p + q:
+            raise ValueError("Serie temporal demasiado corta para ARIMA")
+        
+        def css(params):
+            # Fuera de la región estacionaria/invertible (aproximada por |coef| < 1)
+            if np.any(np.abs(params) >= 1):
+                return np.inf
+            resid = _arima_css_residuals(w, params[:p], params[p:])
+            return float(resid[p:] @ resid[p:])
+        
+        params = np.zeros(0)
+        if p + q:
+            params = minimize(css, np.full(p + q, 0.1), method='Nelder-Mead').x
+        phi, theta = params[:p].copy(), params[p:].copy()
+        
+        resid = _arima_css_residuals(w, phi, theta)
+        ssr = float(resid[p:] @ resid[p:])
+        sigma2 = ssr / n_eff
+        
+        # Valores ajustados: predicción a un paso = observado - innovación
+        errors = np.zeros(len(y))
+        errors[d:] = resid
+        fitted_values = pd.Series(y - errors, index=series.index)
+        
+        # Pronóstico en la escala diferenciada e integración de vuelta a niveles
+        steps = self.forecast_days
+        forecast = _arima_css_forecast(w, resid, phi, theta, steps) + mean
+        for k in range(d, 0, -1):
+            forecast = np.diff(y, n=k - 1)[-1] + np.cumsum(forecast)
+        
+        # Intervalos de confianza a partir de los pesos psi del modelo integrado
+        std = np.sqrt(sigma2 * np.cumsum(_arima_psi_weights(phi, theta, d, steps) ** 2))
+        z = norm.ppf(0.5 + self.confidence_interval / 2)
+        
+        if isinstance(series.index, pd.DatetimeIndex):
+            index = pd.date_range(series.index[-1] + pd.Timedelta(days=1), periods=steps, freq='D')
+        else:
+            index = pd.RangeIndex(len(y), len(y) + steps)
+        
+        forecast_result = pd.Series(forecast, index=index, name='predicted_mean')
+        forecast_conf_int = pd.DataFrame({
+            f'lower {series.name}': forecast - z * std,
+            f'upper {series.name}': forecast + z * std
+        }, index=index)
+        
+        # AIC/BIC aproximados sobre la suma de cuadrados
+        n_params = p + q + (1 if d == 0 else 0)
+        log_likelihood_term = n_eff * np.log(sigma2) if sigma2 > 0 else -np.inf
+        aic = float(log_likelihood_term + 2 * n_params)
+        bic = float(log_likelihood_term + n_params * np.log(n_eff))
+        
+        fitted_model = {
+            'order': (p, d, q),
+            'ar': phi,
+            'ma': theta,
+            'mean': mean,
+            'sigma2': sigma2,
+            'method': 'css'
+        }
+        
+        return fitted_model, fitted_values, forecast_result, forecast_conf_int, aic, bic
+    
+    def train_random_forest(self, data: pd.DataFrame) -> Dict:
+        """Entrenar modelo Random Forest para predicción basada en características"""
+        try:
+            # Preparar características y target
+            categorical_columns = ['category', 'brand']
+            numeric_columns = [col for col in data.columns if col not in 
+                               ['sale_date', 'quantity', 'total_price', *categorical_columns]]
+            
+            # Numéricas densas + one-hot disperso de categoría/marca en una sola matriz CSR
+            X_numeric = sparse.csr_matrix(data[numeric_columns].fillna(0).to_numpy(dtype=np.float32))
+            X_categorical = self.ohe.fit_transform(
+                data[categorical_columns].fillna('').astype(str).to_numpy()
+            )
+            X = sparse.hstack([X_numeric, X_categorical], format='csr')
+            feature_columns = numeric_columns + list(self.ohe.get_feature_names_out(['cat', 'brand']))
+            y = data['quantity']
+            
+            # Dividir datos temporalmente (80% entrenamiento, 20% prueba)
+            split_idx = int(len(data) * 0.8)
+            X_train, X_test = X[:split_idx], X[split_idx:]
+            y_train, y_test = y[:split_idx], y[split_idx:]
+            
+            # Entrenar modelo (sin escalar: los cortes de los árboles no dependen de la escala)
+            self.rf_model.fit(X_train, y_train)
+            
+            # Predicciones
+            y_pred_train = self.rf_model.predict(X_train)
+            y_pred_test = self.rf_model.predict(X_test)
+            
+            # Métricas
+            train_mae = mean_absolute_error(y_train, y_pred_train)
+            test_mae = mean_absolute_error(y_test, y_pred_test)
+            train_r2 = r2_score(y_train, y_pred_train)
+            test_r2 = r2_score(y_test, y_pred_test)
+            
+            # Importancia de características: solo las TOP_FEATURES mayores, en orden descendente
+            importances = self.rf_model.feature_importances_
+            k = min(TOP_FEATURES, len(importances))
+            top_idx = np.argpartition(-importances, k - 1)[:k] if k < len(importances) else np.arange(k)
+            top_idx = top_idx[np.argsort(-importances[top_idx], kind='stable')]
+            feature_importance = {feature_columns[i]: float(importances[i]) for i in top_idx}
+            
+            results = {
+                'train_mae': train_mae,
+                'test_mae': test_mae,
+                'train_r2': train_r2,
+                'test_r2': test_r2,
+                'feature_importance': feature_importance,
+                'feature_columns': feature_columns
+            }
+            
+            self.logger.info(f"Random Forest entrenado - Test MAE: {test_mae:.2f}, Test R²: {test_r2:.3f}")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error entrenando Random Forest: {e}")
+            raise
+    
+    def generate_daily_predictions(self, days_ahead: int = 7,
+                                   arima_results: Optional[Dict] = None,
+                                   now: Optional[datetime] = None) -> List[Dict]:
+        """Generar predicciones diarias (arima_results: ajuste reciente ya calculado)"""
+        try:
+            now = now or datetime.now()
+            
+            if not self.arima_model:
+                raise ValueError("Modelo ARIMA no entrenado")
+            
+            if arima_results is None:
+                # Obtener datos recientes para ARIMA
+                time_series_data = self.prepare_time_series_data(
+                    start_date=now - timedelta(days=90)
+                )
+                
+                # Entrenar ARIMA con datos recientes
+                arima_results = self.train_arima_model(time_series_data)
+            
+            forecast = np.asarray(arima_results['forecast'], dtype=np.float64)[:days_ahead]
+            conf_int = np.asarray(arima_results['confidence_intervals'], dtype=np.float64)[:days_ahead]
+            if len(forecast) < days_ahead:
+                raise ValueError(f"El pronóstico ARIMA solo cubre {len(forecast)} días")
+            
+            # Redondeo (mitad al par, como round) y recorte en bloque
+            predicted = np.clip(np.rint(forecast), 0, None).astype(np.int64)
+            lower = np.clip(np.rint(conf_int[:, 0]), 0, None).astype(np.int64)
+            upper = np.rint(conf_int[:, 1]).astype(np.int64)
+            
+            base_date = now.date()
+            return [
+                {
+                    'date': (base_date + timedelta(days=i + 1)).isoformat(),
+                    'predicted_sales': int(predicted[i]),
+                    'confidence_lower': int(lower[i]),
+                    'confidence_upper': int(upper[i]),
+                    'model': 'arima',
+                    'type': 'daily'
+                }
+                for i in range(days_ahead)
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error generando predicciones diarias: {e}")
+            return []
+    
+    def generate_weekly_predictions(self, weeks_ahead: int = 4,
+                                    daily_preds: Optional[List[Dict]] = None,
+                                    now: Optional[datetime] = None) -> List[Dict]:
+        """Generar predicciones semanales (daily_preds: horizonte diario ya generado)"""
+        try:
+            now = now or datetime.now()
+            if daily_preds is None:
+                daily_preds = self.generate_daily_predictions(days_ahead=weeks_ahead * 7, now=now)
+            
+            # Matriz (días, 3) con ventas y límites; la última semana incompleta se rellena con ceros
+            n_days = min(len(daily_preds), weeks_ahead * 7)
+            n_weeks = -(-n_days // 7)
+            values = np.zeros((n_weeks * 7, 3), dtype=np.int64)
+            if n_days:
+                values[:n_days] = [
+                    (pred['predicted_sales'], pred['confidence_lower'], pred['confidence_upper'])
+                    for pred in daily_preds[:n_days]
+                ]
+            weekly_totals = values.reshape(n_weeks, 7, 3).sum(axis=1)
+            
+            today = now.date()
+            return [
+                {
+                    'week_start': (today + timedelta(days=week * 7 + 1)).isoformat(),
+                    'predicted_sales': int(weekly_totals[week, 0]),
+                    'confidence_lower': int(weekly_totals[week, 1]),
+                    'confidence_upper': int(weekly_totals[week, 2]),
+                    'model': 'arima_aggregated',
+                    'type': 'weekly'
+                }
+                for week in range(n_weeks)
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Error generando predicciones semanales: {e}")
+            return []
+    
+    def generate_monthly_predictions(self, months_ahead: int = 3,
+                                     time_series_data: Optional[pd.DataFrame] = None,
+                                     now: Optional[datetime] = None) -> List[Dict]:
+        """Generar predicciones mensuales (time_series_data: serie diaria reciente ya cargada)"""
+        try:
+            now = now or datetime.now()
+            monthly_predictions = []
+            
+            # Promedio de días recientes (una sola lectura para todos los meses)
+            start_date = now - timedelta(days=30)
+            if time_series_data is None:
+                recent_data = self.prepare_time_series_data(start_date=start_date)
+            else:
+                recent_data = self._recent_window(time_series_data, start_date)
+            avg_daily_sales = recent_data['daily_sales'].mean()
+            
+            # Inicios de mes a partir del mes siguiente
+            months = pd.date_range(
+                pd.Timestamp(now).to_period('M').to_timestamp() + pd.offsets.MonthBegin(1),
+                periods=months_ahead, freq='MS'
+            )
+            
+            for target_date in months:
+                # Predicción simple basada en promedio de días recientes
+                monthly_sales = avg_daily_sales * target_date.days_in_month
+                
+                # Agregar variabilidad estacional simple
+                seasonal_factor = float(MONTHLY_SEASONAL_FACTORS[target_date.month])
+                monthly_sales *= seasonal_factor
+                
+                monthly_predictions.append({
+                    'month': target_date.strftime('%Y-%m'),
+                    'predicted_sales': round(monthly_sales),
+                    'confidence_lower': round(monthly_sales * 0.8),
+                    'confidence_upper': round(monthly_sales * 1.2),
+                    'model': 'seasonal_average',
+                    'type': 'monthly',
+                    'seasonal_factor': seasonal_factor
+                })
+            
+            return monthly_predictions
+            
+        except Exception as e:
+            self.logger.error(f"Error generando predicciones mensuales: {e}")
+            return []
+    
+    def _recent_window(self, data: pd.DataFrame, start_date: datetime) -> pd.DataFrame:
+        """Recortar una serie diaria ya cargada como si se consultara desde start_date"""
+        recent = data[data.index >= start_date]
+        
+        # La consulta empieza en el primer día con ventas, no en start_date
+        days_with_sales = recent.index[recent['daily_sales'] > 0]
+        if days_with_sales.empty:
+            raise ValueError("No hay datos de ventas disponibles")
+        
+        return recent.loc[days_with_sales[0]:]
+    
+    def generate_product_predictions(self, product_id: int, days_ahead: int = 7,
+                                     now: Optional[datetime] = None) -> List[Dict]:
+        """Generar predicciones específicas por producto"""
+        try:
+            now = now or datetime.now()
+            
+            # Obtener ventas del producto ya agregadas por día
+            query = db.select(
+                Sale.sale_date.label('date'),
+                db.func.sum(Sale.quantity).label('quantity'),
+                db.func.sum(Sale.total_price).label('price'),
+                db.func.count(Sale.id).label('sales')
+            ).where(
+                Sale.product_id == product_id,
+                Sale.sale_date >= now - timedelta(days=90)
+            ).group_by(Sale.sale_date).order_by(Sale.sale_date)
+            
+            daily_product_sales = pd.read_sql(query, db.session.connection(), parse_dates=['date'])
+            if daily_product_sales.empty:
+                return []
+            
+            # Promedios por venta a partir de las sumas diarias
+            total_sales = daily_product_sales['sales'].sum()
+            return self._product_predictions_from_daily(
+                product_id, daily_product_sales,
+                daily_product_sales['quantity'].sum() / total_sales,
+                daily_product_sales['price'].sum() / total_sales,
+                days_ahead, now
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error generando predicciones de producto {product_id}: {e}")
+            return []
+    
+    def generate_product_predictions_from_df(self, product_id: int, df: pd.DataFrame,
+                                             days_ahead: int = 7,
+                                             now: Optional[datetime] = None) -> List[Dict]:
+        """Generar predicciones de producto a partir de sus ventas ya cargadas (date, quantity, price)"""
+        try:
+            if df.empty:
+                return []
+            
+            # Agrupar por día
+            daily_product_sales = df.groupby('date').agg({
+                'quantity': 'sum',
+                'price': 'sum'
+            }).reset_index()
+            
+            return self._product_predictions_from_daily(
+                product_id, daily_product_sales,
+                df['quantity'].mean(), df['price'].mean(), days_ahead, now
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error generando predicciones de producto {product_id}: {e}")
+            return []
+    
+    def _product_predictions_from_daily(self, product_id: int, daily_product_sales: pd.DataFrame,
+                                        avg_daily_quantity: float, avg_daily_price: float,
+                                        days_ahead: int, now: Optional[datetime] = None) -> List[Dict]:
+        """Predicciones de producto desde sus ventas diarias ordenadas (promedios por venta como respaldo)"""
+        try:
+            base_date = (now or datetime.now()).date()
+            
+            if len(daily_product_sales) < 7:
+                # Datos insuficientes, usar promedio simple
+                predictions = []
+                for i in range(days_ahead):
+                    target_date = base_date + timedelta(days=i+1)
+                    predictions.append({
+                        'date': target_date.isoformat(),
+                        'product_id': product_id,
+                        'predicted_quantity': round(avg_daily_quantity),
+                        'predicted_revenue': round(avg_daily_price, 2),
+                        'model': 'simple_average',
+                        'confidence': 0.6
+                    })
+                
+                return predictions
+            
+            # Usar promedio móvil para productos con datos suficientes
+            quantities = daily_product_sales['quantity'].to_numpy(dtype=np.float64)
+            prices = daily_product_sales['price'].to_numpy(dtype=np.float64)
+            recent_avg_quantity = quantities[-7:].mean()
+            recent_avg_price = prices[-7:].mean()
+            
+            # Aplicar factor de tendencia simple (última semana vs la anterior)
+            trend_factor = 1.0
+            if len(quantities) >= 14:
+                older_avg = quantities[-14:-7].mean()
+                if older_avg > 0:
+                    trend_factor = recent_avg_quantity / older_avg
+            
+            predictions = []
+            for i in range(days_ahead):
+                target_date = base_date + timedelta(days=i+1)
+                
+                predicted_quantity = recent_avg_quantity * trend_factor
+                predicted_revenue = recent_avg_price * trend_factor
+                
+                predictions.append({
+                    'date': target_date.isoformat(),
+                    'product_id': product_id,
+                    'predicted_quantity': max(0, round(predicted_quantity)),
+                    'predicted_revenue': max(0, round(predicted_revenue, 2)),
+                    'model': 'moving_average_with_trend',
+                    'confidence': 0.75,
+                    'trend_factor': trend_factor
+                })
+            
+            return predictions
+            
+        except Exception as e:
+            self.logger.error(f"Error generando predicciones de producto {product_id}: {e}")
+            return []
+    
+    def save_predictions_to_db(self, predictions: List[Dict], prediction_type: str,
+                               bulk: bool = True):
+        """Guardar predicciones en base de datos (bulk=False instancia objetos del ORM)"""
+        try:
+            # Limpiar predicciones anteriores del mismo tipo (índice por tipo + activo)
+            deactivate = db.update(Prediction).where(
+                Prediction.prediction_type == prediction_type,
+                Prediction.is_active == True
+            ).values(is_active=False).execution_options(synchronize_session=False)
+            db.session.execute(deactivate)
+            
+            # Guardar nuevas predicciones
+            mappings = [
+                {
+                    'prediction_type': prediction_type,
+                    'target_date': datetime.fromisoformat(pred['date']) if 'date' in pred else None,
+                    'product_id': pred.get('product_id'),
+                    'predicted_value': pred.get('predicted_sales', pred.get('predicted_quantity', 0)),
+                    'confidence_lower': pred.get('confidence_lower'),
+                    'confidence_upper': pred.get('confidence_upper'),
+                    'confidence_level': pred.get('confidence', 0.95),
+                    'model_name': pred.get('model', 'unknown'),
+                    'accuracy_score': pred.get('confidence', 0.7)
+                }
+                for pred in predictions
+            ]
+            
+            if bulk:
+                # Un único INSERT multi-fila
+                db.session.bulk_insert_mappings(Prediction, mappings)
+            else:
+                db.session.add_all([Prediction(**mapping) for mapping in mappings])
+            
+            db.session.commit()
+            self.logger.info(f"Predicciones guardadas: {len(predictions)} de tipo {prediction_type}")
+            
+        except Exception as e:
+            db.session.rollback()
+            self.logger.error(f"Error guardando predicciones: {e}")
+            raise
+    
+    def train_all_models(self) -> Dict:
+        """Entrenar todos los modelos de predicción"""
+        try:
+            self.logger.info("Iniciando entrenamiento de modelos de predicción")
+            
+            # Un único instante de referencia para cortes de fechas y horizontes
+            now = datetime.now()
+            
+            # Preparar datos (una sola lectura de ventas para la serie y las características)
+            sales_data = self.load_sales_history()
+            time_series_data = self.prepare_time_series_data(sales_data=sales_data)
+            feature_data = self.prepare_feature_data(sales_data=sales_data, now=now)
+            
+            # Entrenar modelos en paralelo: son independientes (ARIMA solo toca
+            # arima_model; el bosque rf_model y ohe) y no usan la sesión de BD
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                arima_future = executor.submit(self.train_arima_model, time_series_data)
+                rf_future = executor.submit(self.train_random_forest, feature_data)
+                arima_results = arima_future.result()
+                rf_results = rf_future.result()
+            
+            self.is_trained = True
+            
+            # Serie reciente y su ARIMA una sola vez para todos los horizontes
+            try:
+                recent_data = self._recent_window(
+                    time_series_data, now - timedelta(days=90)
+                )
+                recent_arima = self.train_arima_model(recent_data)
+            except Exception as e:
+                self.logger.error(f"Error preparando ARIMA reciente: {e}")
+                recent_data = recent_arima = None
+            
+            # Generar y guardar predicciones
+            if recent_arima is not None:
+                # Horizonte diario de 4 semanas: las primeras 7 son las diarias
+                horizon_preds = self.generate_daily_predictions(
+                    days_ahead=28, arima_results=recent_arima, now=now
+                )
+                daily_preds = horizon_preds[:7]
+                weekly_preds = self.generate_weekly_predictions(daily_preds=horizon_preds, now=now)
+            else:
+                daily_preds, weekly_preds = [], []
+            monthly_preds = self.generate_monthly_predictions(time_series_data=recent_data, now=now)
+            
+            self.save_predictions_to_db(daily_preds, 'daily')
+            self.save_predictions_to_db(weekly_preds, 'weekly')
+            self.save_predictions_to_db(monthly_preds, 'monthly')
+            
+            results = {
+                'arima_results': {
+                    'mae': arima_results['mae'],
+                    'rmse': arima_results['rmse'],
+                    'aic': arima_results['aic']
+                },
+                'random_forest_results': {
+                    'test_mae': rf_results['test_mae'],
+                    'test_r2': rf_results['test_r2'],
+                    'top_features': list(rf_results['feature_importance'].items())[:5]
+                },
+                'predictions_generated': {
+                    'daily': len(daily_preds),
+                    'weekly': len(weekly_preds),
+                    'monthly': len(monthly_preds)
+                },
+                'training_date': now.isoformat(),
+                'data_points': len(time_series_data)
+            }
+            
+            self.logger.info("Entrenamiento completado exitosamente")
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Error en entrenamiento de modelos: {e}")
+            raise
+    
+    def save_model(self, model_path: str, compress=('lz4', 3)):
+        """Guardar modelos entrenados"""
+        try:
+            os.makedirs(os.path.dirname(model_path), exist_ok=True)
+            
+            model_data = {
+                'arima_model': self.arima_model,
+                'rf_model': self.rf_model,
+                'ohe': self.ohe,
+                'config': self.config,
+                'is_trained': self.is_trained,
+                'timestamp': datetime.now().isoformat()
+            }
+            
+            # lz4 comprime rápido; protocol=5 serializa los arreglos NumPy sin copias extra
+            joblib.dump(model_data, model_path, compress=compress, protocol=5)
+            self.logger.info(f"Modelos de predicción guardados en: {model_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error guardando modelos: {e}")
+            raise
+    
+    def load_model(self, model_path: str):
+        """Cargar modelos entrenados"""
+        try:
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"No se encontró el archivo: {model_path}")
+            
+            model_data = joblib.load(model_path)
+            
+            self.arima_model = model_data.get('arima_model')
+            self.rf_model = model_data.get('rf_model')
+            self.ohe = model_data.get('ohe', self.ohe)
+            self.config = model_data.get('config', {})
+            self.is_trained = model_data.get('is_trained', False)
+            
+            self.logger.info(f"Modelos de predicción cargados desde: {model_path}")
+            
+        except Exception as e:
+            self.logger.error(f"Error cargando modelos: {e}")
             raise
\ No newline at end of file
@@ -0,0 +1,23 @@
+# tests/conftest.py - Fixtures compartidas de las pruebas
+import os
+import sys
+
+import pytest
+
+# Agregar el directorio backend al path (mismos imports que app.py)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app import create_app
+from config import TestingConfig
+from database.connection import db
+
+
+@pytest.fixture
+def app():
+    """Aplicación con SQLite en memoria y tablas recién creadas"""
+    app, _ = create_app(TestingConfig)
+    yield app
+    
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
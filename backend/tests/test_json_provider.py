@@ -0,0 +1,52 @@
+# tests/test_json_provider.py - Serialización JSON de las respuestas de la API
+import pytest
+
+from database.connection import db
+from database.models import Product
+from utils import json_provider
+
+orjson = pytest.importorskip('orjson')
+
+
+def test_jsonify_serializes_dtos_with_orjson(app, monkeypatch):
+    """jsonify (separadores compactos) debe pasar por orjson y aplanar los ProductDTO"""
+    calls = []
+    orjson_dumps = orjson.dumps
+    
+    def spy_dumps(obj, **kwargs):
+        calls.append(obj)
+        return orjson_dumps(obj, **kwargs)
+    
+    monkeypatch.setattr(json_provider.orjson, 'dumps', spy_dumps)
+    
+    with app.app_context():
+        db.session.add(Product(name='Pedigree Adulto 4kg', brand='Pedigree', category='Alimento',
+                               weight_size='4kg', price=15990, current_stock=10))
+        db.session.commit()
+    
+    response = app.test_client().get('/api/products/')
+    
+    assert response.status_code == 200
+    assert any('data' in obj for obj in calls if isinstance(obj, dict))
+    
+    product = response.get_json()['data'][0]
+    assert product['name'] == 'Pedigree Adulto 4kg'
+    assert product['price'] == 15990.0
+    assert product['current_stock'] == 10
+
+
+def test_debug_indent_uses_orjson(app, monkeypatch):
+    """indent=2 (modo debug) se traduce a OPT_INDENT_2 en lugar de caer a json"""
+    calls = []
+    orjson_dumps = orjson.dumps
+    
+    def spy_dumps(obj, **kwargs):
+        calls.append(kwargs['option'])
+        return orjson_dumps(obj, **kwargs)
+    
+    monkeypatch.setattr(json_provider.orjson, 'dumps', spy_dumps)
+    
+    body = app.json.dumps({'a': [1, 2]}, indent=2)
+    
+    assert calls and calls[0] & orjson.OPT_INDENT_2
+    assert body == '{\n  "a": [\n    1,\n    2\n  ]\n}'
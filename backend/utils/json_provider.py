@@ -0,0 +1,46 @@
+# utils/json_provider.py - Serialización JSON de las respuestas de la API
+import dataclasses
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+# orjson es opcional: si no está instalado se usa json de la biblioteca estándar
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class AppJSONProvider(DefaultJSONProvider):
+    """Proveedor JSON de la aplicación: orjson si está disponible y DTOs sin copia profunda"""
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Como el de Flask, pero los dataclasses (DTOs) se aplanan un nivel sin dataclasses.asdict"""
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            # En los DTOs con slots, __slots__ ya lista los campos en orden
+            names = getattr(o, '__slots__', None) or [field.name for field in dataclasses.fields(o)]
+            return {name: getattr(o, name) for name in names}
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serializar con orjson (dataclasses nativos); argumentos que orjson no cubre usan json"""
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+
+        # Fechas pasan por default para conservar el formato de Flask
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        # response() (jsonify) siempre pasa separadores compactos, o indent=2 en modo debug
+        orjson_kwargs = dict(kwargs)
+        if orjson_kwargs.get('separators') == (',', ':'):
+            del orjson_kwargs['separators']
+        if orjson_kwargs.get('indent') == 2:
+            del orjson_kwargs['indent']
+            option |= orjson.OPT_INDENT_2
+        if orjson_kwargs:
+            return super().dumps(obj, **kwargs)
+
+        return orjson.dumps(obj, default=self.default, option=option).decode()